@@ -0,0 +1,358 @@
+"""Synthetic dictation corpus for parser benchmarking.
+
+Production documents contain PHI and cannot be shared, so this module
+generates look-alike dictations using the label conventions DocumentParser
+targets (``FIRST NAME:``, ``D/Accident:``, ``PROVIDER FRIST:``, ``Job:``,
+``Case:``, ...) in the formats WebScribe delivers:
+
+- ``docx``: Word 2007+ documents, labels in bold runs
+- ``doc``: legacy Word 97-style files. The text is stored as 8-bit runs with
+  carriage-return paragraph marks between a compound-file signature and
+  sector padding. This is not a valid OLE2 file, so it exercises the same
+  fallback chain as real binary .doc files (docx2txt and antiword fail,
+  then the plain-text read succeeds).
+- ``rtf``: RTF saved with a .doc extension
+- ``html``: Word "Save as Web Page" HTML with a .doc extension
+
+Besides complete dictations the corpus contains documents whose labels are
+present but left blank and "No dictation" placeholders. Every document's
+expected parser output is written to a ``ground_truth.jsonl`` sidecar.
+
+Usage:
+    python benchmarks/corpus.py --out /tmp/corpus --count 500
+    python benchmarks/corpus.py --out /tmp/corpus --formats docx:4,doc:2,rtf:1,html:1 --noise 0.3
+"""
+
+import argparse
+import html
+import io
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+
+FORMATS = ("docx", "doc", "rtf", "html")
+EXTENSIONS = {"docx": ".docx", "doc": ".doc", "rtf": ".doc", "html": ".doc"}
+VARIANTS = ("complete", "blank_fields", "no_dictation")
+
+# Fields in MedicalRecord order (source_file excluded)
+FIELDS = (
+    "first_name", "last_name", "date_of_birth", "record_number", "case_number",
+    "accident_date", "provider_first", "provider_last", "exam_date", "exam_place",
+    "transcriptionist", "dd_date", "transcription_date", "job_number", "case_code",
+)
+
+FIRST_NAMES = ["JOHN", "MARIA", "DAVID", "LINDA", "JAMES", "SUSAN", "ROBERT", "KAREN",
+               "ANA MARIA", "JEAN-PIERRE", "MICHAEL", "PATRICIA", "WEI", "FATIMA"]
+LAST_NAMES = ["SMITH", "GARCIA", "JOHNSON", "LEE", "BROWN", "MARTINEZ", "DAVIS", "O'NEIL",
+              "LOPEZ-REYES", "WILSON", "NGUYEN", "VAN DER BERG", "PATEL", "KOWALSKI"]
+PLACES = ["Brooklyn Office", "Queens Medical Center", "Bronx Clinic", "Main Street Office",
+          "St. Mary's Hospital", "Long Island Diagnostic"]
+CASE_PREFIXES = ["AA", "WC", "NF", "AWC", "PI"]
+HEADERS = ["CHIROPRACTIC MEDICAL EXAM", "INTERNAL USE ONLY", "ORTHOPEDIC RE-EVALUATION",
+           "RADIOLOGY REPORT", "DICTATED BUT NOT READ"]
+FILLER_WORDS = (
+    "patient reports persistent pain in the lumbar and cervical spine with reduced range of motion "
+    "examination reveals tenderness to palpation bilateral paraspinal spasm reflexes are symmetric "
+    "strength is five out of five history of motor vehicle accident treatment includes physical "
+    "therapy and chiropractic care follow up in four weeks prognosis guarded impairment moderate"
+).split()
+
+# Accepted label spellings; the first is the canonical WebScribe template label
+LABELS = {
+    "first_name": ["FIRST NAME:", "FIRST NAME :"],
+    "last_name": ["LAST NAME:", "LAST NAME :"],
+    "date_of_birth": ["Date of Birth:", "DATE OF BIRTH:", "DOB:"],
+    "record_number": ["Record Number:", "RECORD NUMBER:", "MRN:"],
+    "case_number": ["Case Number:", "CASE NUMBER:"],
+    "accident_date": ["D/Accident:", "D/Injury:", "Date of Accident:"],
+    "provider_first": ["PROVIDER FRIST:", "PROVIDER FIRST:"],
+    "provider_last": ["PROVIDER LAST:", "PROVIDER LAST :"],
+    "exam_date": ["Date of Exam:", "DATE OF EXAM:", "Exam Date:"],
+    "exam_place": ["Place of Exam:", "PLACE OF EXAM:"],
+    "transcription_date": ["Transcription Date:", "TRANSCRIPTION DATE:"],
+    "job_number": ["Job:", "JOB:"],
+    "case_code": ["Case:", "CASE:"],
+}
+
+NO_DICTATION_TEXTS = ["No dictation.", "There is no dictation for this job.", "Dictation cancelled.",
+                      "NOTE: This is a blank file."]
+
+
+def _date(rng: random.Random, first_year: int, last_year: int) -> Dict[str, str]:
+    """Draw a date, returning how it is written and how the parser reports it."""
+    month, day, year = rng.randint(1, 12), rng.randint(1, 28), rng.randint(first_year, last_year)
+    return {"written": f"{month}/{day}/{year}", "expected": f"{month:02d}/{day:02d}/{year}"}
+
+
+def make_record(rng: random.Random, index: int) -> Dict[str, Dict[str, str]]:
+    """Draw the field values of one dictation.
+
+    Returns:
+        Dict: Field name -> {'written': text in the document, 'expected': parser output}
+    """
+    def same(value: str) -> Dict[str, str]:
+        return {"written": value, "expected": value}
+
+    exam = _date(rng, 2024, 2025)
+    prefix = rng.choice(CASE_PREFIXES)
+    digits = f"{rng.randint(0, 999999):06d}"
+    initials = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(4))
+
+    return {
+        "first_name": same(rng.choice(FIRST_NAMES)),
+        "last_name": same(rng.choice(LAST_NAMES)),
+        "date_of_birth": _date(rng, 1940, 2005),
+        "record_number": same(f"1.{rng.randint(100000, 999999)}.{index % 10}"),
+        "case_number": same(str(rng.randint(10000, 999999))),
+        "accident_date": _date(rng, 2022, 2024),
+        "provider_first": same(rng.choice(FIRST_NAMES)),
+        "provider_last": same(rng.choice(LAST_NAMES)),
+        "exam_date": exam,
+        "exam_place": same(rng.choice(PLACES)),
+        "transcriptionist": same(f"{initials[:2]}/{initials[2:]}"),
+        "dd_date": exam,
+        "transcription_date": _date(rng, 2025, 2025),
+        "job_number": same(f"{rng.randint(1000, 1099)}-{rng.randint(0, 999):03d}"),
+        "case_code": {"written": f"{prefix}{digits}", "expected": f"{prefix}{digits}"},
+    }
+
+
+def _filler(rng: random.Random, size: int) -> List[str]:
+    """Dictation body paragraphs totalling about `size` characters."""
+    paragraphs, total = [], 0
+    while total < size:
+        paragraph = " ".join(rng.choice(FILLER_WORDS) for _ in range(rng.randint(30, 90))).capitalize() + "."
+        paragraphs.append(paragraph)
+        total += len(paragraph)
+    return paragraphs
+
+
+def compose_lines(rng: random.Random, record: Dict[str, Dict[str, str]], variant: str,
+                  noise: float, body_size: int) -> List[Sequence[str]]:
+    """Lay out a dictation as (label, value) lines; body lines have an empty label.
+
+    Args:
+        rng: Random generator
+        record: Field values from make_record
+        variant: 'complete', 'blank_fields' or 'no_dictation'
+        noise: Probability (0-1) of each perturbation: alternative label
+            spellings, lower-case spaced case codes, extra header lines
+        body_size: Approximate characters of dictation body text
+
+    Returns:
+        List: (label, value) pairs in document order
+    """
+    def label(field: str) -> str:
+        options = LABELS[field]
+        return rng.choice(options[1:]) if rng.random() < noise else options[0]
+
+    def value(field: str) -> str:
+        return "" if variant == "blank_fields" else record[field]["written"]
+
+    lines: List[Sequence[str]] = []
+    if rng.random() < noise:
+        lines.append(("", rng.choice(HEADERS)))
+
+    if variant == "no_dictation":
+        lines.append(("", rng.choice(NO_DICTATION_TEXTS)))
+        return lines
+
+    for field in ("first_name", "last_name", "date_of_birth", "record_number", "case_number",
+                  "accident_date", "provider_first", "provider_last", "exam_date", "exam_place"):
+        lines.append((label(field), value(field)))
+
+    lines.extend(("", paragraph) for paragraph in _filler(rng, body_size))
+
+    dd_written = record["dd_date"]["written"]
+    lines.append(("", "" if variant == "blank_fields" else f"{record['transcriptionist']['written']} DD: {dd_written}"))
+    lines.append((label("transcription_date"), value("transcription_date")))
+    lines.append((label("job_number"), value("job_number")))
+
+    case_code = value("case_code")
+    if case_code and rng.random() < noise:
+        # Hand-typed codes: lower case with a space before the digits
+        case_code = f"{case_code[:-6].lower()} {case_code[-6:]}"
+    lines.append((label("case_code"), case_code))
+    return lines
+
+
+def expected_fields(record: Dict[str, Dict[str, str]], variant: str) -> Dict[str, str]:
+    """Fields a correct parser reports for a document."""
+    if variant == "complete":
+        return {field: record[field]["expected"] for field in FIELDS}
+
+    expected = {field: "" for field in FIELDS}
+    # The job number is taken from the filename when the text has none
+    expected["job_number"] = record["job_number"]["expected"]
+    return expected
+
+
+def render_docx(lines: List[Sequence[str]]) -> bytes:
+    import docx
+
+    document = docx.Document()
+    for label, value in lines:
+        paragraph = document.add_paragraph()
+        if label:
+            paragraph.add_run(label).bold = True
+            paragraph.add_run(f" {value}" if value else "")
+        else:
+            paragraph.add_run(value)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def render_legacy_doc(lines: List[Sequence[str]]) -> bytes:
+    text = "\r".join(f"{label} {value}".strip() for label, value in lines) + "\r"
+    header = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\x00" * 16 + b"\x3e\x00\x03\x00\xfe\xff\x09\x00"
+    header = header.ljust(512, b"\xff")
+    body = text.encode("cp1252", errors="replace")
+    padding = b"\x00" * (-len(body) % 512)
+    return header + body + padding + b"\xff" * 512
+
+
+def _rtf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("{", "\\{").replace("}", "\\}")
+
+
+def render_rtf(lines: List[Sequence[str]]) -> bytes:
+    parts = ["{\\rtf1\\ansi\\ansicpg1252\\deff0{\\fonttbl{\\f0\\froman Times New Roman;}}",
+             "\\viewkind4\\uc1\\pard\\f0\\fs24 "]
+    for label, value in lines:
+        if label:
+            parts.append(f"{{\\b {_rtf_escape(label)}}} {_rtf_escape(value)}\\par\n")
+        else:
+            parts.append(f"{_rtf_escape(value)}\\par\n")
+    parts.append("}")
+    return "".join(parts).encode("cp1252", errors="replace")
+
+
+def render_html(lines: List[Sequence[str]]) -> bytes:
+    parts = [
+        "<html xmlns:o=\"urn:schemas-microsoft-com:office:office\">",
+        "<head><meta http-equiv=Content-Type content=\"text/html; charset=utf-8\">",
+        "<meta name=Generator content=\"Microsoft Word 15\">",
+        "<style>p.MsoNormal {margin:0in; font-size:12.0pt; font-family:\"Times New Roman\";}</style>",
+        "</head><body lang=EN-US><div class=WordSection1>",
+    ]
+    for label, value in lines:
+        escaped = html.escape(value, quote=False)
+        if label:
+            parts.append(f"<p class=MsoNormal><b>{html.escape(label, quote=False)}</b> {escaped}<o:p></o:p></p>")
+        else:
+            parts.append(f"<p class=MsoNormal>{escaped}<o:p>&nbsp;</o:p></p>")
+    parts.append("</div></body></html>")
+    return "\n".join(parts).encode("utf-8")
+
+
+RENDERERS = {"docx": render_docx, "doc": render_legacy_doc, "rtf": render_rtf, "html": render_html}
+
+
+def parse_weights(spec: str, choices: Sequence[str]) -> Dict[str, float]:
+    """Parse 'docx:4,doc:1' (or 'docx,doc' for equal weights) into weights."""
+    weights = {}
+    for item in spec.split(","):
+        name, _, weight = item.strip().partition(":")
+        if name not in choices:
+            raise argparse.ArgumentTypeError(f"Unknown choice {name!r}; expected one of {', '.join(choices)}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+def generate_corpus(out_dir: Path, count: int, formats: Optional[Dict[str, float]] = None,
+                    noise: float = 0.2, body_size: int = 4096, blank_ratio: float = 0.05,
+                    no_dictation_ratio: float = 0.05, seed: int = 1234,
+                    subdirs: Optional[Sequence[str]] = None) -> List[Dict]:
+    """Write a synthetic corpus and its ground-truth sidecar.
+
+    Args:
+        out_dir: Output directory
+        count: Number of documents
+        formats: Format -> relative weight (default: docx only)
+        noise: Probability of each layout perturbation (see compose_lines)
+        body_size: Approximate characters of body text per dictation
+        blank_ratio: Share of documents with labels but no values
+        no_dictation_ratio: Share of "No dictation" placeholder documents
+        seed: Random seed; the same arguments always produce the same corpus
+        subdirs: Optional subdirectories (e.g. type folders) filled round-robin
+
+    Returns:
+        List: One ground-truth entry per document, as written to ground_truth.jsonl
+    """
+    rng = random.Random(seed)
+    formats = formats or {"docx": 1.0}
+    format_names, format_weights = list(formats), list(formats.values())
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    entries = []
+    for index in range(count):
+        fmt = rng.choices(format_names, format_weights)[0]
+        roll = rng.random()
+        if roll < no_dictation_ratio:
+            variant = "no_dictation"
+        elif roll < no_dictation_ratio + blank_ratio:
+            variant = "blank_fields"
+        else:
+            variant = "complete"
+
+        record = make_record(rng, index)
+        # WebScribe names: "<letter> <job> <sequence>~<record number>~<case code>"
+        filename = (f"{rng.choice('NUTR')} {record['job_number']['written']} {index:04d}"
+                    f"~{record['record_number']['written']}~{record['case_code']['written']}{EXTENSIONS[fmt]}")
+        relative = Path(subdirs[index % len(subdirs)]) / filename if subdirs else Path(filename)
+
+        lines = compose_lines(rng, record, variant, noise, body_size)
+        path = out_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(RENDERERS[fmt](lines))
+
+        entries.append({
+            "file": relative.as_posix(),
+            "format": fmt,
+            "variant": variant,
+            "fields": expected_fields(record, variant),
+        })
+
+    with open(out_dir / "ground_truth.jsonl", "w", encoding="utf-8") as sidecar:
+        for entry in entries:
+            sidecar.write(json.dumps(entry) + "\n")
+    return entries
+
+
+def load_ground_truth(corpus_dir: Path) -> List[Dict]:
+    """Read the ground-truth sidecar of a generated corpus."""
+    with open(Path(corpus_dir) / "ground_truth.jsonl", encoding="utf-8") as sidecar:
+        return [json.loads(line) for line in sidecar if line.strip()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic dictation corpus with ground truth")
+    parser.add_argument("--out", type=Path, required=True, help="Output directory")
+    parser.add_argument("--count", type=int, default=200, help="Number of documents (default: 200)")
+    parser.add_argument("--formats", default="docx:4,doc:2,rtf:1,html:1",
+                        help=f"Format weights from {', '.join(FORMATS)} (default: docx:4,doc:2,rtf:1,html:1)")
+    parser.add_argument("--noise", type=float, default=0.2, help="Layout perturbation probability (default: 0.2)")
+    parser.add_argument("--body-kib", type=float, default=4, help="Body text per dictation in KiB (default: 4)")
+    parser.add_argument("--blank-ratio", type=float, default=0.05, help="Share of blank-field documents")
+    parser.add_argument("--no-dictation-ratio", type=float, default=0.05, help="Share of 'No dictation' documents")
+    parser.add_argument("--seed", type=int, default=1234, help="Random seed")
+    args = parser.parse_args()
+
+    entries = generate_corpus(args.out, args.count, parse_weights(args.formats, FORMATS), args.noise,
+                              int(args.body_kib * 1024), args.blank_ratio, args.no_dictation_ratio, args.seed)
+
+    by_format: Dict[str, int] = {}
+    for entry in entries:
+        by_format[entry["format"]] = by_format.get(entry["format"], 0) + 1
+    print(f"Wrote {len(entries)} documents to {args.out} "
+          f"({', '.join(f'{fmt}: {n}' for fmt, n in sorted(by_format.items()))}) and ground_truth.jsonl")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""Startup import-time budget for the WebScribe entry point.
+
+Runs ``python -X importtime -c "import main"`` from src/ several times,
+takes the median cumulative import time of ``main`` and fails if it is over
+budget or if any dependency that should load lazily was imported at startup.
+
+Usage:
+    python benchmarks/import_budget.py
+    python benchmarks/import_budget.py --budget-ms 200 --runs 9 --top 15
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Modules that must only be imported on first use, never by `import main`
+LAZY_MODULES = (
+    "paramiko",
+    "docx",
+    "docx2txt",
+    "croniter",
+    "pytz",
+    "smtplib",
+    "http.server",
+)
+
+DEFAULT_BUDGET_MS = 250.0
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)$")
+
+
+def measure_once() -> Tuple[int, Dict[str, int]]:
+    """Import main in a fresh interpreter with -X importtime.
+
+    Returns:
+        Tuple: (cumulative microseconds for main, module -> self microseconds)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=str(SRC_DIR),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total_us = 0
+    self_times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, _, module = match.groups()
+        self_times[module] = self_times.get(module, 0) + int(self_us)
+        if module == "main":
+            total_us = int(cumulative_us)
+    return total_us, self_times
+
+
+def find_eager_imports() -> List[str]:
+    """List the lazy modules that `import main` loads anyway."""
+    probe = (
+        "import sys, main; "
+        f"print('\\n'.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=str(SRC_DIR),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [line for line in result.stdout.splitlines() if line]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check the startup import-time budget of src/main.py")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Maximum median import time of main in ms (default: {DEFAULT_BUDGET_MS:.0f})")
+    parser.add_argument("--runs", type=int, default=5, help="Interpreter runs to take the median of (default: 5)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list by self time (default: 10)")
+    args = parser.parse_args()
+
+    # Warm-up run so .pyc compilation is not counted
+    measure_once()
+
+    totals = []
+    self_times: Dict[str, List[int]] = {}
+    for _ in range(args.runs):
+        total_us, run_self_times = measure_once()
+        totals.append(total_us)
+        for module, self_us in run_self_times.items():
+            self_times.setdefault(module, []).append(self_us)
+
+    median_ms = statistics.median(totals) / 1000
+    print(f"import main: median {median_ms:.1f} ms over {args.runs} runs "
+          f"(min {min(totals) / 1000:.1f} ms, max {max(totals) / 1000:.1f} ms), budget {args.budget_ms:.0f} ms")
+
+    slowest = sorted(self_times.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    print(f"\nSlowest {args.top} modules by self time:")
+    for module, samples in slowest[:args.top]:
+        print(f"  {statistics.median(samples) / 1000:8.2f} ms  {module}")
+
+    failed = False
+    eager = find_eager_imports()
+    if eager:
+        print(f"\nFAIL: imported at startup but should load lazily: {', '.join(eager)}")
+        failed = True
+    if median_ms > args.budget_ms:
+        print(f"\nFAIL: startup import time {median_ms:.1f} ms exceeds budget of {args.budget_ms:.0f} ms")
+        failed = True
+
+    if not failed:
+        print("\nOK: within budget, no eager heavy imports")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Per-thread metric cells must not grow with short-lived threads.
+
+Counters and histograms keep one accumulator cell per updating thread. The
+application starts a new thread for every scheduled run and a new pool for
+every batch of post-processing actions, and the metrics endpoint is off by
+default, so nothing may rely on a scrape to reclaim the cells of threads
+that have exited. This check updates a counter, a labelled counter and a
+histogram from many short-lived threads, never scrapes, and fails if the
+number of cells held by any of them is not bounded by the threads alive at
+once, or if a total is wrong once the metrics are finally read.
+
+Usage:
+    python benchmarks/metrics_cells.py
+    python benchmarks/metrics_cells.py --threads 5000 --pool-size 4
+"""
+
+import argparse
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+sys.path.insert(0, str(SRC_DIR))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check that per-thread metric cells are reclaimed without a scrape")
+    parser.add_argument("--threads", type=int, default=1000,
+                        help="Short-lived threads, like one per scheduled run (default: 1000)")
+    parser.add_argument("--batches", type=int, default=200,
+                        help="Thread pools created and shut down, like one per action batch (default: 200)")
+    parser.add_argument("--pool-size", type=int, default=3, help="Workers per pool (default: 3)")
+    args = parser.parse_args()
+
+    from utils.metrics import Counter, Histogram
+
+    counter = Counter("check_total", "Counter updated from short-lived threads")
+    labelled = Counter("check_labelled_total", "Labelled counter updated from short-lived threads", ["stage"])
+    histogram = Histogram("check_seconds", "Histogram updated from short-lived threads")
+    cells = {
+        "counter": counter._cells,
+        "labelled counter": labelled.labels(stage="download")._cells,
+        "histogram": histogram._cells,
+    }
+    peak = dict.fromkeys(cells, 0)
+
+    def update() -> None:
+        counter.inc()
+        labelled.labels(stage="download").inc()
+        histogram.observe(0.02)
+        for name, thread_cells in cells.items():
+            peak[name] = max(peak[name], len(thread_cells._cells))
+
+    # One thread per run, as the scheduler starts them
+    for _ in range(args.threads):
+        thread = threading.Thread(target=update)
+        thread.start()
+        thread.join()
+
+    # One pool per batch, as ParallelActionExecutor creates them
+    for _ in range(args.batches):
+        with ThreadPoolExecutor(max_workers=args.pool_size) as pool:
+            for _ in range(args.pool_size):
+                pool.submit(update)
+
+    updates = args.threads + args.batches * args.pool_size
+    # The threads alive at once: one pool plus the main thread
+    bound = args.pool_size + 1
+    failed = False
+    print(f"{updates} updates from {args.threads} threads and {args.batches} pools of {args.pool_size}, no scrape")
+    for name, thread_cells in cells.items():
+        held = len(thread_cells._cells)
+        print(f"  {name:<17} peak {peak[name]:>5} cells, {held:>5} held at the end (bound {bound})")
+        if peak[name] > bound:
+            print(f"\nFAIL: {name} keeps the cells of exited threads ({peak[name]} > {bound})")
+            failed = True
+
+    totals = {
+        "counter": counter.get(),
+        "labelled counter": labelled.labels(stage="download").get(),
+        "histogram": histogram._cells.snapshot()[-1],
+    }
+    for name, total in totals.items():
+        if total != updates:
+            print(f"\nFAIL: {name} total {total:g} != {updates} updates")
+            failed = True
+
+    if failed:
+        return 1
+    print("\nOK: cells stay bounded and no update is lost")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
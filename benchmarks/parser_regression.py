@@ -0,0 +1,304 @@
+"""Regression gate for field extraction speed and accuracy.
+
+Extracts the text of a fixed synthetic corpus once (corpus.py, fixed seed),
+then runs the field extractor over it and reports:
+
+- documents/s of parse_medical_fields and worst-case per-document latency
+- time per field (extract_field_value) with recall and spurious values
+  against the corpus ground truth
+- per-pattern hit rate and time, so a pattern that never matches or one
+  that backtracks badly stands out
+
+Adversarial documents (long single-line label values that never end in a
+newline) are parsed as well; they count towards the worst case only.
+
+The extraction quality scorer (PARSER_EXTRACTOR_SCORING) is checked on the
+same texts: every corpus text must be usable and every complete dictation
+high-confidence, while copies buried in random bytes and decoded the way the
+fallback readers decode binary (Latin-1, UTF-8 ignoring errors) must be
+rejected. A scorer failure fails the run whatever the baseline.
+
+The result is compared against benchmarks/baselines/parser.json. The run
+fails if parse throughput drops by more than --tolerance, if any field's
+recall drops by more than --recall-tolerance, or if the worst-case latency
+grows beyond --worst-case-factor times the baseline.
+
+Usage:
+    python benchmarks/parser_regression.py
+    python benchmarks/parser_regression.py --save-baseline
+    python benchmarks/parser_regression.py --patterns --json /tmp/parser.json
+    python benchmarks/parser_regression.py --region-mode --body-kib 64
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+DEFAULT_BASELINE = BENCH_DIR / "baselines" / "parser.json"
+
+sys.path.insert(0, str(SRC_DIR))
+
+from corpus import FIELDS, FORMATS, generate_corpus, load_ground_truth, parse_weights  # noqa: E402
+
+
+def stress_texts(size: int) -> List[Tuple[str, str]]:
+    """Single-line documents whose label values run on for `size` characters."""
+    run = ("JOHN A. SMITH-JONES " * (size // 20 + 1))[:size]
+    return [
+        ("stress_names", f"FIRST NAME: {run}LAST NAME: {run}PROVIDER FRIST: {run}PROVIDER LAST: {run}1"),
+        ("stress_place", f"Place of Exam: {run.title()}, Date of Exam: 1/2/2025 " * 2),
+        ("stress_codes", "Case: " + "AA " * (size // 3) + "Job: " + "1028-" * (size // 5)),
+    ]
+
+
+def load_texts(parser, corpus_dir: Path, entries: List[Dict]) -> List[str]:
+    """Extract the text of every corpus document once."""
+    return [parser.extract_text_from_document(str(corpus_dir / entry["file"])) for entry in entries]
+
+
+def time_documents(parser, documents: List[Tuple[str, str]]) -> List[float]:
+    """Time parse_medical_fields on each (name, text) document."""
+    durations = []
+    for name, text in documents:
+        started = time.perf_counter()
+        parser.parse_medical_fields(text, name)
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def measure_fields(parser, documents: List[Tuple[str, str]], entries: List[Dict]) -> Dict[str, Dict[str, float]]:
+    """Time extract_field_value per field and score it against the ground truth."""
+    report = {}
+    for field in FIELDS:
+        elapsed, expected_count, recalled, spurious = 0.0, 0, 0, 0
+        for (_, text), entry in zip(documents, entries):
+            started = time.perf_counter()
+            value = parser.extract_field_value(text, field)
+            elapsed += time.perf_counter() - started
+
+            # Only complete dictations carry values in the text; blank and
+            # "No dictation" documents get at most a job number from the filename
+            if entry["variant"] == "complete":
+                expected_count += 1
+                recalled += value == entry["fields"][field]
+            elif value:
+                spurious += 1
+
+        report[field] = {
+            "us_per_doc": round(elapsed / len(documents) * 1e6, 2),
+            "recall": round(recalled / expected_count, 4) if expected_count else 1.0,
+            "spurious": spurious,
+        }
+    return report
+
+
+def measure_patterns(parser, documents: List[Tuple[str, str]]) -> Dict[str, List[Dict[str, float]]]:
+    """Hit rate and search time of every field pattern over the documents."""
+    report = {}
+    for field, patterns in parser.field_patterns.items():
+        rows = []
+        for index, pattern in enumerate(patterns):
+            hits, total, worst = 0, 0.0, 0.0
+            for _, text in documents:
+                started = time.perf_counter()
+                matched = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+                elapsed = time.perf_counter() - started
+                hits += matched is not None
+                total += elapsed
+                worst = max(worst, elapsed)
+            rows.append({
+                "index": index,
+                "pattern": pattern,
+                "hit_rate": round(hits / len(documents), 4),
+                "us_per_doc": round(total / len(documents) * 1e6, 2),
+                "worst_us": round(worst * 1e6, 1),
+            })
+        report[field] = rows
+    return report
+
+
+def polluted_samples(texts: List[str], seed: int, garbage_share: float = 0.8) -> List[Tuple[str, str]]:
+    """Corpus texts buried in random bytes and decoded as the fallback readers decode binary."""
+    rng = random.Random(seed)
+    samples = []
+    for index, text in enumerate(texts[:20]):
+        encoded = text.encode("utf-8")
+        chunks = [encoded[start:start + 200] for start in range(0, len(encoded), 200)]
+        polluted = bytearray()
+        for chunk in chunks:
+            polluted += chunk
+            # Enough random bytes after each chunk to make up garbage_share of the result
+            polluted += bytes(rng.getrandbits(8) for _ in range(int(len(chunk) * garbage_share / (1 - garbage_share))))
+        samples.append((f"polluted_{index}_latin1", polluted.decode("latin-1")))
+        samples.append((f"polluted_{index}_utf8", polluted.decode("utf-8", errors="ignore")))
+    return samples
+
+
+def check_scoring(texts: List[str], entries: List[Dict], seed: int) -> List[str]:
+    """List the texts the extraction quality scorer gets wrong."""
+    from parser.extraction_quality import HIGH_CONFIDENCE, MIN_QUALITY, score_text
+
+    failures = []
+    for text, entry in zip(texts, entries):
+        score = score_text(text)
+        required = HIGH_CONFIDENCE if entry["variant"] == "complete" else MIN_QUALITY
+        if score < required:
+            failures.append(f"{entry['file']} scores {score:.2f} < {required:g}")
+    for name, text in polluted_samples(texts, seed):
+        score = score_text(text)
+        if score >= MIN_QUALITY:
+            failures.append(f"{name} scores {score:.2f} >= {MIN_QUALITY:g} (binary accepted)")
+    return failures
+
+
+def scenario_key(args) -> str:
+    """Identify a parameterization so only like runs are compared."""
+    key = (f"count={args.count},formats={args.formats},noise={args.noise:g},"
+           f"body_kib={args.body_kib:g},seed={args.seed}")
+    return key + ",region_mode" if args.region_mode else key
+
+
+def compare_to_baseline(result: Dict, baseline: Dict, args) -> List[str]:
+    """List the metrics that regressed beyond their tolerances."""
+    regressions = []
+    if result["docs_per_s"] < baseline["docs_per_s"] * (1 - args.tolerance):
+        regressions.append(f"docs_per_s {result['docs_per_s']:.1f} < baseline {baseline['docs_per_s']:.1f} "
+                           f"(-{args.tolerance:.0%} allowed)")
+    if result["worst_ms"] > baseline["worst_ms"] * args.worst_case_factor:
+        regressions.append(f"worst_ms {result['worst_ms']:.2f} > {args.worst_case_factor:g}x "
+                           f"baseline {baseline['worst_ms']:.2f}")
+    for field, row in result["fields"].items():
+        expected = baseline["fields"].get(field)
+        if expected and row["recall"] < expected["recall"] - args.recall_tolerance:
+            regressions.append(f"{field} recall {row['recall']:.2%} < baseline {expected['recall']:.2%}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Field extraction speed and accuracy regression gate")
+    parser.add_argument("--count", type=int, default=300, help="Corpus documents (default: 300)")
+    parser.add_argument("--formats", default="docx:4,doc:2,rtf:1,html:1",
+                        help=f"Format weights from {', '.join(FORMATS)} (default: docx:4,doc:2,rtf:1,html:1)")
+    parser.add_argument("--noise", type=float, default=0.3, help="Layout perturbation probability (default: 0.3)")
+    parser.add_argument("--body-kib", type=float, default=4, help="Body text per dictation in KiB (default: 4)")
+    parser.add_argument("--seed", type=int, default=4242, help="Corpus random seed (default: 4242)")
+    parser.add_argument("--stress-kib", type=float, default=32,
+                        help="Length of the adversarial single-line values in KiB (default: 32)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes; the median is reported (default: 5)")
+    parser.add_argument("--region-mode", action="store_true",
+                        help="Search header/footer windows before the full text (PARSER_REGION_MODE)")
+    parser.add_argument("--patterns", action="store_true", help="Print the per-pattern table")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the scenario's baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Allowed relative drop in documents/s (default: 0.15)")
+    parser.add_argument("--recall-tolerance", type=float, default=0.0,
+                        help="Allowed absolute drop in any field's recall (default: 0)")
+    parser.add_argument("--worst-case-factor", type=float, default=3.0,
+                        help="Allowed growth of the worst-case document latency (default: 3x)")
+    parser.add_argument("--json", type=Path, help="Also write the result to this JSON file")
+    args = parser.parse_args()
+
+    logging.disable(logging.ERROR)
+
+    from config.models import ParserConfig
+    from parser.document_parser import DocumentParser
+
+    document_parser = DocumentParser(ParserConfig(region_mode=args.region_mode))
+    work_dir = Path(tempfile.mkdtemp(prefix="webscribe-parser-bench-"))
+    try:
+        generate_corpus(work_dir, args.count, parse_weights(args.formats, FORMATS), args.noise,
+                        int(args.body_kib * 1024), seed=args.seed)
+        entries = load_ground_truth(work_dir)
+        texts = load_texts(document_parser, work_dir, entries)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    documents = [(Path(entry["file"]).name, text) for entry, text in zip(entries, texts)]
+    stress = stress_texts(int(args.stress_kib * 1024))
+
+    # Warm-up pass compiles and caches every pattern
+    time_documents(document_parser, documents)
+
+    rates, worst = [], (0.0, "")
+    for _ in range(args.repeat):
+        durations = time_documents(document_parser, documents)
+        rates.append(len(documents) / sum(durations))
+        for (name, _), duration in zip(documents + stress, durations + time_documents(document_parser, stress)):
+            worst = max(worst, (duration, name))
+
+    field_report = measure_fields(document_parser, documents, entries)
+    pattern_report = measure_patterns(document_parser, documents)
+
+    result = {
+        "scenario": scenario_key(args),
+        "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "docs_per_s": round(statistics.median(rates), 1),
+        "worst_ms": round(worst[0] * 1000, 3),
+        "worst_document": worst[1],
+        "fields": field_report,
+        "patterns": pattern_report,
+    }
+
+    print(f"Corpus: {len(documents)} documents ({args.formats}, noise {args.noise:g}), {args.repeat} passes")
+    print(f"parse_medical_fields: {result['docs_per_s']:.1f} docs/s (median), "
+          f"worst case {result['worst_ms']:.2f} ms ({result['worst_document']})")
+
+    print(f"\n  {'field':<20} {'us/doc':>8} {'recall':>8} {'spurious':>9}")
+    for field, row in field_report.items():
+        print(f"  {field:<20} {row['us_per_doc']:>8.1f} {row['recall']:>8.1%} {row['spurious']:>9}")
+
+    never = [f"{field}[{row['index']}]" for field, rows in pattern_report.items() for row in rows if not row["hit_rate"]]
+    if args.patterns:
+        print(f"\n  {'pattern':<22} {'hit rate':>8} {'us/doc':>8} {'worst us':>9}")
+        for field, rows in pattern_report.items():
+            for row in rows:
+                print(f"  {field + '[' + str(row['index']) + ']':<22} {row['hit_rate']:>8.1%} "
+                      f"{row['us_per_doc']:>8.1f} {row['worst_us']:>9.1f}")
+    print(f"\nPatterns that never matched: {', '.join(never) if never else 'none'}")
+
+    scoring_failures = check_scoring(texts, entries, args.seed)
+    print(f"Extraction scoring: {len(scoring_failures)} failures over {len(texts)} texts and their polluted copies")
+    for failure in scoring_failures:
+        print(f"  {failure}")
+
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=2) + "\n")
+
+    baselines = json.loads(args.baseline.read_text()) if args.baseline.exists() else {"scenarios": {}}
+    if args.save_baseline:
+        baselines["scenarios"][result["scenario"]] = result
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline stored in {args.baseline}")
+        return 1 if scoring_failures else 0
+
+    if result["scenario"] not in baselines["scenarios"]:
+        print("\nNo baseline for this scenario (use --save-baseline to store one)")
+        return 1 if scoring_failures else 0
+
+    regressions = compare_to_baseline(result, baselines["scenarios"][result["scenario"]], args)
+    regressions += [f"extraction scoring: {failure}" for failure in scoring_failures]
+    for regression in regressions:
+        print(f"\nREGRESSION: {regression}")
+    if not regressions:
+        print(f"\nOK: within {args.tolerance:.0%} of the baseline throughput, no recall drop")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""Parser micro-benchmark on the synthetic dictation corpus.
+
+Times DocumentParser.extract_text_from_document and parse_medical_fields
+separately on every document of a corpus generated by corpus.py and reports
+documents/s per format and per extractor (the method the fallback chain
+settled on, read from the 'extract' span), plus field accuracy against the
+corpus ground truth.
+
+Usage:
+    python benchmarks/parser_throughput.py
+    python benchmarks/parser_throughput.py --count 1000 --formats docx:1,doc:1 --noise 0.5
+    python benchmarks/parser_throughput.py --corpus /tmp/corpus --repeat 5
+"""
+
+import argparse
+import logging
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+
+sys.path.insert(0, str(SRC_DIR))
+
+from corpus import FIELDS, FORMATS, generate_corpus, load_ground_truth, parse_weights  # noqa: E402
+
+
+def run_pass(parser, corpus_dir: Path, entries: List[Dict]) -> List[Dict]:
+    """Extract and parse every document once.
+
+    Returns:
+        List: Per document: format, extractor, extract/parse seconds and correct fields
+    """
+    from utils.tracing import get_tracer
+
+    tracer = get_tracer()
+    results = []
+    for entry in entries:
+        path = corpus_dir / entry["file"]
+
+        with tracer.span("extract") as span:
+            started = time.perf_counter()
+            text = parser.extract_text_from_document(str(path))
+            extract_s = time.perf_counter() - started
+        extractor = span.attributes.get("method", "none")
+
+        started = time.perf_counter()
+        record = parser.parse_medical_fields(text, path.name)
+        parse_s = time.perf_counter() - started
+
+        expected = entry["fields"]
+        results.append({
+            "format": entry["format"],
+            "variant": entry["variant"],
+            "extractor": extractor,
+            "extract_s": extract_s,
+            "parse_s": parse_s,
+            "correct": sum(getattr(record, field) == expected[field] for field in FIELDS),
+            "misses": [field for field in FIELDS if getattr(record, field) != expected[field]],
+        })
+    return results
+
+
+def summarize(results: List[Dict], key: str) -> Dict[str, Dict[str, float]]:
+    """Aggregate per-document results grouped by one of their keys."""
+    from utils.tracing import percentile
+
+    groups: Dict[str, List[Dict]] = {}
+    for result in results:
+        groups.setdefault(result[key], []).append(result)
+
+    summary = {}
+    for name, group in sorted(groups.items()):
+        extract_s = sorted(result["extract_s"] for result in group)
+        parse_s = sum(result["parse_s"] for result in group)
+        summary[name] = {
+            "docs": len(group),
+            "extract_docs_per_s": len(group) / sum(extract_s) if sum(extract_s) else 0.0,
+            "extract_p95_ms": percentile(extract_s, 95) * 1000,
+            "parse_docs_per_s": len(group) / parse_s if parse_s else 0.0,
+            "field_accuracy": sum(result["correct"] for result in group) / (len(group) * len(FIELDS)),
+        }
+    return summary
+
+
+def format_table(title: str, summary: Dict[str, Dict[str, float]]) -> str:
+    lines = [title,
+             f"  {'':<20} {'docs':>6} {'extract/s':>10} {'p95 ms':>8} {'parse/s':>9} {'accuracy':>9}"]
+    for name, row in summary.items():
+        lines.append(f"  {name:<20} {row['docs']:>6} {row['extract_docs_per_s']:>10.1f} "
+                     f"{row['extract_p95_ms']:>8.2f} {row['parse_docs_per_s']:>9.1f} {row['field_accuracy']:>9.1%}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Document extraction and field parsing micro-benchmark")
+    parser.add_argument("--corpus", type=Path, help="Existing corpus directory (default: generate one)")
+    parser.add_argument("--count", type=int, default=400, help="Documents to generate (default: 400)")
+    parser.add_argument("--formats", default="docx:4,doc:2,rtf:1,html:1",
+                        help=f"Format weights from {', '.join(FORMATS)} (default: docx:4,doc:2,rtf:1,html:1)")
+    parser.add_argument("--noise", type=float, default=0.2, help="Layout perturbation probability (default: 0.2)")
+    parser.add_argument("--body-kib", type=float, default=4, help="Body text per dictation in KiB (default: 4)")
+    parser.add_argument("--seed", type=int, default=1234, help="Corpus random seed")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the corpus (default: 3)")
+    args = parser.parse_args()
+
+    # Extractors failing over to the next method is expected on this corpus
+    logging.disable(logging.ERROR)
+
+    from parser.document_parser import DocumentParser
+
+    work_dir = None
+    corpus_dir = args.corpus
+    if corpus_dir is None:
+        work_dir = Path(tempfile.mkdtemp(prefix="webscribe-corpus-"))
+        corpus_dir = work_dir
+        generate_corpus(corpus_dir, args.count, parse_weights(args.formats, FORMATS), args.noise,
+                        int(args.body_kib * 1024), seed=args.seed)
+
+    try:
+        entries = load_ground_truth(corpus_dir)
+        document_parser = DocumentParser()
+
+        # Warm-up pass: first-use imports and regex compilation are not counted
+        run_pass(document_parser, corpus_dir, entries)
+        results = []
+        for _ in range(args.repeat):
+            results.extend(run_pass(document_parser, corpus_dir, entries))
+
+        extract_s = sum(result["extract_s"] for result in results)
+        parse_s = sum(result["parse_s"] for result in results)
+        print(f"Corpus: {len(entries)} documents in {corpus_dir}, {args.repeat} passes")
+        print(f"Overall: extract {len(results) / extract_s:.1f} docs/s, parse {len(results) / parse_s:.1f} docs/s\n")
+        print(format_table("By format:", summarize(results, "format")))
+        print()
+        print(format_table("By extractor:", summarize(results, "extractor")))
+        print()
+        print(format_table("By variant:", summarize(results, "variant")))
+
+        field_misses = {field: 0 for field in FIELDS}
+        for result in results:
+            for field in result["misses"]:
+                field_misses[field] += 1
+        print("\nField accuracy:")
+        for field in FIELDS:
+            print(f"  {field:<20} {1 - field_misses[field] / len(results):>7.1%}")
+        return 0
+    finally:
+        if work_dir is not None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
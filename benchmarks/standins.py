@@ -0,0 +1,610 @@
+"""Local FTPS, SFTP and SMTP stand-ins for benchmarking the processing cycle.
+
+The stand-ins implement just enough of each protocol for FTPSManager,
+SFTPManager and EmailNotifier: an explicit-TLS FTP server that serves a
+local directory (MLSD/SIZE/RETR over protected passive data connections),
+a paramiko SFTP server backed by a local directory, and an SMTP sink with
+STARTTLS and AUTH that counts delivered messages. Each can inject a fixed
+latency before every reply to simulate a remote server.
+"""
+
+import base64
+import datetime
+import logging
+import multiprocessing
+import os
+import posixpath
+import socket
+import socketserver
+import ssl
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import paramiko
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+
+def make_self_signed_cert(directory: Path) -> Tuple[str, str]:
+    """Create a self-signed certificate for localhost.
+
+    Args:
+        directory: Directory to write cert.pem and key.pem to
+
+    Returns:
+        Tuple: (certificate path, private key path)
+    """
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.utcnow()
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=30))
+        .sign(key, hashes.SHA256())
+    )
+
+    directory.mkdir(parents=True, exist_ok=True)
+    cert_path = directory / "cert.pem"
+    key_path = directory / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.TraditionalOpenSSL,
+        serialization.NoEncryption(),
+    ))
+    return str(cert_path), str(key_path)
+
+
+def _server_context(cert_path: str, key_path: str) -> ssl.SSLContext:
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    return context
+
+
+class _ThreadingServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _StandIn:
+    """Base class running a socketserver on a background thread."""
+
+    handler_class = None
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.host = "127.0.0.1"
+        self.port = 0
+        self._server: Optional[_ThreadingServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> int:
+        """Start serving on an ephemeral port and return the port."""
+        self._server = _ThreadingServer((self.host, 0), self.handler_class)
+        self._server.standin = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True,
+                                        name=f"{type(self).__name__}-{self.port}")
+        self._thread.start()
+        return self.port
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def delay(self) -> None:
+        """Sleep for the injected latency."""
+        if self.latency:
+            time.sleep(self.latency)
+
+
+class _LineHandler(socketserver.StreamRequestHandler):
+    """Request handler for CRLF line-based protocols with STARTTLS-style upgrades."""
+
+    def reply(self, line: str) -> None:
+        self.server.standin.delay()
+        self.wfile.write(line.encode("utf-8") + b"\r\n")
+        self.wfile.flush()
+
+    def read_line(self) -> Optional[str]:
+        line = self.rfile.readline(8192)
+        if not line:
+            return None
+        return line.decode("utf-8", "replace").rstrip("\r\n")
+
+    def upgrade_to_tls(self) -> None:
+        """Wrap the control connection in TLS (after AUTH TLS / STARTTLS)."""
+        standin = self.server.standin
+        self.wfile.flush()
+        self.request = standin.tls_context.wrap_socket(self.request, server_side=True)
+        self.connection = self.request
+        self.rfile = self.request.makefile("rb")
+        self.wfile = self.request.makefile("wb")
+
+
+class _FTPSHandler(_LineHandler):
+    """One FTP control connection."""
+
+    def setup(self):
+        super().setup()
+        self.cwd = "/"
+        self.protect_data = False
+        self.passive_socket: Optional[socket.socket] = None
+
+    def handle(self):
+        self.reply("220 WebScribe benchmark FTPS stand-in")
+        while True:
+            line = self.read_line()
+            if line is None:
+                break
+            command, _, argument = line.partition(" ")
+            method = getattr(self, f"ftp_{command.upper()}", None)
+            if method is None:
+                self.reply(f"502 Command {command} not implemented")
+                continue
+            if method(argument) is False:
+                break
+        if self.passive_socket is not None:
+            self.passive_socket.close()
+
+    def resolve(self, path: str) -> Tuple[str, Path]:
+        """Map a client path to (virtual path, local path) under the root."""
+        virtual = posixpath.normpath(posixpath.join(self.cwd, path or "."))
+        if not virtual.startswith("/"):
+            virtual = "/" + virtual
+        return virtual, self.server.standin.root / virtual.lstrip("/")
+
+    def open_data_connection(self) -> Optional[socket.socket]:
+        if self.passive_socket is None:
+            self.reply("425 Use PASV first")
+            return None
+        self.reply("150 Opening data connection")
+        conn, _ = self.passive_socket.accept()
+        self.passive_socket.close()
+        self.passive_socket = None
+        if self.protect_data:
+            conn = self.server.standin.tls_context.wrap_socket(conn, server_side=True)
+        return conn
+
+    def close_data_connection(self, conn: socket.socket) -> None:
+        if isinstance(conn, ssl.SSLSocket):
+            try:
+                conn = conn.unwrap()
+            except (OSError, ssl.SSLError):
+                pass
+        conn.close()
+        self.reply("226 Transfer complete")
+
+    def ftp_AUTH(self, argument):
+        self.reply("234 AUTH TLS successful")
+        self.upgrade_to_tls()
+
+    def ftp_USER(self, argument):
+        self.reply("331 Password required")
+
+    def ftp_PASS(self, argument):
+        self.reply("230 Logged in")
+
+    def ftp_PBSZ(self, argument):
+        self.reply("200 PBSZ=0")
+
+    def ftp_PROT(self, argument):
+        self.protect_data = argument.upper() == "P"
+        self.reply("200 Protection level set")
+
+    def ftp_TYPE(self, argument):
+        self.reply("200 Type set")
+
+    def ftp_NOOP(self, argument):
+        self.reply("200 NOOP ok")
+
+    def ftp_SYST(self, argument):
+        self.reply("215 UNIX Type: L8")
+
+    def ftp_FEAT(self, argument):
+        self.wfile.write(b"211-Features:\r\n MLSD\r\n SIZE\r\n MDTM\r\n PBSZ\r\n PROT\r\n")
+        self.reply("211 End")
+
+    def ftp_PWD(self, argument):
+        self.reply(f'257 "{self.cwd}" is the current directory')
+
+    def ftp_CWD(self, argument):
+        virtual, local = self.resolve(argument)
+        if local.is_dir():
+            self.cwd = virtual
+            self.reply("250 Directory changed")
+        else:
+            self.reply("550 No such directory")
+
+    def ftp_PASV(self, argument):
+        if self.passive_socket is not None:
+            self.passive_socket.close()
+        self.passive_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.passive_socket.bind((self.server.standin.host, 0))
+        self.passive_socket.listen(1)
+        host, port = self.passive_socket.getsockname()
+        self.reply(f"227 Entering Passive Mode ({host.replace('.', ',')},{port >> 8},{port & 0xFF})")
+
+    def ftp_SIZE(self, argument):
+        _, local = self.resolve(argument)
+        if local.is_file():
+            self.reply(f"213 {local.stat().st_size}")
+        else:
+            self.reply("550 No such file")
+
+    def ftp_MDTM(self, argument):
+        _, local = self.resolve(argument)
+        if local.is_file():
+            self.reply(f"213 {time.strftime('%Y%m%d%H%M%S', time.gmtime(local.stat().st_mtime))}")
+        else:
+            self.reply("550 No such file")
+
+    def ftp_MLSD(self, argument):
+        _, local = self.resolve(argument)
+        if not local.is_dir():
+            self.reply("550 No such directory")
+            return
+        conn = self.open_data_connection()
+        if conn is None:
+            return
+        lines = []
+        for entry in sorted(local.iterdir()):
+            stat = entry.stat()
+            kind = "dir" if entry.is_dir() else "file"
+            modify = time.strftime("%Y%m%d%H%M%S", time.gmtime(stat.st_mtime))
+            lines.append(f"type={kind};size={stat.st_size};modify={modify}; {entry.name}\r\n")
+        conn.sendall("".join(lines).encode("utf-8"))
+        self.close_data_connection(conn)
+
+    def ftp_RETR(self, argument):
+        _, local = self.resolve(argument)
+        if not local.is_file():
+            self.reply("550 No such file")
+            return
+        conn = self.open_data_connection()
+        if conn is None:
+            return
+        with open(local, "rb") as source:
+            while True:
+                chunk = source.read(65536)
+                if not chunk:
+                    break
+                conn.sendall(chunk)
+        self.close_data_connection(conn)
+
+    def ftp_QUIT(self, argument):
+        self.reply("221 Goodbye")
+        return False
+
+
+class FTPSStandIn(_StandIn):
+    """Explicit-TLS FTP server serving a local directory read-only."""
+
+    handler_class = _FTPSHandler
+
+    def __init__(self, root: Path, cert_path: str, key_path: str, latency: float = 0.0):
+        """
+        Args:
+            root: Local directory served as '/'
+            cert_path: TLS certificate
+            key_path: TLS private key
+            latency: Seconds to wait before every control reply
+        """
+        super().__init__(latency)
+        self.root = Path(root)
+        self.tls_context = _server_context(cert_path, key_path)
+
+
+class _SMTPHandler(_LineHandler):
+    """One SMTP session."""
+
+    def handle(self):
+        self.reply("220 WebScribe benchmark SMTP sink")
+        while True:
+            line = self.read_line()
+            if line is None:
+                break
+            command = line.split(" ", 1)[0].upper()
+            if command in ("EHLO", "HELO"):
+                self.wfile.write(b"250-localhost\r\n250-STARTTLS\r\n250-AUTH PLAIN LOGIN\r\n")
+                self.reply("250 SIZE 10485760")
+            elif command == "STARTTLS":
+                self.reply("220 Ready to start TLS")
+                self.upgrade_to_tls()
+            elif command == "AUTH":
+                # Any credentials are accepted; only the exchange is simulated
+                parts = line.split()
+                if parts[1].upper() == "LOGIN":
+                    prompts = ["Password:"] if len(parts) > 2 else ["Username:", "Password:"]
+                else:
+                    prompts = [] if len(parts) > 2 else [""]
+                for prompt in prompts:
+                    self.reply(f"334 {base64.b64encode(prompt.encode()).decode()}")
+                    self.read_line()
+                self.reply("235 Authentication successful")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                size = 0
+                while True:
+                    data_line = self.rfile.readline()
+                    if not data_line or data_line in (b".\r\n", b".\n"):
+                        break
+                    size += len(data_line)
+                self.server.standin.record_message(size)
+                self.reply("250 Message accepted")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                break
+            else:
+                # MAIL, RCPT, RSET, NOOP
+                self.reply("250 OK")
+
+
+class SMTPSink(_StandIn):
+    """SMTP server with STARTTLS and AUTH that accepts and discards messages."""
+
+    handler_class = _SMTPHandler
+
+    def __init__(self, cert_path: str, key_path: str, latency: float = 0.0):
+        super().__init__(latency)
+        self.tls_context = _server_context(cert_path, key_path)
+        self.messages = 0
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+
+    def record_message(self, size: int) -> None:
+        with self._lock:
+            self.messages += 1
+            self.bytes_received += size
+
+
+class _AcceptAllServer(paramiko.ServerInterface):
+    """SSH server policy accepting any password and the SFTP subsystem."""
+
+    def check_auth_password(self, username, password):
+        return paramiko.AUTH_SUCCESSFUL
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+
+class _LocalSFTPHandle(paramiko.SFTPHandle):
+    def stat(self):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.fstat(self.readfile.fileno()))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+
+    def chattr(self, attr):
+        return paramiko.SFTP_OK
+
+
+class _LocalSFTPServer(paramiko.SFTPServerInterface):
+    """SFTP operations mapped onto a local directory."""
+
+    def __init__(self, server, *args, standin=None, **kwargs):
+        super().__init__(server, *args, **kwargs)
+        self.standin = standin
+
+    def _local(self, path: str) -> str:
+        self.standin.delay()
+        virtual = posixpath.normpath("/" + path)
+        return str(self.standin.root / virtual.lstrip("/"))
+
+    def list_folder(self, path):
+        local = self._local(path)
+        try:
+            entries = []
+            for name in sorted(os.listdir(local)):
+                attr = paramiko.SFTPAttributes.from_stat(os.stat(os.path.join(local, name)))
+                attr.filename = name
+                entries.append(attr)
+            return entries
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+
+    def stat(self, path):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.stat(self._local(path)))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+
+    lstat = stat
+
+    def open(self, path, flags, attr):
+        local = self._local(path)
+        try:
+            fd = os.open(local, flags | getattr(os, "O_BINARY", 0), 0o644)
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+
+        if flags & os.O_WRONLY:
+            mode = "ab" if flags & os.O_APPEND else "wb"
+        elif flags & os.O_RDWR:
+            mode = "a+b" if flags & os.O_APPEND else "r+b"
+        else:
+            mode = "rb"
+        handle = _LocalSFTPHandle(flags)
+        handle.filename = local
+        handle.readfile = handle.writefile = os.fdopen(fd, mode)
+        return handle
+
+    def remove(self, path):
+        try:
+            os.remove(self._local(path))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+        return paramiko.SFTP_OK
+
+    def rename(self, oldpath, newpath):
+        try:
+            os.rename(self._local(oldpath), self._local(newpath))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+        return paramiko.SFTP_OK
+
+    def posix_rename(self, oldpath, newpath):
+        try:
+            os.replace(self._local(oldpath), self._local(newpath))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+        return paramiko.SFTP_OK
+
+    def mkdir(self, path, attr):
+        try:
+            os.mkdir(self._local(path))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+        return paramiko.SFTP_OK
+
+    def rmdir(self, path):
+        try:
+            os.rmdir(self._local(path))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+        return paramiko.SFTP_OK
+
+    def chattr(self, path, attr):
+        return paramiko.SFTP_OK
+
+    def canonicalize(self, path):
+        return posixpath.normpath("/" + path)
+
+
+class SFTPStandIn:
+    """Paramiko SFTP server backed by a local directory, accepting any password."""
+
+    def __init__(self, root: Path, latency: float = 0.0):
+        """
+        Args:
+            root: Local directory served as '/'
+            latency: Seconds to wait before every SFTP operation
+        """
+        self.root = Path(root)
+        self.latency = latency
+        self.host = "127.0.0.1"
+        self.port = 0
+        self.host_key = paramiko.RSAKey.generate(2048)
+        self._listener: Optional[socket.socket] = None
+        self._transports: List[paramiko.Transport] = []
+        self._thread: Optional[threading.Thread] = None
+
+    def delay(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+
+    def start(self) -> int:
+        """Start accepting connections on an ephemeral port and return the port."""
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind((self.host, 0))
+        self._listener.listen(16)
+        self.port = self._listener.getsockname()[1]
+        self._thread = threading.Thread(target=self._accept_loop, daemon=True, name=f"SFTPStandIn-{self.port}")
+        self._thread.start()
+        return self.port
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                return
+            transport = paramiko.Transport(conn)
+            transport.add_server_key(self.host_key)
+            transport.set_subsystem_handler("sftp", paramiko.SFTPServer, _LocalSFTPServer, standin=self)
+            transport.start_server(server=_AcceptAllServer())
+            self._transports.append(transport)
+
+    def stop(self) -> None:
+        """Stop accepting connections and close open sessions."""
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+        for transport in self._transports:
+            transport.close()
+        self._transports = []
+
+
+def _serve(conn, ftps_root: str, sftp_root: str, cert_dir: str, latency: float) -> None:
+    """Child process body: run the three stand-ins until told to stop."""
+    # Clients hanging up show up as paramiko socket errors; they are expected here
+    logging.getLogger("paramiko").setLevel(logging.CRITICAL)
+    cert_path, key_path = make_self_signed_cert(Path(cert_dir))
+    ftps = FTPSStandIn(Path(ftps_root), cert_path, key_path, latency)
+    sftp = SFTPStandIn(Path(sftp_root), latency)
+    smtp = SMTPSink(cert_path, key_path, latency)
+    conn.send({"ftps": ftps.start(), "sftp": sftp.start(), "smtp": smtp.start()})
+
+    while True:
+        request = conn.recv()
+        if request == "stats":
+            conn.send({"messages": smtp.messages, "message_bytes": smtp.bytes_received})
+        elif request == "stop":
+            break
+
+    for standin in (ftps, sftp, smtp):
+        standin.stop()
+    conn.send("stopped")
+
+
+class StandInProcess:
+    """Runs the FTPS, SFTP and SMTP stand-ins in a separate process.
+
+    Keeping the servers out of the benchmarked process means they neither
+    compete with the processing cycle for the GIL nor count towards its
+    peak RSS.
+    """
+
+    def __init__(self, ftps_root: Path, sftp_root: Path, work_dir: Path, latency: float = 0.0):
+        """
+        Args:
+            ftps_root: Directory served by the FTPS stand-in
+            sftp_root: Directory served by the SFTP stand-in (receives uploads)
+            work_dir: Directory for the generated TLS certificate
+            latency: Seconds each server waits before every reply
+        """
+        self.args = (str(ftps_root), str(sftp_root), str(work_dir / "tls"), latency)
+        self.ports = {}
+        self._conn = None
+        self._process = None
+
+    def __enter__(self) -> "StandInProcess":
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(target=_serve, args=(child_conn,) + self.args, daemon=True)
+        self._process.start()
+        self.ports = self._conn.recv()
+        return self
+
+    def stats(self) -> dict:
+        """Get the number and total size of messages the SMTP sink received."""
+        self._conn.send("stats")
+        return self._conn.recv()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self._conn.send("stop")
+            self._conn.recv()
+        except (OSError, EOFError):
+            pass
+        self._process.join(timeout=10)
+        if self._process.is_alive():
+            self._process.terminate()
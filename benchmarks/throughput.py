@@ -0,0 +1,295 @@
+"""End-to-end throughput benchmark for the processing cycle.
+
+Populates a local FTPS stand-in with synthetic dictation documents spread
+over the configured type folders, starts SFTP and SMTP stand-ins, then
+drives MainController.run_processing_cycle against them and reports
+files/s, MB/s, per-stage latency percentiles and peak RSS. Results can be
+stored as a baseline and later runs compared against it, so a performance
+change shows up as a measured difference.
+
+Usage:
+    python benchmarks/throughput.py
+    python benchmarks/throughput.py --files 500 --sizes uniform:16KiB-1MiB --latency-ms 20
+    python benchmarks/throughput.py --save-baseline
+"""
+
+import argparse
+import calendar
+import json
+import multiprocessing
+import random
+import re
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+DEFAULT_BASELINE = BENCH_DIR / "baselines" / "throughput.json"
+
+# The application is imported from src/ exactly as `python src/main.py` sees it
+sys.path.insert(0, str(SRC_DIR))
+
+from corpus import compose_lines, make_record, render_docx  # noqa: E402
+from standins import StandInProcess  # noqa: E402
+
+
+_SIZE_UNITS = {"": 1, "B": 1, "KIB": 1024, "KB": 1000, "MIB": 1024 ** 2, "MB": 1000 ** 2}
+
+def parse_size(text: str) -> int:
+    """Parse a size such as '64KiB', '1.5MiB' or '2048' into bytes."""
+    match = re.fullmatch(r"\s*([\d.]+)\s*([A-Za-z]*)\s*", text)
+    if not match or match.group(2).upper() not in _SIZE_UNITS:
+        raise argparse.ArgumentTypeError(f"Invalid size: {text!r}")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
+
+
+def parse_size_distribution(spec: str) -> Callable[[random.Random], int]:
+    """Parse a file size distribution.
+
+    Supported forms: 'fixed:64KiB', 'uniform:16KiB-256KiB' and
+    'lognormal:64KiB' (median size, sigma 1).
+
+    Returns:
+        Callable: Draws a file size in bytes from a random generator
+    """
+    kind, _, params = spec.partition(":")
+    if kind == "fixed":
+        size = parse_size(params)
+        return lambda rng: size
+    if kind == "uniform":
+        low, _, high = params.partition("-")
+        low, high = parse_size(low), parse_size(high)
+        return lambda rng: rng.randint(low, high)
+    if kind == "lognormal":
+        median = parse_size(params)
+        return lambda rng: max(1024, int(rng.lognormvariate(0, 1) * median))
+    raise argparse.ArgumentTypeError(f"Unknown size distribution: {spec!r}")
+
+
+def populate_source(root: str, remote_path: str, type_folders: List[str], files: int,
+                    sizes: str, seed: int, date: str) -> Tuple[int, int]:
+    """Write the synthetic corpus into the FTPS stand-in's directory.
+
+    Documents are padded to the drawn size with an uncompressed member that
+    the parser never reads, so transfer volume follows the distribution
+    while the parsing work per document stays comparable.
+
+    Returns:
+        Tuple: (files written, total bytes)
+    """
+    import os
+
+    rng = random.Random(seed)
+    draw_size = parse_size_distribution(sizes)
+    mtime = calendar.timegm(datetime.strptime(date, "%Y-%m-%d").replace(hour=12).timetuple())
+    base = Path(root) / remote_path.strip("/")
+
+    total_bytes = 0
+    for index in range(files):
+        type_folder = type_folders[index % len(type_folders)]
+        path = base / type_folder / f"{type_folder}_{index:06d}.docx"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines = compose_lines(rng, make_record(rng, index), "complete", noise=0.0, body_size=4096)
+        path.write_bytes(render_docx(lines))
+
+        padding = draw_size(rng) - path.stat().st_size
+        if padding > 0:
+            with zipfile.ZipFile(path, "a", compression=zipfile.ZIP_STORED) as archive:
+                archive.writestr("customXml/padding.bin", os.urandom(padding))
+
+        os.utime(path, (mtime, mtime))
+        total_bytes += path.stat().st_size
+    return files, total_bytes
+
+
+def _call_in_subprocess(func, *args):
+    """Run a function in a spawned process (keeps its memory out of our peak RSS)."""
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        return pool.apply(func, args)
+
+
+def configure_runtime(work_dir: Path) -> None:
+    """Set up logging, error handling and tracing the way main.py does."""
+    from config.models import LoggingConfig, RetentionConfig, TracingConfig
+    from utils.error_handler import get_error_handler
+    from utils.logging_config import setup_logging
+    from utils.tracing import get_tracer
+
+    log_dir = work_dir / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    setup_logging(log_dir=str(log_dir), console_level="WARNING", file_level="DEBUG",
+                  enable_colors=False, retention_config=RetentionConfig(), logging_config=LoggingConfig())
+    get_error_handler(str(log_dir / "error_context"), RetentionConfig())
+    get_tracer(str(log_dir / "traces"), TracingConfig())
+
+
+def run_cycle(work_dir: Path, run_index: int, ports: Dict[str, int], args) -> Dict[str, float]:
+    """Run one processing cycle against the stand-ins and time it."""
+    from config.settings import ConfigManager
+    from controller.main_controller import MainController
+
+    storage = work_dir / f"run_{run_index}"
+    overrides = {
+        "SOURCE_FTPS_HOST": "127.0.0.1", "SOURCE_FTPS_PORT": str(ports["ftps"]),
+        "SOURCE_FTPS_USERNAME": "bench", "SOURCE_FTPS_PASSWORD": "bench",
+        "SOURCE_FTPS_PATH": args.remote_path,
+        "DEST_SFTP_HOST": "127.0.0.1", "DEST_SFTP_PORT": str(ports["sftp"]),
+        "DEST_SFTP_USERNAME": "bench", "DEST_SFTP_PASSWORD": "bench", "DEST_SFTP_PATH": "/",
+        "SMTP_HOST": "127.0.0.1", "SMTP_PORT": str(ports["smtp"]),
+        "SMTP_USERNAME": "bench", "SMTP_PASSWORD": "bench", "ADMIN_EMAIL": "bench@localhost",
+        "TYPE_FOLDERS": ",".join(args.type_folders),
+        "LOCAL_STORAGE_PATH": str(storage / "storage"),
+        "TEMP_PATH": str(storage / "temp"),
+        "ZIP_BACKUP_PATH": str(storage / "backup"),
+        "DATE_FOLDER_BASE_PATH": str(storage / "processing"),
+        "METRICS_ENABLED": "false",
+        "EMAIL_DIGEST_ENABLED": "false",
+        "SHARD_ENABLED": "false",
+    }
+    controller = MainController(ConfigManager(overrides=overrides),
+                                custom_date=datetime.strptime(args.date, "%Y-%m-%d"))
+
+    start = time.perf_counter()
+    stats = controller.run_processing_cycle()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "seconds": elapsed,
+        "files": stats.downloads_succeeded,
+        "failed": stats.downloads_failed,
+        "bytes": stats.bytes_downloaded,
+        "records": stats.records_extracted,
+        "upload_status": stats.upload_status,
+        "email_sent": stats.email_sent,
+    }
+
+
+def scenario_key(args) -> str:
+    """Identify a parameterization so only like runs are compared."""
+    return (f"files={args.files},sizes={args.sizes},latency_ms={args.latency_ms:g},"
+            f"folders={len(args.type_folders)}")
+
+
+def compare_to_baseline(result: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """List the metrics that regressed beyond the tolerance."""
+    regressions = []
+    for metric in ("files_per_s", "mb_per_s"):
+        if result[metric] < baseline[metric] * (1 - tolerance):
+            regressions.append(f"{metric} {result[metric]:.2f} < baseline {baseline[metric]:.2f} "
+                               f"(-{tolerance:.0%} allowed)")
+    if result["peak_rss_mb"] > baseline["peak_rss_mb"] * (1 + tolerance):
+        regressions.append(f"peak_rss_mb {result['peak_rss_mb']:.1f} > baseline {baseline['peak_rss_mb']:.1f} "
+                           f"(+{tolerance:.0%} allowed)")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="End-to-end processing cycle throughput benchmark")
+    parser.add_argument("--files", type=int, default=200, help="Synthetic documents to serve (default: 200)")
+    parser.add_argument("--sizes", default="uniform:16KiB-256KiB",
+                        help="Size distribution: fixed:SIZE, uniform:MIN-MAX or lognormal:MEDIAN "
+                             "(default: uniform:16KiB-256KiB)")
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Latency injected before every server reply (default: 0)")
+    parser.add_argument("--type-folders", type=lambda s: [f for f in s.split(",") if f],
+                        default=["type3", "type6", "type7", "type16"], help="Comma-separated type folders")
+    parser.add_argument("--remote-path", default="/webscribe", help="Source base path on the FTPS stand-in")
+    parser.add_argument("--date", default="2025-01-15", help="Processing date of the corpus (YYYY-MM-DD)")
+    parser.add_argument("--repeat", type=int, default=3, help="Cycles to run; the median is reported (default: 3)")
+    parser.add_argument("--seed", type=int, default=1234, help="Corpus random seed")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the scenario's baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Allowed relative regression against the baseline (default: 0.15)")
+    parser.add_argument("--json", type=Path, help="Also write the result to this JSON file")
+    parser.add_argument("--keep", action="store_true", help="Keep the working directory")
+    args = parser.parse_args()
+    parse_size_distribution(args.sizes)
+
+    work_dir = Path(tempfile.mkdtemp(prefix="webscribe-bench-"))
+    try:
+        ftps_root, sftp_root = work_dir / "ftps", work_dir / "sftp"
+        sftp_root.mkdir(parents=True)
+        print(f"Generating {args.files} documents ({args.sizes}) in {len(args.type_folders)} type folders...")
+        files, corpus_bytes = _call_in_subprocess(populate_source, str(ftps_root), args.remote_path,
+                                                  args.type_folders, args.files, args.sizes, args.seed, args.date)
+        print(f"Corpus: {files} files, {corpus_bytes / 1024 ** 2:.1f} MiB")
+
+        configure_runtime(work_dir)
+        from utils.tracing import get_tracer
+
+        runs = []
+        with StandInProcess(ftps_root, sftp_root, work_dir, args.latency_ms / 1000) as standins:
+            for run_index in range(args.repeat):
+                run = run_cycle(work_dir, run_index, standins.ports, args)
+                runs.append(run)
+                print(f"  run {run_index + 1}/{args.repeat}: {run['seconds']:.2f} s, {run['files']} files, "
+                      f"{run['records']} records, upload {run['upload_status']}, "
+                      f"email {'sent' if run['email_sent'] else 'not sent'}")
+            smtp_stats = standins.stats()
+            uploads = len(list(sftp_root.glob("*.csv")))
+
+        seconds = statistics.median(run["seconds"] for run in runs)
+        moved_bytes = statistics.median(run["bytes"] for run in runs)
+        moved_files = statistics.median(run["files"] for run in runs)
+        result = {
+            "scenario": scenario_key(args),
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "seconds": round(seconds, 3),
+            "files_per_s": round(moved_files / seconds, 2),
+            "mb_per_s": round(moved_bytes / 1024 ** 2 / seconds, 3),
+            "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+            "stages": get_tracer().get_stage_percentiles(),
+        }
+
+        print(f"\nScenario: {result['scenario']}")
+        print(f"Median cycle: {result['seconds']:.2f} s over {args.repeat} runs")
+        print(f"Throughput: {result['files_per_s']:.1f} files/s, {result['mb_per_s']:.2f} MB/s")
+        print(f"Peak RSS: {result['peak_rss_mb']:.1f} MiB")
+        print(f"Delivered: {uploads} CSV file(s) on SFTP, {smtp_stats['messages']} emails")
+        print("\n" + get_tracer().format_stage_report())
+
+        failed = any(run["files"] != files or run["failed"] for run in runs)
+        if failed:
+            print(f"\nFAIL: not every cycle downloaded all {files} files")
+
+        if args.json:
+            args.json.write_text(json.dumps(result, indent=2) + "\n")
+
+        baselines = json.loads(args.baseline.read_text()) if args.baseline.exists() else {"scenarios": {}}
+        if args.save_baseline:
+            baselines["scenarios"][result["scenario"]] = result
+            args.baseline.parent.mkdir(parents=True, exist_ok=True)
+            args.baseline.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+            print(f"\nBaseline stored in {args.baseline}")
+        elif result["scenario"] in baselines["scenarios"]:
+            regressions = compare_to_baseline(result, baselines["scenarios"][result["scenario"]], args.tolerance)
+            for regression in regressions:
+                print(f"\nREGRESSION: {regression}")
+            failed = failed or bool(regressions)
+            if not regressions:
+                print(f"\nOK: within {args.tolerance:.0%} of the baseline")
+        else:
+            print("\nNo baseline for this scenario (use --save-baseline to store one)")
+
+        return 1 if failed else 0
+    finally:
+        if args.keep:
+            print(f"Working directory kept: {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,25 @@
 """Configuration data models for the medical document processing system."""
 
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import Optional, List, Dict
+
+
+def _slotted(cls):
+    """Rebuild a dataclass with __slots__ instead of a per-instance __dict__.
+    
+    Equivalent to dataclass(slots=True), which needs Python 3.10. Used for
+    models created in large numbers (one per scanned file, download or record).
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in field_names + ('__dict__', '__weakref__'):
+        namespace.pop(name, None)
+    namespace['__slots__'] = field_names
+    
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
 
 
 @dataclass
@@ -45,12 +63,24 @@ class EmailConfig:
     smtp_from: Optional[str] = None  # From email address (optional, defaults to smtp_username)
 
 
+@dataclass
+class DigestConfig:
+    """Configuration for coalescing email notifications into periodic digests."""
+    enabled: bool = False
+    window_seconds: int = 3600  # Length of each digest window (default: hourly)
+
+
 @dataclass
 class ScheduleConfig:
     """Configuration for scheduling system."""
     poll_interval_seconds: int = 60
     poll_cron: Optional[str] = None
     timezone: str = "UTC"
+    overlap_policy: str = "skip"  # 'skip' or 'coalesce' ticks that fire during a run
+    adaptive_polling_enabled: bool = False
+    adaptive_max_interval_seconds: int = 900
+    adaptive_backoff_factor: float = 2.0
+    adaptive_empty_threshold: int = 3  # Consecutive empty scans before backing off
 
 
 @dataclass
@@ -61,6 +91,78 @@ class StorageConfig:
     zip_backup_path: str
 
 
+@dataclass
+class LoggingConfig:
+    """Configuration for the asynchronous logging pipeline."""
+    async_enabled: bool = True
+    queue_size: int = 10000
+    overflow_policy: str = "drop"  # 'drop' (discard below ERROR) or 'block'
+    sample_limit: int = 5  # Per-key messages logged in full each cycle (0 = no sampling)
+    component_sample_limits: Dict[str, int] = field(default_factory=dict)
+    sampled_detail: bool = False  # Write sampled-out messages at DEBUG
+
+
+@dataclass
+class TracingConfig:
+    """Configuration for stage tracing."""
+    enabled: bool = True
+    max_samples_per_stage: int = 2048  # Recent span durations kept for percentiles
+
+
+@dataclass
+class ParserConfig:
+    """Configuration for document field extraction."""
+    pattern_order_file: str = ""  # Tuned field pattern order (empty = declaration order)
+    profile_patterns: bool = False  # Count which pattern wins per field
+    pattern_profile_path: str = "./logs/pattern_profile.json"
+    region_mode: bool = False  # Search header/footer windows before the full text
+    head_chars: int = 4096  # Header window for identifying fields
+    tail_chars: int = 2048  # Footer window for transcriptionist, DD, job and case code
+    docx_streaming: bool = False  # Parse .docx from streamed paragraphs (only the windows in region mode)
+    zip_workers: int = 0  # Parse ZIP members in memory on this many threads (0 = extract to disk first)
+    extractor_scoring: bool = False  # Score extraction results and skip extractors that keep failing
+
+
+@dataclass
+class MetricsConfig:
+    """Configuration for the Prometheus metrics endpoint."""
+    enabled: bool = False
+    host: str = "127.0.0.1"
+    port: int = 9108
+
+
+@dataclass
+class ShardConfig:
+    """Configuration for sharding type folders across worker nodes."""
+    enabled: bool = False
+    lease_backend: str = "sqlite"  # 'sqlite' or 'package.module:ClassName'
+    lease_db_path: str = "./data/shards/leases.db"  # On storage shared by all nodes
+    shared_path: str = "./data/shards"  # Part CSVs, on storage shared by all nodes
+    node_id: str = ""  # Defaults to hostname-pid
+    group: str = "default"  # Namespace for leases and parts (one per source)
+    lease_ttl_seconds: int = 900
+
+
+@dataclass
+class TenantProfile:
+    """A source/destination profile run by the job runner."""
+    name: str
+    settings: Dict[str, str] = field(default_factory=dict)  # Overrides of environment settings
+    max_concurrency: int = 1  # Cycles of this tenant allowed to run at once (only 1 is supported)
+
+
+@dataclass
+class RunnerConfig:
+    """Configuration for running several tenant profiles in one process."""
+    tenants: List[TenantProfile] = field(default_factory=list)
+    defaults: Dict[str, str] = field(default_factory=dict)  # Settings shared by all tenants
+    max_workers: int = 4  # Shared pool for processing cycles
+    action_workers: int = 6  # Shared pool for upload/log/email actions
+    max_connections_per_host: int = 4  # 0 = unlimited
+    max_idle_connections_per_host: int = 2  # 0 = no connection reuse
+    idle_connection_timeout_seconds: int = 300
+
+
 @dataclass
 class RetentionConfig:
     """Configuration for file retention policies.
@@ -74,6 +176,18 @@ class RetentionConfig:
     zip_backup_retention_days: int = 0  # 0 = disabled
 
 
+@_slotted
+@dataclass
+class FileInfo:
+    """Information about a remote file (FTPS or SFTP)."""
+    filename: str
+    full_path: str
+    size: int
+    mtime: datetime
+    is_directory: bool = False
+
+
+@_slotted
 @dataclass
 class MedicalRecord:
     """Data model for extracted medical record information."""
@@ -118,6 +232,7 @@ class ProcessingRecord:
     error_message: Optional[str] = None
 
 
+@_slotted
 @dataclass
 class DownloadResult:
     """Data model for file download results."""
@@ -128,6 +243,7 @@ class DownloadResult:
     error_message: Optional[str] = None
 
 
+@_slotted
 @dataclass
 class ActionResult:
     """Data model for parallel action execution results."""
@@ -144,7 +260,7 @@ class ProcessingStats:
     start_time: str  # ISO format datetime string
     end_time: str  # ISO format datetime string
     type_folders_scanned: dict  # folder_name -> file_count
-    files_downloaded: List[DownloadResult]
+    files_downloaded: List[DownloadResult]  # Per-file detail for the processing log
     documents_processed: int
     records_extracted: int
     csv_filename: str
@@ -152,4 +268,31 @@ class ProcessingStats:
     upload_status: str
     log_filename: str
     email_sent: bool
-    errors: List[str]
\ No newline at end of file
+    errors: List[str]
+    # Download summary kept in sync with files_downloaded by set_downloads()
+    downloads_total: int = 0
+    downloads_succeeded: int = 0
+    bytes_downloaded: int = 0
+    downloads_by_folder: Dict[str, int] = field(default_factory=dict)  # Successful downloads per type folder
+    
+    def __post_init__(self):
+        self.set_downloads(self.files_downloaded)
+    
+    @property
+    def downloads_failed(self) -> int:
+        """Number of downloads that failed."""
+        return self.downloads_total - self.downloads_succeeded
+    
+    def set_downloads(self, download_results: List[DownloadResult]) -> None:
+        """Replace the download results and recompute the download summary."""
+        self.files_downloaded = download_results
+        self.downloads_total = len(download_results)
+        self.downloads_succeeded = 0
+        self.bytes_downloaded = 0
+        self.downloads_by_folder = {}
+        for download in download_results:
+            if download.success:
+                self.downloads_succeeded += 1
+                self.bytes_downloaded += download.size
+                self.downloads_by_folder[download.type_folder] = \
+                    self.downloads_by_folder.get(download.type_folder, 0) + 1
\ No newline at end of file
@@ -1,12 +1,15 @@
 """Configuration manager for the medical document processing system."""
 
 import os
-from typing import Dict, Any, List
+import re
+import json
+from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 
 from .models import (
     SFTPConfig, FTPSConfig, TypeFolderConfig,
-    EmailConfig, ScheduleConfig, StorageConfig, RetentionConfig
+    EmailConfig, DigestConfig, ScheduleConfig, StorageConfig, RetentionConfig,
+    LoggingConfig, TracingConfig, ParserConfig, MetricsConfig, ShardConfig, TenantProfile, RunnerConfig
 )
 
 
@@ -18,62 +21,124 @@ class ConfigurationError(Exception):
 class ConfigManager:
     """Manages configuration loading and validation for the application."""
     
-    def __init__(self):
-        """Initialize the configuration manager."""
+    def __init__(self, overrides: Optional[Dict[str, Any]] = None, require_endpoints: bool = True):
+        """Initialize the configuration manager.
+        
+        Args:
+            overrides: Optional values that take precedence over environment
+                variables (used for per-tenant profiles in job runner mode)
+            require_endpoints: Whether server and email credentials must be set
+                (False for the process-wide configuration in job runner mode,
+                where each tenant profile supplies its own)
+        """
         load_dotenv()
+        self._overrides = {key: str(value) for key, value in (overrides or {}).items()}
+        self._require_endpoints = require_endpoints
         self._config = self._load_config()
         self._validate_required_config()
     
+    def _getenv(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Get a setting from the overrides, falling back to the environment."""
+        if key in self._overrides:
+            return self._overrides[key]
+        return os.getenv(key, default)
+    
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from environment variables."""
+        """Load configuration from environment variables and overrides."""
         return {
             # Source FTPS Configuration (WebScribe workflow)
-            'SOURCE_FTPS_HOST': os.getenv('SOURCE_FTPS_HOST'),
-            'SOURCE_FTPS_PORT': int(os.getenv('SOURCE_FTPS_PORT', '21')),
-            'SOURCE_FTPS_USERNAME': os.getenv('SOURCE_FTPS_USERNAME'),
-            'SOURCE_FTPS_PASSWORD': os.getenv('SOURCE_FTPS_PASSWORD'),
-            'SOURCE_FTPS_PATH': os.getenv('SOURCE_FTPS_PATH', '/'),
-            'SOURCE_FTPS_USE_TLS': os.getenv('SOURCE_FTPS_USE_TLS', 'true').lower() == 'true',
-            'SOURCE_FTPS_PASSIVE_MODE': os.getenv('SOURCE_FTPS_PASSIVE_MODE', 'true').lower() == 'true',
+            'SOURCE_FTPS_HOST': self._getenv('SOURCE_FTPS_HOST'),
+            'SOURCE_FTPS_PORT': int(self._getenv('SOURCE_FTPS_PORT', '21')),
+            'SOURCE_FTPS_USERNAME': self._getenv('SOURCE_FTPS_USERNAME'),
+            'SOURCE_FTPS_PASSWORD': self._getenv('SOURCE_FTPS_PASSWORD'),
+            'SOURCE_FTPS_PATH': self._getenv('SOURCE_FTPS_PATH', '/'),
+            'SOURCE_FTPS_USE_TLS': self._getenv('SOURCE_FTPS_USE_TLS', 'true').lower() == 'true',
+            'SOURCE_FTPS_PASSIVE_MODE': self._getenv('SOURCE_FTPS_PASSIVE_MODE', 'true').lower() == 'true',
             
             # Destination SFTP Configuration
-            'DEST_SFTP_HOST': os.getenv('DEST_SFTP_HOST'),
-            'DEST_SFTP_PORT': int(os.getenv('DEST_SFTP_PORT', '22')),
-            'DEST_SFTP_USERNAME': os.getenv('DEST_SFTP_USERNAME'),
-            'DEST_SFTP_PASSWORD': os.getenv('DEST_SFTP_PASSWORD'),
-            'DEST_SFTP_PATH': os.getenv('DEST_SFTP_PATH', '/'),
+            'DEST_SFTP_HOST': self._getenv('DEST_SFTP_HOST'),
+            'DEST_SFTP_PORT': int(self._getenv('DEST_SFTP_PORT', '22')),
+            'DEST_SFTP_USERNAME': self._getenv('DEST_SFTP_USERNAME'),
+            'DEST_SFTP_PASSWORD': self._getenv('DEST_SFTP_PASSWORD'),
+            'DEST_SFTP_PATH': self._getenv('DEST_SFTP_PATH', '/'),
             
             # Email Configuration
-            'SMTP_HOST': os.getenv('SMTP_HOST'),
-            'SMTP_PORT': int(os.getenv('SMTP_PORT', '587')),
-            'SMTP_USERNAME': os.getenv('SMTP_USERNAME'),
-            'SMTP_PASSWORD': os.getenv('SMTP_PASSWORD'),
-            'SMTP_FROM': os.getenv('SMTP_FROM'),
-            'ADMIN_EMAIL': os.getenv('ADMIN_EMAIL'),
+            'SMTP_HOST': self._getenv('SMTP_HOST'),
+            'SMTP_PORT': int(self._getenv('SMTP_PORT', '587')),
+            'SMTP_USERNAME': self._getenv('SMTP_USERNAME'),
+            'SMTP_PASSWORD': self._getenv('SMTP_PASSWORD'),
+            'SMTP_FROM': self._getenv('SMTP_FROM'),
+            'ADMIN_EMAIL': self._getenv('ADMIN_EMAIL'),
+            
+            # Email Digest Configuration
+            'EMAIL_DIGEST_ENABLED': self._getenv('EMAIL_DIGEST_ENABLED', 'false').lower() == 'true',
+            'EMAIL_DIGEST_WINDOW_SECONDS': int(self._getenv('EMAIL_DIGEST_WINDOW_SECONDS', '3600')),
             
             # Scheduling Configuration
-            'POLL_INTERVAL_SECONDS': int(os.getenv('POLL_INTERVAL_SECONDS', '60')),
-            'POLL_CRON': os.getenv('POLL_CRON'),
-            'TZ': os.getenv('TZ', 'UTC'),
+            'POLL_INTERVAL_SECONDS': int(self._getenv('POLL_INTERVAL_SECONDS', '60')),
+            'POLL_CRON': self._getenv('POLL_CRON'),
+            'TZ': self._getenv('TZ', 'UTC'),
+            'SCHEDULE_OVERLAP_POLICY': self._getenv('SCHEDULE_OVERLAP_POLICY', 'skip').lower(),
+            'ADAPTIVE_POLLING_ENABLED': self._getenv('ADAPTIVE_POLLING_ENABLED', 'false').lower() == 'true',
+            'ADAPTIVE_POLL_MAX_SECONDS': int(self._getenv('ADAPTIVE_POLL_MAX_SECONDS', '900')),
+            'ADAPTIVE_POLL_BACKOFF_FACTOR': float(self._getenv('ADAPTIVE_POLL_BACKOFF_FACTOR', '2.0')),
+            'ADAPTIVE_POLL_EMPTY_THRESHOLD': int(self._getenv('ADAPTIVE_POLL_EMPTY_THRESHOLD', '3')),
             
             # Storage Configuration
-            'LOCAL_STORAGE_PATH': os.getenv('LOCAL_STORAGE_PATH', './data'),
-            'TEMP_PATH': os.getenv('TEMP_PATH', './temp'),
-            'ZIP_BACKUP_PATH': os.getenv('ZIP_BACKUP_PATH', './data/AutogenJobID/zipfile-backups'),
+            'LOCAL_STORAGE_PATH': self._getenv('LOCAL_STORAGE_PATH', './data'),
+            'TEMP_PATH': self._getenv('TEMP_PATH', './temp'),
+            'ZIP_BACKUP_PATH': self._getenv('ZIP_BACKUP_PATH', './data/AutogenJobID/zipfile-backups'),
+            
+            # Logging Pipeline Configuration
+            'LOG_ASYNC_ENABLED': self._getenv('LOG_ASYNC_ENABLED', 'true').lower() == 'true',
+            'LOG_QUEUE_SIZE': int(self._getenv('LOG_QUEUE_SIZE', '10000')),
+            'LOG_QUEUE_OVERFLOW': self._getenv('LOG_QUEUE_OVERFLOW', 'drop').lower(),
+            'LOG_SAMPLE_LIMIT': int(self._getenv('LOG_SAMPLE_LIMIT', '5')),
+            'LOG_SAMPLING': self._getenv('LOG_SAMPLING', ''),
+            'LOG_SAMPLED_DETAIL': self._getenv('LOG_SAMPLED_DETAIL', 'false').lower() == 'true',
+            
+            # Tracing Configuration
+            'TRACE_ENABLED': self._getenv('TRACE_ENABLED', 'true').lower() == 'true',
+            'TRACE_SAMPLE_SIZE': int(self._getenv('TRACE_SAMPLE_SIZE', '2048')),
+            
+            # Parser Configuration
+            'PARSER_PATTERN_ORDER_FILE': self._getenv('PARSER_PATTERN_ORDER_FILE', ''),
+            'PARSER_PROFILE_PATTERNS': self._getenv('PARSER_PROFILE_PATTERNS', 'false').lower() == 'true',
+            'PARSER_PATTERN_PROFILE_PATH': self._getenv('PARSER_PATTERN_PROFILE_PATH', './logs/pattern_profile.json'),
+            'PARSER_REGION_MODE': self._getenv('PARSER_REGION_MODE', 'false').lower() == 'true',
+            'PARSER_HEAD_CHARS': int(self._getenv('PARSER_HEAD_CHARS', '4096')),
+            'PARSER_TAIL_CHARS': int(self._getenv('PARSER_TAIL_CHARS', '2048')),
+            'PARSER_DOCX_STREAMING': self._getenv('PARSER_DOCX_STREAMING', 'false').lower() == 'true',
+            'PARSER_ZIP_WORKERS': int(self._getenv('PARSER_ZIP_WORKERS', '0')),
+            'PARSER_EXTRACTOR_SCORING': self._getenv('PARSER_EXTRACTOR_SCORING', 'false').lower() == 'true',
+            
+            # Metrics Endpoint Configuration
+            'METRICS_ENABLED': self._getenv('METRICS_ENABLED', 'false').lower() == 'true',
+            'METRICS_HOST': self._getenv('METRICS_HOST', '127.0.0.1'),
+            'METRICS_PORT': int(self._getenv('METRICS_PORT', '9108')),
+            
+            # Sharding Configuration (type folders leased across worker nodes)
+            'SHARD_ENABLED': self._getenv('SHARD_ENABLED', 'false').lower() == 'true',
+            'SHARD_LEASE_BACKEND': self._getenv('SHARD_LEASE_BACKEND', 'sqlite'),
+            'SHARD_LEASE_DB': self._getenv('SHARD_LEASE_DB', './data/shards/leases.db'),
+            'SHARD_SHARED_PATH': self._getenv('SHARD_SHARED_PATH', './data/shards'),
+            'SHARD_NODE_ID': self._getenv('SHARD_NODE_ID', ''),
+            'SHARD_GROUP': self._getenv('SHARD_GROUP', 'default'),
+            'SHARD_LEASE_TTL_SECONDS': int(self._getenv('SHARD_LEASE_TTL_SECONDS', '900')),
             
             # Retention Configuration (0 = disabled)
-            'CSV_RETENTION_DAYS': int(os.getenv('CSV_RETENTION_DAYS', '0')),
-            'LOG_RETENTION_DAYS': int(os.getenv('LOG_RETENTION_DAYS', '0')),
-            'ERROR_LOG_RETENTION_DAYS': int(os.getenv('ERROR_LOG_RETENTION_DAYS', '0')),
-            'PROCESSING_RECORDS_RETENTION_DAYS': int(os.getenv('PROCESSING_RECORDS_RETENTION_DAYS', '0')),
-            'ZIP_BACKUP_RETENTION_DAYS': int(os.getenv('ZIP_BACKUP_RETENTION_DAYS', '0')),
+            'CSV_RETENTION_DAYS': int(self._getenv('CSV_RETENTION_DAYS', '0')),
+            'LOG_RETENTION_DAYS': int(self._getenv('LOG_RETENTION_DAYS', '0')),
+            'ERROR_LOG_RETENTION_DAYS': int(self._getenv('ERROR_LOG_RETENTION_DAYS', '0')),
+            'PROCESSING_RECORDS_RETENTION_DAYS': int(self._getenv('PROCESSING_RECORDS_RETENTION_DAYS', '0')),
+            'ZIP_BACKUP_RETENTION_DAYS': int(self._getenv('ZIP_BACKUP_RETENTION_DAYS', '0')),
             
             # Type Folders Configuration (WebScribe workflow)
-            'TYPE_FOLDERS': os.getenv('TYPE_FOLDERS', 'type3,type6,type7,type16,type18,type19,type20,type21,type22,type23,type24'),
+            'TYPE_FOLDERS': self._getenv('TYPE_FOLDERS', 'type3,type6,type7,type16,type18,type19,type20,type21,type22,type23,type24'),
             
             # Date Folder Configuration (WebScribe workflow)
-            'USE_YESTERDAY_DATE': os.getenv('USE_YESTERDAY_DATE', 'true').lower() == 'true',
-            'DATE_FOLDER_BASE_PATH': os.getenv('DATE_FOLDER_BASE_PATH', './data/processing'),
+            'USE_YESTERDAY_DATE': self._getenv('USE_YESTERDAY_DATE', 'true').lower() == 'true',
+            'DATE_FOLDER_BASE_PATH': self._getenv('DATE_FOLDER_BASE_PATH', './data/processing'),
         }
     
     def _validate_required_config(self) -> None:
@@ -93,7 +158,7 @@ class ConfigManager:
         
         missing_fields = []
         for field in required_fields:
-            if not self._config.get(field):
+            if self._require_endpoints and not self._config.get(field):
                 missing_fields.append(field)
         
         if missing_fields:
@@ -114,6 +179,64 @@ class ConfigManager:
         # Validate poll interval
         if self._config['POLL_INTERVAL_SECONDS'] < 1:
             raise ConfigurationError("POLL_INTERVAL_SECONDS must be at least 1")
+        
+        # Validate scheduling policy
+        if self._config['SCHEDULE_OVERLAP_POLICY'] not in ('skip', 'coalesce'):
+            raise ConfigurationError("SCHEDULE_OVERLAP_POLICY must be 'skip' or 'coalesce'")
+        
+        if self._config['ADAPTIVE_POLLING_ENABLED']:
+            if self._config['ADAPTIVE_POLL_MAX_SECONDS'] < self._config['POLL_INTERVAL_SECONDS']:
+                raise ConfigurationError("ADAPTIVE_POLL_MAX_SECONDS must be at least POLL_INTERVAL_SECONDS")
+            if self._config['ADAPTIVE_POLL_BACKOFF_FACTOR'] <= 1.0:
+                raise ConfigurationError("ADAPTIVE_POLL_BACKOFF_FACTOR must be greater than 1")
+            if self._config['ADAPTIVE_POLL_EMPTY_THRESHOLD'] < 1:
+                raise ConfigurationError("ADAPTIVE_POLL_EMPTY_THRESHOLD must be at least 1")
+        
+        # Validate logging pipeline settings
+        if self._config['LOG_QUEUE_SIZE'] < 1:
+            raise ConfigurationError("LOG_QUEUE_SIZE must be at least 1")
+        
+        if self._config['LOG_QUEUE_OVERFLOW'] not in ('drop', 'block'):
+            raise ConfigurationError("LOG_QUEUE_OVERFLOW must be 'drop' or 'block'")
+        
+        if self._config['LOG_SAMPLE_LIMIT'] < 0:
+            raise ConfigurationError("LOG_SAMPLE_LIMIT must be 0 (disabled) or greater")
+        
+        try:
+            self._parse_component_sample_limits()
+        except ValueError:
+            raise ConfigurationError(
+                "LOG_SAMPLING must be a comma-separated list of component=limit pairs "
+                "(e.g. controller=5,parser=3)"
+            )
+        
+        if self._config['TRACE_SAMPLE_SIZE'] < 1:
+            raise ConfigurationError("TRACE_SAMPLE_SIZE must be at least 1")
+        
+        if self._config['PARSER_REGION_MODE']:
+            if self._config['PARSER_HEAD_CHARS'] < 1 or self._config['PARSER_TAIL_CHARS'] < 1:
+                raise ConfigurationError("PARSER_HEAD_CHARS and PARSER_TAIL_CHARS must be at least 1")
+        
+        if self._config['PARSER_ZIP_WORKERS'] < 0:
+            raise ConfigurationError("PARSER_ZIP_WORKERS must be 0 (extract to disk) or greater")
+        
+        if not (1 <= self._config['METRICS_PORT'] <= 65535):
+            raise ConfigurationError("METRICS_PORT must be between 1 and 65535")
+        
+        if self._config['SHARD_ENABLED']:
+            if not _TENANT_NAME_PATTERN.match(self._config['SHARD_GROUP']):
+                raise ConfigurationError("SHARD_GROUP may only contain letters, digits, '.', '_' or '-'")
+            if self._config['SHARD_LEASE_TTL_SECONDS'] < 30:
+                raise ConfigurationError("SHARD_LEASE_TTL_SECONDS must be at least 30")
+            backend = self._config['SHARD_LEASE_BACKEND']
+            if backend != 'sqlite' and ':' not in backend:
+                raise ConfigurationError(
+                    "SHARD_LEASE_BACKEND must be 'sqlite' or a 'package.module:ClassName' path"
+                )
+        
+        # Validate digest window
+        if self._config['EMAIL_DIGEST_WINDOW_SECONDS'] < 60:
+            raise ConfigurationError("EMAIL_DIGEST_WINDOW_SECONDS must be at least 60")
     
     def get_dest_sftp_config(self) -> SFTPConfig:
         """Get destination SFTP server configuration."""
@@ -147,12 +270,24 @@ class ConfigManager:
             smtp_from=self._config.get('SMTP_FROM', self._config['SMTP_USERNAME'])
         )
     
+    def get_digest_config(self) -> DigestConfig:
+        """Get email digest configuration."""
+        return DigestConfig(
+            enabled=self._config['EMAIL_DIGEST_ENABLED'],
+            window_seconds=self._config['EMAIL_DIGEST_WINDOW_SECONDS']
+        )
+    
     def get_schedule_config(self) -> ScheduleConfig:
         """Get scheduling configuration."""
         return ScheduleConfig(
             poll_interval_seconds=self._config['POLL_INTERVAL_SECONDS'],
             poll_cron=self._config['POLL_CRON'],
-            timezone=self._config['TZ']
+            timezone=self._config['TZ'],
+            overlap_policy=self._config['SCHEDULE_OVERLAP_POLICY'],
+            adaptive_polling_enabled=self._config['ADAPTIVE_POLLING_ENABLED'],
+            adaptive_max_interval_seconds=self._config['ADAPTIVE_POLL_MAX_SECONDS'],
+            adaptive_backoff_factor=self._config['ADAPTIVE_POLL_BACKOFF_FACTOR'],
+            adaptive_empty_threshold=self._config['ADAPTIVE_POLL_EMPTY_THRESHOLD']
         )
     
     def get_storage_config(self) -> StorageConfig:
@@ -173,6 +308,71 @@ class ConfigManager:
             zip_backup_retention_days=self._config['ZIP_BACKUP_RETENTION_DAYS']
         )
     
+    def get_logging_config(self) -> LoggingConfig:
+        """Get logging pipeline configuration."""
+        return LoggingConfig(
+            async_enabled=self._config['LOG_ASYNC_ENABLED'],
+            queue_size=self._config['LOG_QUEUE_SIZE'],
+            overflow_policy=self._config['LOG_QUEUE_OVERFLOW'],
+            sample_limit=self._config['LOG_SAMPLE_LIMIT'],
+            component_sample_limits=self._parse_component_sample_limits(),
+            sampled_detail=self._config['LOG_SAMPLED_DETAIL']
+        )
+    
+    def get_tracing_config(self) -> TracingConfig:
+        """Get stage tracing configuration."""
+        return TracingConfig(
+            enabled=self._config['TRACE_ENABLED'],
+            max_samples_per_stage=self._config['TRACE_SAMPLE_SIZE']
+        )
+    
+    def get_parser_config(self) -> ParserConfig:
+        """Get document field extraction configuration."""
+        return ParserConfig(
+            pattern_order_file=self._config['PARSER_PATTERN_ORDER_FILE'],
+            profile_patterns=self._config['PARSER_PROFILE_PATTERNS'],
+            pattern_profile_path=self._config['PARSER_PATTERN_PROFILE_PATH'],
+            region_mode=self._config['PARSER_REGION_MODE'],
+            head_chars=self._config['PARSER_HEAD_CHARS'],
+            tail_chars=self._config['PARSER_TAIL_CHARS'],
+            docx_streaming=self._config['PARSER_DOCX_STREAMING'],
+            zip_workers=self._config['PARSER_ZIP_WORKERS'],
+            extractor_scoring=self._config['PARSER_EXTRACTOR_SCORING']
+        )
+    
+    def get_metrics_config(self) -> MetricsConfig:
+        """Get metrics endpoint configuration."""
+        return MetricsConfig(
+            enabled=self._config['METRICS_ENABLED'],
+            host=self._config['METRICS_HOST'],
+            port=self._config['METRICS_PORT']
+        )
+    
+    def get_shard_config(self) -> ShardConfig:
+        """Get type folder sharding configuration."""
+        return ShardConfig(
+            enabled=self._config['SHARD_ENABLED'],
+            lease_backend=self._config['SHARD_LEASE_BACKEND'],
+            lease_db_path=self._config['SHARD_LEASE_DB'],
+            shared_path=self._config['SHARD_SHARED_PATH'],
+            node_id=self._config['SHARD_NODE_ID'],
+            group=self._config['SHARD_GROUP'],
+            lease_ttl_seconds=self._config['SHARD_LEASE_TTL_SECONDS']
+        )
+    
+    def _parse_component_sample_limits(self) -> Dict[str, int]:
+        """Parse LOG_SAMPLING ('component=limit,...') into per-component limits."""
+        limits = {}
+        for entry in self._config.get('LOG_SAMPLING', '').split(','):
+            if not entry.strip():
+                continue
+            component, limit = entry.split('=', 1)
+            limit = int(limit)
+            if limit < 0:
+                raise ValueError(f"Negative sample limit for {component}")
+            limits[component.strip()] = limit
+        return limits
+    
     def get_config_value(self, key: str, default: Any = None) -> Any:
         """Get a specific configuration value."""
         return self._config.get(key, default)
@@ -204,4 +404,98 @@ class ConfigManager:
         return {
             'use_yesterday_date': self._config.get('USE_YESTERDAY_DATE', True),
             'base_path': self._config.get('DATE_FOLDER_BASE_PATH', './data/processing')
-        }
\ No newline at end of file
+        }
+
+
+# Tenant names become directory names and log/metric labels
+_TENANT_NAME_PATTERN = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_.-]*$')
+
+# Local paths that are given a per-tenant subdirectory unless a profile sets them
+TENANT_PATH_KEYS = ('LOCAL_STORAGE_PATH', 'TEMP_PATH', 'ZIP_BACKUP_PATH', 'DATE_FOLDER_BASE_PATH')
+
+
+def load_runner_config(profiles_path: str) -> RunnerConfig:
+    """Load tenant profiles for job runner mode from a JSON file.
+    
+    The file holds an optional "runner" section with pool sizes, optional
+    "defaults" shared by every tenant, and a "tenants" list. Each tenant has a
+    unique "name", its "settings" (environment variable names and values that
+    override the environment for that tenant) and an optional
+    "max_concurrency", which must be 1.
+    
+    Args:
+        profiles_path: Path to the profiles file
+        
+    Returns:
+        RunnerConfig: Parsed runner configuration
+        
+    Raises:
+        ConfigurationError: If the file is missing or invalid
+    """
+    try:
+        with open(profiles_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except OSError as e:
+        raise ConfigurationError(f"Cannot read profiles file {profiles_path}: {e}")
+    except json.JSONDecodeError as e:
+        raise ConfigurationError(f"Profiles file {profiles_path} is not valid JSON: {e}")
+    
+    if not isinstance(data, dict) or not isinstance(data.get('tenants'), list) or not data['tenants']:
+        raise ConfigurationError("Profiles file must contain a non-empty 'tenants' list")
+    
+    def _settings(value: Any, where: str) -> Dict[str, str]:
+        if value is None:
+            return {}
+        if not isinstance(value, dict) or any(isinstance(v, (dict, list)) for v in value.values()):
+            raise ConfigurationError(f"{where} must map setting names to scalar values")
+        return {str(key): str(v).lower() if isinstance(v, bool) else str(v) for key, v in value.items()}
+    
+    defaults = _settings(data.get('defaults'), "Profile 'defaults'")
+    
+    tenants = []
+    seen_names = set()
+    for entry in data['tenants']:
+        if not isinstance(entry, dict):
+            raise ConfigurationError("Each tenant profile must be an object")
+        
+        name = str(entry.get('name', ''))
+        if not _TENANT_NAME_PATTERN.match(name):
+            raise ConfigurationError(
+                f"Invalid tenant name {name!r}: use letters, digits, '.', '_' or '-'"
+            )
+        if name in seen_names:
+            raise ConfigurationError(f"Duplicate tenant name: {name}")
+        seen_names.add(name)
+        
+        max_concurrency = entry.get('max_concurrency', 1)
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ConfigurationError(f"Tenant {name}: max_concurrency must be a positive integer")
+        if max_concurrency > 1:
+            # Cycles of one tenant share its date folder, CSV sink, file tracker and digest
+            raise ConfigurationError(
+                f"Tenant {name}: max_concurrency must be 1; a tenant's cycles cannot run concurrently"
+            )
+        
+        tenants.append(TenantProfile(
+            name=name,
+            settings=_settings(entry.get('settings'), f"Tenant {name} 'settings'"),
+            max_concurrency=max_concurrency
+        ))
+    
+    runner = data.get('runner') or {}
+    if not isinstance(runner, dict):
+        raise ConfigurationError("Profile 'runner' section must be an object")
+    
+    config = RunnerConfig(tenants=tenants, defaults=defaults)
+    for key in ('max_workers', 'action_workers', 'max_connections_per_host',
+                'max_idle_connections_per_host', 'idle_connection_timeout_seconds'):
+        if key in runner:
+            value = runner[key]
+            if not isinstance(value, int) or value < 0:
+                raise ConfigurationError(f"Runner setting {key} must be a non-negative integer")
+            setattr(config, key, value)
+    
+    if config.max_workers < 1 or config.action_workers < 1:
+        raise ConfigurationError("Runner max_workers and action_workers must be at least 1")
+    
+    return config
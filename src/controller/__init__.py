@@ -1,5 +1,6 @@
 """Controller package for the medical document processing system."""
 
 from .main_controller import MainController, ProcessingError
+from .job_runner import JobRunner
 
-__all__ = ['MainController', 'ProcessingError']
\ No newline at end of file
+__all__ = ['MainController', 'ProcessingError', 'JobRunner']
\ No newline at end of file
@@ -0,0 +1,238 @@
+"""Job runner that processes several tenant profiles in one process."""
+
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config.settings import ConfigManager, TENANT_PATH_KEYS
+from config.models import RunnerConfig, TenantProfile
+from controller.main_controller import MainController
+from ftps.ftps_manager import FTPSManager
+from sftp.manager import SFTPManager
+from scheduler.job_scheduler import Scheduler
+from utils.connection_pool import ConnectionPool
+from utils.parallel_action_executor import ParallelActionExecutor
+from utils.error_handler import handle_error, ErrorCategory, ErrorSeverity
+from utils.metrics import QUEUE_DEPTH
+
+
+logger = logging.getLogger(__name__)
+
+
+class TenantJob:
+    """A tenant profile with its own configuration and controller."""
+
+    def __init__(self, profile: TenantProfile, config_manager: ConfigManager, controller: MainController):
+        """Initialize the tenant job.
+
+        Args:
+            profile: Tenant profile
+            config_manager: Configuration resolved for this tenant
+            controller: Controller that runs this tenant's processing cycles
+        """
+        self.name = profile.name
+        self.profile = profile
+        self.config_manager = config_manager
+        self.controller = controller
+        # The controller's date folder, CSV sink, file tracker and digest are
+        # not reentrant, so a tenant runs one cycle at a time
+        self.cycle_lock = threading.Lock()
+
+
+class JobRunner:
+    """Runs the processing cycles of several tenants under one scheduler.
+
+    Every tenant gets its own configuration (environment settings overridden
+    by its profile), storage directories and controller, and its own job on
+    a shared scheduler with the tenant's interval/cron and overlap policy.
+    Cycles run on a shared worker pool, post-processing actions on a second
+    shared pool, and FTPS/SFTP connections are pooled per server and account
+    so tenants on the same host reuse connections within a per-host limit.
+    """
+
+    def __init__(self, base_config: ConfigManager, runner_config: RunnerConfig,
+                 custom_date: Optional[datetime] = None):
+        """Initialize the job runner and a controller per tenant.
+
+        Args:
+            base_config: Process-wide configuration (environment plus profile defaults)
+            runner_config: Tenant profiles and shared pool sizes
+            custom_date: Optional custom date for processing (applies to all tenants)
+        """
+        self.base_config = base_config
+        self.runner_config = runner_config
+
+        self.connection_pool = ConnectionPool(
+            max_connections_per_host=runner_config.max_connections_per_host,
+            max_idle_per_host=runner_config.max_idle_connections_per_host,
+            idle_timeout=runner_config.idle_connection_timeout_seconds
+        )
+        self.ftps_manager = FTPSManager(connection_pool=self.connection_pool)
+        self.sftp_manager = SFTPManager(connection_pool=self.connection_pool)
+
+        self._cycle_pool = ThreadPoolExecutor(max_workers=runner_config.max_workers,
+                                              thread_name_prefix="tenant-cycle")
+        self._action_pool = ThreadPoolExecutor(max_workers=runner_config.action_workers,
+                                               thread_name_prefix="tenant-action")
+        self.action_executor = ParallelActionExecutor(executor=self._action_pool)
+
+        self._lock = threading.Lock()
+        self._waiting_cycles = 0
+        QUEUE_DEPTH.labels(queue="tenant_cycles").set_function(lambda: self._waiting_cycles)
+
+        self.tenants: Dict[str, TenantJob] = {}
+        for profile in runner_config.tenants:
+            self.tenants[profile.name] = self._create_tenant(profile, custom_date)
+
+        self.scheduler = Scheduler(base_config.get_schedule_config())
+        for tenant in self.tenants.values():
+            self.scheduler.add_configured_job(
+                lambda name=tenant.name: self.run_tenant(name),
+                tenant.config_manager.get_schedule_config(),
+                job_id=tenant.name
+            )
+
+        logger.info(f"JobRunner initialized with {len(self.tenants)} tenants: {', '.join(self.tenants)}")
+        logger.info(f"Shared pools: {runner_config.max_workers} cycle workers, "
+                    f"{runner_config.action_workers} action workers, "
+                    f"{runner_config.max_connections_per_host or 'unlimited'} connections per host")
+
+    def _create_tenant(self, profile: TenantProfile, custom_date: Optional[datetime]) -> TenantJob:
+        """Resolve a tenant's configuration and create its controller.
+
+        Local paths the profile does not set explicitly are placed in a
+        subdirectory named after the tenant, so tenants never share date
+        folders, CSV files or backups. The tenant name is also its default
+        shard group.
+
+        Args:
+            profile: Tenant profile
+            custom_date: Optional custom processing date
+
+        Returns:
+            TenantJob: The configured tenant
+        """
+        isolated_paths = {
+            key: str(Path(self.base_config.get_config_value(key)) / profile.name)
+            for key in TENANT_PATH_KEYS
+            if key not in profile.settings
+        }
+        overrides = dict(self.runner_config.defaults)
+        overrides.update(isolated_paths)
+        overrides['SHARD_GROUP'] = profile.name
+        overrides.update(profile.settings)
+
+        config_manager = ConfigManager(overrides=overrides)
+        controller = MainController(
+            config_manager,
+            custom_date=custom_date,
+            ftps_manager=self.ftps_manager,
+            sftp_manager=self.sftp_manager,
+            parallel_executor=self.action_executor
+        )
+        return TenantJob(profile, config_manager, controller)
+
+    def run_tenant(self, name: str) -> Optional[bool]:
+        """Run one processing cycle for a tenant on the shared worker pool.
+
+        Blocks until the cycle has finished, so the scheduler's overlap policy
+        and adaptive polling see the real outcome.
+
+        Args:
+            name: Tenant name
+
+        Returns:
+            bool: True if the cycle found files, False if the scan was empty,
+                  None if the cycle failed
+        """
+        tenant = self.tenants[name]
+        with self._lock:
+            self._waiting_cycles += 1
+
+        try:
+            future = self._cycle_pool.submit(self._run_cycle, tenant)
+        except RuntimeError:
+            # Pool already shut down
+            with self._lock:
+                self._waiting_cycles -= 1
+            return None
+        return future.result()
+
+    def _run_cycle(self, tenant: TenantJob) -> Optional[bool]:
+        """Run a tenant's cycle, one at a time per tenant (runs on the cycle pool)."""
+        with self._lock:
+            self._waiting_cycles -= 1
+
+        with tenant.cycle_lock:
+            try:
+                logger.info(f"[{tenant.name}] Starting processing cycle")
+                stats = tenant.controller.run_processing_cycle()
+                if stats and stats.downloads_total:
+                    logger.info(f"[{tenant.name}] Cycle completed: {stats.downloads_total} files, "
+                                f"{stats.records_extracted} records extracted")
+                    return True
+
+                logger.debug(f"[{tenant.name}] Cycle completed. No files to process")
+                return False
+            except Exception as e:
+                logger.error(f"[{tenant.name}] Error in processing cycle: {e}", exc_info=True)
+                handle_error(
+                    error=e,
+                    category=ErrorCategory.SYSTEM_RESOURCE,
+                    severity=ErrorSeverity.HIGH,
+                    component="JobRunner",
+                    operation="run_tenant",
+                    additional_data={"tenant": tenant.name}
+                )
+                return None
+            finally:
+                # Close the email digest window if it has elapsed, even on idle cycles
+                tenant.controller.email_notifier.flush_digest()
+
+    def run_all_once(self) -> Dict[str, Optional[bool]]:
+        """Run one cycle for every tenant concurrently and wait for all of them.
+
+        Returns:
+            Dict: Tenant name -> cycle outcome (see run_tenant)
+        """
+        with self._lock:
+            self._waiting_cycles += len(self.tenants)
+        futures = {
+            name: self._cycle_pool.submit(self._run_cycle, tenant)
+            for name, tenant in self.tenants.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+    def get_controllers(self) -> List[MainController]:
+        """Get the controllers of all tenants."""
+        return [tenant.controller for tenant in self.tenants.values()]
+
+    def start(self) -> None:
+        """Start scheduling all tenants."""
+        self.scheduler.start()
+        for name in self.tenants:
+            next_run = self.scheduler.get_next_run_time(name)
+            if next_run:
+                logger.info(f"[{name}] Next scheduled run: {next_run}")
+
+    def is_running(self) -> bool:
+        """Check if the runner's scheduler is running."""
+        return self.scheduler.is_running()
+
+    def stop(self) -> None:
+        """Stop scheduling, wait for running cycles and close pooled connections."""
+        if self.scheduler.is_running():
+            self.scheduler.stop()
+
+        self._cycle_pool.shutdown(wait=True)
+        self._action_pool.shutdown(wait=True)
+        self.connection_pool.close_all()
+
+        for tenant in self.tenants.values():
+            tenant.controller.email_notifier.flush_digest(force=True)
+
+        logger.info("JobRunner stopped")
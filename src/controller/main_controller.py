@@ -3,31 +3,33 @@
 import os
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from pathlib import Path
 
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from config.settings import ConfigManager
-from config.models import ProcessingStats, DownloadResult, ActionResult
+from config.models import ProcessingStats, DownloadResult, ActionResult, MedicalRecord
 from ftps.ftps_manager import FTPSManager, FTPSError
 from sftp.manager import SFTPManager, SFTPError
 from parser.document_parser import DocumentParser
-from utils.csv_generator import CSVGenerator
+from utils.csv_generator import CSVGenerator, CSVRecordSink
 from utils.date_folder_manager import DateFolderManager
 from utils.type_folder_scanner import TypeFolderScanner
 from utils.processing_log_creator import ProcessingLogCreator
 from utils.parallel_action_executor import ParallelActionExecutor
+from controller.shard_coordinator import ShardCoordinator, create_lease_store
 from email_notifier.notifier import EmailNotifier
 from utils.error_handler import (
     get_error_handler, handle_error, execute_with_retry,
     ErrorCategory, ErrorSeverity
 )
 from utils.logging_config import get_logging_manager
+from utils.log_sampler import get_sampled_logger, flush_log_summaries
+from utils.tracing import get_tracer
+from utils.metrics import CYCLES, LAST_SUCCESSFUL_CYCLE, FILES_SCANNED, DOCUMENTS_PARSED
 
 
 logger = logging.getLogger(__name__)
+sampled_logger = get_sampled_logger(logger, "controller")
 
 
 class ProcessingError(Exception):
@@ -38,12 +40,18 @@ class ProcessingError(Exception):
 class MainController:
     """Main controller that orchestrates the WebScribe FTPS workflow."""
     
-    def __init__(self, config_manager: ConfigManager, custom_date: Optional[datetime] = None):
+    def __init__(self, config_manager: ConfigManager, custom_date: Optional[datetime] = None,
+                 ftps_manager: Optional[FTPSManager] = None,
+                 sftp_manager: Optional[SFTPManager] = None,
+                 parallel_executor: Optional[ParallelActionExecutor] = None):
         """Initialize the main controller with all required components.
         
         Args:
             config_manager: Configuration manager instance
             custom_date: Optional custom date for processing (overrides config)
+            ftps_manager: Optional shared FTPS manager (e.g. one backed by a connection pool)
+            sftp_manager: Optional shared SFTP manager (e.g. one backed by a connection pool)
+            parallel_executor: Optional executor for post-processing actions
         """
         self.config_manager = config_manager
         self.custom_date = custom_date
@@ -57,11 +65,14 @@ class MainController:
         self.date_folder_config = config_manager.get_date_folder_config()
         
         # Initialize components
-        self.ftps_manager = FTPSManager()
-        self.sftp_manager = SFTPManager()
-        self.document_parser = DocumentParser()
+        self.ftps_manager = ftps_manager or FTPSManager()
+        self.sftp_manager = sftp_manager or SFTPManager()
+        self.document_parser = DocumentParser(config_manager.get_parser_config())
         self.csv_generator = CSVGenerator(self.storage_config, self.retention_config)
-        self.email_notifier = EmailNotifier(config_manager.get_email_config())
+        self.email_notifier = EmailNotifier(
+            config_manager.get_email_config(),
+            config_manager.get_digest_config()
+        )
         
         # Initialize WebScribe workflow components
         self.date_folder_manager = DateFolderManager(
@@ -70,11 +81,22 @@ class MainController:
         )
         self.type_folder_scanner = TypeFolderScanner(self.type_folder_config.folders)
         self.processing_log_creator = ProcessingLogCreator()
-        self.parallel_executor = ParallelActionExecutor(max_workers=3)
+        self.parallel_executor = parallel_executor or ParallelActionExecutor(max_workers=3)
+        
+        # Coordinated worker mode: type folders are leased from other nodes
+        self.shard_config = config_manager.get_shard_config()
+        self.shard_coordinator = None
+        if self.shard_config.enabled:
+            self.shard_coordinator = ShardCoordinator(
+                create_lease_store(self.shard_config),
+                self.shard_config,
+                self.type_folder_config.folders
+            )
         
         # Get performance logger
         self.logging_manager = get_logging_manager()
         self.performance_logger = self.logging_manager.get_performance_logger()
+        self.tracer = get_tracer()
         
         # Initialize backup directory
         self.backup_path = Path(self.storage_config.local_storage_path) / "folder-backup"
@@ -94,6 +116,8 @@ class MainController:
             ProcessingError: If critical processing errors occur
         """
         cycle_start_time = datetime.now()
+        cycle_span = self.tracer.start_span("cycle")
+        cycle_error = None
         logger.info("=" * 80)
         logger.info("Starting WebScribe processing cycle")
         logger.info("=" * 80)
@@ -104,11 +128,16 @@ class MainController:
             date_folder = self._create_date_folder()
             logger.info(f"Date folder created: {date_folder}")
             
+            if self.shard_coordinator is not None:
+                return self._run_sharded_cycle(date_folder, cycle_start_time, cycle_span)
+            
             # Step 2: Connect to WebScribe FTPS and scan type folders
             logger.info("Step 2: Connecting to WebScribe FTPS and scanning type folders")
             scan_results = self._scan_type_folders()
             
             total_files = sum(len(files) for files in scan_results.values())
+            cycle_span.set(files_scanned=total_files)
+            FILES_SCANNED.inc(total_files)
             logger.info(f"Scan complete: {total_files} files found across {len(scan_results)} type folders")
             
             if total_files == 0:
@@ -120,6 +149,7 @@ class MainController:
             download_results = self._download_files_to_date_folder(scan_results, date_folder)
             
             successful_downloads = sum(1 for d in download_results if d.success)
+            cycle_span.set(files_downloaded=successful_downloads)
             logger.info(f"Downloaded {successful_downloads}/{len(download_results)} files successfully")
             
             if successful_downloads == 0:
@@ -128,9 +158,10 @@ class MainController:
             
             # Step 4: Process documents and generate CSV
             logger.info("Step 4: Processing documents and generating CSV")
-            medical_records, csv_path = self._process_documents_and_generate_csv(date_folder)
+            records_extracted, csv_path = self._process_documents_and_generate_csv(date_folder)
             
-            logger.info(f"Processed {len(medical_records)} records, CSV generated: {csv_path}")
+            cycle_span.set(records_extracted=records_extracted)
+            logger.info(f"Processed {records_extracted} records, CSV generated: {csv_path}")
             
             # Step 5: Execute parallel actions (upload CSV, create log, send email)
             logger.info("Step 5: Executing parallel actions (CSV upload, log creation, email)")
@@ -141,7 +172,7 @@ class MainController:
                 start_time=cycle_start_time,
                 scan_results=scan_results,
                 download_results=download_results,
-                medical_records=medical_records,
+                records_extracted=records_extracted,
                 csv_path=csv_path
             )
             
@@ -160,7 +191,7 @@ class MainController:
             logger.info(f"Processing cycle completed successfully in {cycle_duration:.2f} seconds")
             logger.info(f"  • Files scanned: {total_files}")
             logger.info(f"  • Files downloaded: {successful_downloads}")
-            logger.info(f"  • Records extracted: {len(medical_records)}")
+            logger.info(f"  • Records extracted: {records_extracted}")
             logger.info(f"  • CSV generated: {os.path.basename(csv_path)}")
             logger.info(f"  • Upload status: {stats.upload_status}")
             logger.info(f"  • Email sent: {stats.email_sent}")
@@ -178,7 +209,7 @@ class MainController:
                     additional_data={
                         "files_scanned": total_files,
                         "files_downloaded": successful_downloads,
-                        "records_extracted": len(medical_records),
+                        "records_extracted": records_extracted,
                         "csv_filename": os.path.basename(csv_path),
                         "upload_status": stats.upload_status
                     }
@@ -187,6 +218,7 @@ class MainController:
             return stats
             
         except Exception as e:
+            cycle_error = e
             logger.error(f"Critical error in processing cycle: {e}", exc_info=True)
             
             handle_error(
@@ -210,6 +242,20 @@ class MainController:
                 logger.error(f"Failed to send failure notification: {email_error}")
             
             raise ProcessingError(f"Processing cycle failed: {e}")
+        
+        finally:
+            self.tracer.end_span(cycle_span, cycle_error)
+            
+            CYCLES.labels(outcome="failed" if cycle_error else "success").inc()
+            if cycle_error is None:
+                LAST_SUCCESSFUL_CYCLE.set(datetime.now().timestamp())
+            
+            # Summarize the per-file messages that were sampled out this cycle
+            flush_log_summaries()
+            
+            # Persist pattern hit counts so profiles accumulate across cycles and restarts
+            self.document_parser.save_pattern_profile()
+            self.document_parser.log_region_stats()
     
     def _create_date_folder(self) -> Path:
         """Create date folder for processing.
@@ -239,17 +285,22 @@ class MainController:
             )
             raise
     
-    def _scan_type_folders(self) -> dict:
+    def _scan_type_folders(self, type_folders: Optional[List[str]] = None) -> dict:
         """Scan all type folders on WebScribe FTPS.
         
+        Args:
+            type_folders: Subset of type folders to scan (defaults to all configured folders)
+            
         Returns:
             dict: Scan results mapping folder name to file list (filtered for document files only)
         """
         try:
-            with self.ftps_manager.connect_ftps(self.source_ftps_config) as ftps_client:
+            with self.tracer.span("scan") as scan_span, \
+                    self.ftps_manager.connect_ftps(self.source_ftps_config) as ftps_client:
                 scan_results = self.type_folder_scanner.scan_folders(
                     ftps_client,
-                    self.source_ftps_config.remote_path
+                    self.source_ftps_config.remote_path,
+                    type_folders
                 )
                 
                 # Log statistics before filtering
@@ -268,6 +319,8 @@ class MainController:
                     if len(files) != len(filtered_files):
                         logger.info(f"Filtered {type_folder}: {len(filtered_files)}/{len(files)} files are documents")
                 
+                scan_span.set(files_found=stats['total_files_found'], documents=total_filtered,
+                              bytes=stats['total_size_bytes'])
                 logger.info(f"Total files after filtering: {total_filtered} document files")
                 
                 return filtered_results
@@ -305,7 +358,8 @@ class MainController:
             target_date = None
         
         try:
-            with self.ftps_manager.connect_ftps(self.source_ftps_config) as ftps_client:
+            with self.tracer.span("download") as download_span, \
+                    self.ftps_manager.connect_ftps(self.source_ftps_config) as ftps_client:
                 for type_folder, files in scan_results.items():
                     if not files:
                         continue
@@ -317,9 +371,12 @@ class MainController:
                             file_date = file_info.mtime.date()
                             if file_date == target_date:
                                 filtered_files.append(file_info)
-                                logger.info(f"✓ File matches date: {file_info.filename} (modified: {file_info.mtime})")
+                                sampled_logger.info("file_matches_date", "✓ File matches date: %s (modified: %s)",
+                                                    file_info.filename, file_info.mtime)
                             else:
-                                logger.info(f"✗ File skipped (wrong date): {file_info.filename} (modified: {file_info.mtime}, expected: {target_date})")
+                                sampled_logger.info("file_skipped_wrong_date",
+                                                    "✗ File skipped (wrong date): %s (modified: %s, expected: %s)",
+                                                    file_info.filename, file_info.mtime, target_date)
                         
                         files = filtered_files
                         logger.info(f"Filtered to {len(files)} files matching date {target_date} from {type_folder}")
@@ -331,17 +388,23 @@ class MainController:
                     # Create type subfolder
                     type_subfolder = self.date_folder_manager.organize_by_type(date_folder, type_folder)
                     logger.info(f"Downloading {len(files)} files from {type_folder}")
+                    folder_span = self.tracer.start_span("download_folder", folder=type_folder, files=len(files))
                     
                     for file_info in files:
                         try:
                             # Download file
                             local_path = type_subfolder / file_info.filename
                             
-                            self.ftps_manager.download_file(
-                                ftps_client,
-                                file_info.full_path,
-                                str(local_path)
-                            )
+                            with self.tracer.span("file", filename=file_info.filename,
+                                                  bytes=file_info.size):
+                                self.ftps_manager.download_file(
+                                    ftps_client,
+                                    file_info.full_path,
+                                    str(local_path)
+                                )
+                            folder_span.add("bytes", file_info.size)
+                            download_span.add("bytes", file_info.size)
+                            download_span.add("files")
                             
                             download_results.append(DownloadResult(
                                 type_folder=type_folder,
@@ -354,6 +417,7 @@ class MainController:
                             logger.debug(f"✓ Downloaded: {type_folder}/{file_info.filename}")
                             
                         except Exception as e:
+                            download_span.add("failed")
                             logger.warning(f"✗ Failed to download {type_folder}/{file_info.filename}: {e}")
                             
                             download_results.append(DownloadResult(
@@ -375,6 +439,8 @@ class MainController:
                                     "filename": file_info.filename
                                 }
                             )
+                    
+                    self.tracer.end_span(folder_span)
             
             return download_results
             
@@ -390,103 +456,41 @@ class MainController:
             raise
     
     def _process_documents_and_generate_csv(self, date_folder: Path) -> tuple:
-        """Process all documents in date folder and generate CSV.
+        """Process all documents in date folder, streaming records into the CSV.
+        
+        Each record is written as soon as its document is parsed, so memory use
+        does not grow with the number of documents.
         
         Args:
             date_folder: Path to date folder
             
         Returns:
-            tuple: (list of medical records, path to CSV file)
+            tuple: (number of records written, path to CSV file)
         """
         try:
-            # Process all documents in date folder
-            logger.info("Processing documents from date folder")
-            medical_records = []
+            # Use date folder name for CSV filename (e.g., "2025-11-24" -> "20251124_output.csv")
+            csv_path = date_folder / f"{date_folder.name.replace('-', '')}_output.csv"
             
-            # Walk through all type subfolders
-            for type_subfolder in date_folder.iterdir():
-                if not type_subfolder.is_dir():
-                    continue
-                
-                logger.debug(f"Processing documents from {type_subfolder.name}")
+            # Process all documents in date folder, writing CSV directly to it
+            logger.info("Processing documents from date folder")
+            sink = CSVRecordSink(str(csv_path))
+            try:
+                # Walk through all type subfolders
+                for type_subfolder in sorted(date_folder.iterdir()):
+                    if type_subfolder.is_dir():
+                        sink.write_all(self._iter_type_subfolder_records(type_subfolder))
                 
-                # Process each document file
-                for doc_file in type_subfolder.iterdir():
-                    if doc_file.is_file() and doc_file.suffix.lower() in ['.doc', '.docx']:
-                        try:
-                            # Extract text
-                            text = self.document_parser.extract_text_from_document(str(doc_file))
-                            
-                            # Parse medical fields (even if text is empty, to include all files in CSV)
-                            record = self.document_parser.parse_medical_fields(text, doc_file.name)
-                            medical_records.append(record)
-                            logger.debug(f"✓ Processed: {doc_file.name}")
-                            
-                            if not text:
-                                logger.warning(f"⚠ No text extracted from: {doc_file.name} (included in CSV with available fields)")
-                                
-                        except Exception as e:
-                            logger.warning(f"✗ Failed to process {doc_file.name}: {e}")
-                            handle_error(
-                                error=e,
-                                category=ErrorCategory.DOCUMENT_PARSING,
-                                severity=ErrorSeverity.MEDIUM,
-                                component="MainController",
-                                operation="process_document",
-                                additional_data={"filename": doc_file.name}
-                            )
+                self._commit_csv(sink)
+            except BaseException:
+                sink.abort()
+                raise
             
-            logger.info(f"Extracted {len(medical_records)} medical records")
+            logger.info(f"Extracted {sink.rows} medical records")
+            if not sink.rows:
+                logger.warning("No medical records extracted, created CSV with headers only")
+            logger.info(f"CSV generated: {csv_path}")
             
-            # Generate CSV
-            if medical_records:
-                # Use date folder name for CSV filename (e.g., "2025-11-24" -> "20251124_output.csv")
-                date_folder_name = date_folder.name.replace('-', '')
-                csv_filename = f"{date_folder_name}_output.csv"
-                csv_path = date_folder / csv_filename
-                
-                # Write CSV directly to date folder
-                import csv
-                with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=self.csv_generator.CSV_COLUMNS)
-                    writer.writeheader()
-                    
-                    for record in medical_records:
-                        row_data = {
-                            'source_file': record.source_file,
-                            'first_name': record.first_name,
-                            'last_name': record.last_name,
-                            'date_of_birth': record.date_of_birth,
-                            'record_number': record.record_number,
-                            'case_number': record.case_number,
-                            'accident_date/Injury_date': record.accident_date,
-                            'provider_first': record.provider_first,
-                            'provider_last': record.provider_last,
-                            'exam_date': record.exam_date,
-                            'exam_place': record.exam_place,
-                            'transcriptionist': record.transcriptionist,
-                            'dd_date': record.dd_date,
-                            'transcription_date': record.transcription_date,
-                            'job_number': record.job_number,
-                            'case_code': record.case_code
-                        }
-                        writer.writerow(row_data)
-                
-                logger.info(f"CSV generated: {csv_path}")
-                
-                return medical_records, str(csv_path)
-            else:
-                logger.warning("No medical records extracted, creating empty CSV")
-                # Create empty CSV with headers
-                csv_filename = f"{date_folder.name.replace('-', '')}_output.csv"
-                csv_path = date_folder / csv_filename
-                
-                import csv
-                with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=self.csv_generator.CSV_COLUMNS)
-                    writer.writeheader()
-                
-                return [], str(csv_path)
+            return sink.rows, str(csv_path)
                 
         except Exception as e:
             logger.error(f"Failed to process documents and generate CSV: {e}")
@@ -499,6 +503,237 @@ class MainController:
             )
             raise
     
+    def _iter_type_subfolder_records(self, type_subfolder: Path) -> Iterator[MedicalRecord]:
+        """Extract and parse every document in one type subfolder.
+        
+        Args:
+            type_subfolder: Local folder holding one type folder's downloads
+            
+        Yields:
+            MedicalRecord: Parsed record per document (documents that fail are skipped)
+        """
+        logger.debug(f"Processing documents from {type_subfolder.name}")
+        
+        # Process each document file
+        for doc_file in sorted(type_subfolder.iterdir()):
+            if doc_file.is_file() and doc_file.suffix.lower() in ['.doc', '.docx']:
+                try:
+                    # Stream .docx paragraphs straight into the field extractor when enabled
+                    record = None
+                    if self.document_parser.parser_config.docx_streaming and doc_file.suffix.lower() == '.docx':
+                        with self.tracer.span("parse", filename=doc_file.name, streamed=True):
+                            record = self.document_parser.parse_docx_streaming(str(doc_file))
+                        if record is not None:
+                            DOCUMENTS_PARSED.labels(outcome="success").inc()
+                            logger.debug(f"✓ Processed (streamed): {doc_file.name}")
+                    
+                    if record is None:
+                        # Extract text
+                        with self.tracer.span("extract", filename=doc_file.name,
+                                              bytes=doc_file.stat().st_size) as extract_span:
+                            text = self.document_parser.extract_text_from_document(str(doc_file))
+                            extract_span.set(chars=len(text) if text else 0)
+                        
+                        # Parse medical fields (even if text is empty, to include all files in CSV)
+                        with self.tracer.span("parse", filename=doc_file.name):
+                            record = self.document_parser.parse_medical_fields(text, doc_file.name)
+                        DOCUMENTS_PARSED.labels(outcome="success" if text else "empty").inc()
+                        logger.debug(f"✓ Processed: {doc_file.name}")
+                        
+                        if not text:
+                            logger.warning(f"⚠ No text extracted from: {doc_file.name} (included in CSV with available fields)")
+                        
+                except Exception as e:
+                    DOCUMENTS_PARSED.labels(outcome="failed").inc()
+                    logger.warning(f"✗ Failed to process {doc_file.name}: {e}")
+                    handle_error(
+                        error=e,
+                        category=ErrorCategory.DOCUMENT_PARSING,
+                        severity=ErrorSeverity.MEDIUM,
+                        component="MainController",
+                        operation="process_document",
+                        additional_data={"filename": doc_file.name}
+                    )
+                    continue
+                
+                yield record
+    
+    def _commit_csv(self, sink: CSVRecordSink) -> None:
+        """Flush a record sink and rename its CSV into place, traced as the write stage."""
+        with self.tracer.span("write", rows=sink.rows) as write_span:
+            sink.close()
+            write_span.set(bytes=sink.size)
+    
+    def _run_sharded_cycle(self, date_folder: Path, cycle_start_time: datetime, cycle_span) -> ProcessingStats:
+        """Process the type folders this node leases, then merge if every shard is done.
+        
+        Args:
+            date_folder: Path to date folder
+            cycle_start_time: Processing start time
+            cycle_span: Span of the current cycle
+            
+        Returns:
+            ProcessingStats: Merged statistics if this node merged the date, otherwise
+                             statistics for the shards this node processed
+        """
+        date_key = date_folder.name
+        download_results = []
+        shards_processed = 0
+        
+        for type_folder in self.shard_coordinator.claim_folders(date_key):
+            with self.tracer.span("shard", folder=type_folder):
+                shard_downloads = self._process_shard(date_folder, type_folder)
+            if shard_downloads is not None:
+                shards_processed += 1
+                download_results.extend(shard_downloads)
+        
+        cycle_span.set(shards_processed=shards_processed)
+        logger.info(f"Processed {shards_processed} shards on node {self.shard_coordinator.node_id}")
+        
+        if download_results:
+            self._backup_date_folder(date_folder)
+        
+        shard_results = self.shard_coordinator.acquire_merge(date_key)
+        if shard_results is None:
+            stats = self._build_empty_stats(date_folder, cycle_start_time)
+            stats.set_downloads(download_results)
+            stats.upload_status = "N/A - Merge pending"
+            return stats
+        
+        try:
+            return self._merge_shards(date_folder, cycle_start_time, shard_results)
+        except Exception:
+            self.shard_coordinator.release_merge(date_key)
+            raise
+    
+    def _process_shard(self, date_folder: Path, type_folder: str) -> Optional[List[DownloadResult]]:
+        """Scan, download and parse one leased type folder into its shared part CSV.
+        
+        Args:
+            date_folder: Path to date folder
+            type_folder: Leased type folder
+            
+        Returns:
+            List[DownloadResult]: Download results, or None if the shard failed
+                                  (its lease is released so it is retried)
+        """
+        date_key = date_folder.name
+        
+        try:
+            with self.shard_coordinator.heartbeat(date_key, type_folder) as heartbeat:
+                scan_results = self._scan_type_folders([type_folder])
+                download_results = self._download_files_to_date_folder(scan_results, date_folder)
+                if heartbeat.lost:
+                    raise ProcessingError(f"Lease on shard {type_folder} was lost")
+                
+                sink = CSVRecordSink(str(self.shard_coordinator.part_path(date_key, type_folder)))
+                try:
+                    type_subfolder = date_folder / type_folder
+                    if any(d.success for d in download_results) and type_subfolder.is_dir():
+                        sink.write_all(self._iter_type_subfolder_records(type_subfolder))
+                    # Another node may have taken the folder over; its part must not be replaced
+                    if heartbeat.lost or not self.shard_coordinator.renew(date_key, type_folder):
+                        raise ProcessingError(f"Lease on shard {type_folder} was lost")
+                    self._commit_csv(sink)
+                except BaseException:
+                    sink.abort()
+                    raise
+            
+            # Only counts and file names: the summary is stored with the lease
+            summary = {
+                "node": self.shard_coordinator.node_id,
+                "files_found": len(scan_results.get(type_folder, [])),
+                "records": sink.rows,
+                "bytes_downloaded": sum(d.size for d in download_results if d.success),
+                "downloaded": [d.filename for d in download_results if d.success],
+                "failed": [d.filename for d in download_results if not d.success]
+            }
+            if not self.shard_coordinator.complete(date_key, type_folder, summary):
+                raise ProcessingError(f"Lease on shard {type_folder} was lost")
+            
+            logger.info(f"Shard {type_folder} done: {len(download_results)} files, "
+                        f"{sink.rows} records")
+            return download_results
+            
+        except Exception as e:
+            logger.error(f"Shard {type_folder} failed, releasing its lease: {e}")
+            self.shard_coordinator.release(date_key, type_folder)
+            handle_error(
+                error=e,
+                category=ErrorCategory.FILE_PROCESSING,
+                severity=ErrorSeverity.HIGH,
+                component="MainController",
+                operation="process_shard",
+                additional_data={"type_folder": type_folder, "date_folder": date_key}
+            )
+            return None
+    
+    def _merge_shards(self, date_folder: Path, start_time: datetime,
+                      shard_results: dict) -> ProcessingStats:
+        """Merge all part CSVs of a date into its output CSV and run the final actions.
+        
+        Args:
+            date_folder: Path to date folder
+            start_time: Processing start time
+            shard_results: Type folder -> summary recorded by the node that processed it
+            
+        Returns:
+            ProcessingStats: Statistics across all shards
+        """
+        date_key = date_folder.name
+        # Shard summaries carry file names only; per-file sizes are not known here
+        download_results = []
+        for folder, summary in shard_results.items():
+            download_results.extend(DownloadResult(folder, filename, 0, True)
+                                    for filename in summary.get("downloaded", []))
+            download_results.extend(DownloadResult(folder, filename, 0, False,
+                                                   f"Failed on node {summary.get('node', 'unknown')}")
+                                    for filename in summary.get("failed", []))
+        
+        if not any(d.success for d in download_results):
+            logger.info(f"All shards of {date_key} done; no files downloaded, nothing to merge")
+            self.shard_coordinator.finish_merge(date_key)
+            return self._build_empty_stats(date_folder, start_time)
+        
+        logger.info(f"All shards of {date_key} done; merging {len(shard_results)} parts")
+        csv_path = date_folder / f"{date_key.replace('-', '')}_output.csv"
+        part_paths = [str(self.shard_coordinator.part_path(date_key, folder)) for folder in shard_results]
+        with self.tracer.span("merge", parts=len(part_paths)) as merge_span:
+            records_merged = self.csv_generator.merge_csv_files(part_paths, str(csv_path))
+            merge_span.set(rows=records_merged, bytes=csv_path.stat().st_size)
+        
+        errors = [
+            f"Download failed: {d.type_folder}/{d.filename} - {d.error_message}"
+            for d in download_results if not d.success and d.error_message
+        ]
+        stats = ProcessingStats(
+            date_folder=date_key,
+            start_time=start_time.isoformat(),
+            end_time=datetime.now().isoformat(),
+            type_folders_scanned={folder: summary.get("files_found", 0)
+                                  for folder, summary in shard_results.items()},
+            files_downloaded=download_results,
+            documents_processed=len(download_results),
+            records_extracted=records_merged,
+            csv_filename=csv_path.name,
+            csv_size=csv_path.stat().st_size,
+            upload_status="Pending",
+            log_filename="",
+            email_sent=False,
+            errors=errors
+        )
+        stats.bytes_downloaded = sum(summary.get("bytes_downloaded", 0) for summary in shard_results.values())
+        
+        action_results = self._execute_parallel_actions(date_folder, str(csv_path), stats)
+        stats.upload_status = self._get_upload_status(action_results)
+        stats.email_sent = self._get_email_status(action_results)
+        stats.log_filename = self._get_log_filename(action_results, date_folder)
+        stats.end_time = datetime.now().isoformat()
+        
+        self.shard_coordinator.finish_merge(date_key)
+        logger.info(f"Merged output {csv_path.name}: {records_merged} records, upload status: {stats.upload_status}")
+        return stats
+    
     def _execute_parallel_actions(self, date_folder: Path, csv_path: str, stats: ProcessingStats) -> List[ActionResult]:
         """Execute CSV upload, log creation, and email notification in parallel.
         
@@ -510,13 +745,22 @@ class MainController:
         Returns:
             List[ActionResult]: Results of parallel actions
         """
+        # Actions run on worker threads, so their spans name the cycle span explicitly
+        parent_span = self.tracer.current_span()
+        
+        def upload_csv():
+            with self.tracer.span("upload", parent=parent_span, bytes=os.path.getsize(csv_path)):
+                self.parallel_executor.upload_csv_action(csv_path, self.sftp_manager, self.dest_sftp_config)
+        
+        def send_email():
+            with self.tracer.span("email", parent=parent_span):
+                self.parallel_executor.send_email_action(stats, self.email_notifier)
+        
         # First, execute upload and log creation in parallel
         initial_actions = [
             {
                 'name': 'upload_csv',
-                'function': lambda: self.parallel_executor.upload_csv_action(
-                    csv_path, self.sftp_manager, self.dest_sftp_config
-                )
+                'function': upload_csv
             },
             {
                 'name': 'create_log',
@@ -535,9 +779,7 @@ class MainController:
         # Now send email with updated stats
         email_action = {
             'name': 'send_email',
-            'function': lambda: self.parallel_executor.send_email_action(
-                stats, self.email_notifier
-            )
+            'function': send_email
         }
         
         email_result = self.parallel_executor.execute_parallel([email_action])
@@ -553,7 +795,7 @@ class MainController:
     
     def _build_processing_stats(self, date_folder: Path, start_time: datetime, 
                                 scan_results: dict, download_results: List[DownloadResult],
-                                medical_records: list, csv_path: str) -> ProcessingStats:
+                                records_extracted: int, csv_path: str) -> ProcessingStats:
         """Build processing statistics object.
         
         Args:
@@ -561,7 +803,7 @@ class MainController:
             start_time: Processing start time
             scan_results: Type folder scan results
             download_results: File download results
-            medical_records: Extracted medical records
+            records_extracted: Number of records written to the CSV
             csv_path: Path to generated CSV
             
         Returns:
@@ -586,7 +828,7 @@ class MainController:
             type_folders_scanned=type_folders_scanned,
             files_downloaded=download_results,
             documents_processed=len(download_results),
-            records_extracted=len(medical_records),
+            records_extracted=records_extracted,
             csv_filename=os.path.basename(csv_path),
             csv_size=csv_size,
             upload_status="Pending",
@@ -0,0 +1,210 @@
+"""Coordination of type folder shards across worker nodes."""
+
+import os
+import socket
+import logging
+import importlib
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from config.models import ShardConfig
+from utils.lease_store import LeaseStore, SQLiteLeaseStore, LEASE_DONE
+
+
+logger = logging.getLogger(__name__)
+
+
+def create_lease_store(shard_config: ShardConfig) -> LeaseStore:
+    """Create the lease store configured for sharding.
+
+    Args:
+        shard_config: Sharding configuration
+
+    Returns:
+        LeaseStore: 'sqlite' gives a SQLiteLeaseStore on lease_db_path; a
+            'package.module:ClassName' backend is instantiated with the config
+    """
+    if shard_config.lease_backend == "sqlite":
+        return SQLiteLeaseStore(shard_config.lease_db_path)
+
+    module_name, _, class_name = shard_config.lease_backend.partition(":")
+    backend_class = getattr(importlib.import_module(module_name), class_name)
+    return backend_class(shard_config)
+
+
+class LeaseHeartbeat:
+    """Renews a shard lease on a background thread while the shard is in progress.
+
+    Downloading and parsing a large folder can outlast the lease TTL, after
+    which another node would take the folder over and process it again. The
+    heartbeat renews the lease every `interval` seconds and records when
+    renewal fails, so the owner can stop before committing its part CSV.
+    """
+
+    def __init__(self, coordinator: "ShardCoordinator", date_key: str, type_folder: str, interval: float):
+        """Initialize the heartbeat and start its thread.
+
+        Args:
+            coordinator: Coordinator holding the lease
+            date_key: Date folder name (YYYY-MM-DD)
+            type_folder: Leased type folder
+            interval: Seconds between renewals
+        """
+        self.coordinator = coordinator
+        self.date_key = date_key
+        self.type_folder = type_folder
+        self.interval = interval
+        self.lost = False
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"LeaseHeartbeat-{type_folder}", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Renew the lease until stopped or lost."""
+        while not self._stop.wait(self.interval):
+            try:
+                if not self.coordinator.renew(self.date_key, self.type_folder):
+                    self.lost = True
+                    logger.warning(f"Lease on shard {self.type_folder} for {self.date_key} was lost")
+                    return
+            except Exception as e:
+                # A busy or briefly unreachable store is retried at the next beat
+                logger.warning(f"Failed to renew lease on shard {self.type_folder}: {e}")
+
+    def stop(self) -> None:
+        """Stop renewing and wait for the thread to finish."""
+        self._stop.set()
+        self._thread.join()
+
+
+class ShardCoordinator:
+    """Splits a date's type folders between nodes and elects the node that merges.
+
+    Each node claims type folders one at a time through the lease store, so
+    faster nodes naturally take more folders. A node writes the records of a
+    folder it processed to a part CSV on shared storage and marks the folder
+    done. Once every folder of the date is done, one node takes the merge
+    lease, concatenates the parts into the date's output CSV, uploads it and
+    clears the date's leases so the next round starts from scratch.
+    """
+
+    MERGE_KEY = "__merge__"
+
+    def __init__(self, lease_store: LeaseStore, shard_config: ShardConfig, type_folders: List[str]):
+        """Initialize the coordinator.
+
+        Args:
+            lease_store: Shared lease store
+            shard_config: Sharding configuration
+            type_folders: Type folders that make up the shards, in output order
+        """
+        self.lease_store = lease_store
+        self.shard_config = shard_config
+        self.type_folders = list(type_folders)
+        self.node_id = shard_config.node_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.shared_path = Path(shard_config.shared_path)
+        self.ttl = shard_config.lease_ttl_seconds
+
+        logger.info(f"Sharding enabled: node {self.node_id}, {len(self.type_folders)} type folder shards, "
+                    f"shared path {self.shared_path}")
+
+    def _scope(self, date_key: str) -> str:
+        """Lease scope for a date, namespaced by shard group."""
+        return f"{self.shard_config.group}/{date_key}"
+
+    def claim_folders(self, date_key: str) -> Iterator[str]:
+        """Yield the type folders this node wins leases on, claiming one at a time.
+
+        Args:
+            date_key: Date folder name (YYYY-MM-DD)
+
+        Yields:
+            str: Type folder now leased by this node
+        """
+        scope = self._scope(date_key)
+        for type_folder in self.type_folders:
+            if self.lease_store.acquire(scope, type_folder, self.node_id, self.ttl):
+                logger.info(f"Leased shard {type_folder} for {date_key}")
+                yield type_folder
+
+    def renew(self, date_key: str, type_folder: str) -> bool:
+        """Extend this node's lease on a type folder (False if it was lost)."""
+        return self.lease_store.renew(self._scope(date_key), type_folder, self.node_id, self.ttl)
+
+    @contextmanager
+    def heartbeat(self, date_key: str, type_folder: str) -> Iterator[LeaseHeartbeat]:
+        """Keep a type folder's lease renewed (every third of the TTL) for the duration of a block.
+
+        Args:
+            date_key: Date folder name (YYYY-MM-DD)
+            type_folder: Leased type folder
+
+        Yields:
+            LeaseHeartbeat: Heartbeat whose `lost` flag is set if renewal failed
+        """
+        heartbeat = LeaseHeartbeat(self, date_key, type_folder, max(1.0, self.ttl / 3))
+        try:
+            yield heartbeat
+        finally:
+            heartbeat.stop()
+
+    def release(self, date_key: str, type_folder: str) -> None:
+        """Give a type folder back so another node or cycle retries it."""
+        self.lease_store.release(self._scope(date_key), type_folder, self.node_id)
+
+    def complete(self, date_key: str, type_folder: str, summary: Dict[str, Any]) -> bool:
+        """Mark a type folder done with a summary of its results.
+
+        Returns:
+            bool: False if the lease had been lost to another node
+        """
+        return self.lease_store.complete(self._scope(date_key), type_folder, self.node_id, summary)
+
+    def part_path(self, date_key: str, type_folder: str) -> Path:
+        """Shared path of the part CSV for a type folder."""
+        return self.shared_path / self.shard_config.group / date_key / f"part_{type_folder}.csv"
+
+    def acquire_merge(self, date_key: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Take the merge lease if every type folder of the date is done.
+
+        Args:
+            date_key: Date folder name (YYYY-MM-DD)
+
+        Returns:
+            Dict: Type folder -> summary recorded by the node that processed it,
+                  or None if shards are still pending or another node is merging
+        """
+        scope = self._scope(date_key)
+        status = self.lease_store.get_status(scope)
+
+        pending = [folder for folder in self.type_folders
+                   if status.get(folder, {}).get("state") != LEASE_DONE]
+        if pending:
+            logger.info(f"{len(pending)} shards still pending for {date_key}: {', '.join(pending)}")
+            return None
+
+        if not self.lease_store.acquire(scope, self.MERGE_KEY, self.node_id, self.ttl):
+            logger.info(f"Another node is merging {date_key}")
+            return None
+
+        return {folder: status[folder].get("result") or {} for folder in self.type_folders}
+
+    def release_merge(self, date_key: str) -> None:
+        """Give up the merge lease so the merge is retried."""
+        self.lease_store.release(self._scope(date_key), self.MERGE_KEY, self.node_id)
+
+    def finish_merge(self, date_key: str) -> None:
+        """Delete the date's part CSVs and clear its leases for the next round."""
+        for type_folder in self.type_folders:
+            part = self.part_path(date_key, type_folder)
+            try:
+                if part.exists():
+                    part.unlink()
+            except OSError as e:
+                logger.warning(f"Failed to remove shard part {part}: {e}")
+
+        self.lease_store.clear_scope(self._scope(date_key))
+        logger.info(f"Merge of {date_key} finished; shard leases cleared")
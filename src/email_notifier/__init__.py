@@ -1,5 +1,6 @@
 # Email notification module
 
 from .notifier import EmailNotifier, EmailNotificationError
+from .digest import NotificationDigest
 
-__all__ = ['EmailNotifier', 'EmailNotificationError']
\ No newline at end of file
+__all__ = ['EmailNotifier', 'EmailNotificationError', 'NotificationDigest']
\ No newline at end of file
@@ -0,0 +1,282 @@
+"""Notification digest for coalescing high-frequency processing emails."""
+
+import re
+import time
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+@dataclass
+class DigestFailure:
+    """A deduplicated failure tracked within a digest window."""
+    signature: str
+    zip_filename: str
+    error_message: str
+    document_name: Optional[str] = None
+    first_seen: datetime = field(default_factory=datetime.now)
+    last_seen: datetime = field(default_factory=datetime.now)
+    count: int = 0
+    suppressed: int = 0  # Occurrences not sent as immediate emails
+
+
+@dataclass
+class DigestSnapshot:
+    """Rolled-up contents of a closed digest window."""
+    window_start: datetime
+    window_end: datetime
+    cycles: int
+    date_folders: List[str]
+    downloads_successful: int
+    downloads_failed: int
+    documents_processed: int
+    records_extracted: int
+    csv_filenames: List[str]
+    upload_statuses: Dict[str, int]
+    errors: Dict[str, int]
+    failures: List[DigestFailure]
+
+
+class NotificationDigest:
+    """Aggregates processing statistics and failures over a fixed time window.
+
+    Processing cycles and repeated failures are folded into running totals
+    instead of producing one email each. Identical errors are deduplicated by
+    a normalized signature (digits collapsed) so that retries and per-file
+    variants of the same fault count as one entry.
+    """
+
+    def __init__(self, window_seconds: int = 3600):
+        """Initialize the digest.
+
+        Args:
+            window_seconds: Length of each digest window in seconds
+        """
+        self.window_seconds = window_seconds
+        self._lock = threading.Lock()
+
+        # Failure signatures sent immediately -> monotonic time of that send
+        self._immediate_sent: Dict[str, float] = {}
+
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        """Start a new, empty digest window."""
+        self._window_start = datetime.now()
+        self._window_started_at = time.monotonic()
+        self._cycles = 0
+        self._date_folders: List[str] = []
+        self._downloads_successful = 0
+        self._downloads_failed = 0
+        self._documents_processed = 0
+        self._records_extracted = 0
+        self._csv_filenames: List[str] = []
+        self._upload_statuses: Dict[str, int] = {}
+        self._errors: Dict[str, List] = {}  # signature -> [first message, count]
+        self._failures: Dict[str, DigestFailure] = {}
+
+    @staticmethod
+    def make_signature(*parts: Optional[str]) -> str:
+        """Build a deduplication signature for an error.
+
+        Numbers are collapsed so that messages differing only by counters,
+        ports, sizes or timestamps map to the same signature.
+
+        Args:
+            parts: Text fragments identifying the error
+
+        Returns:
+            str: Normalized signature
+        """
+        text = "|".join(p for p in parts if p)
+        text = re.sub(r'\d+', '#', text.lower())
+        return re.sub(r'\s+', ' ', text).strip()
+
+    def add_processing_stats(self, stats) -> None:
+        """Fold a processing cycle's statistics into the current window.
+
+        Args:
+            stats: ProcessingStats object for a completed cycle
+        """
+        with self._lock:
+            self._cycles += 1
+            if stats.date_folder and stats.date_folder not in self._date_folders:
+                self._date_folders.append(stats.date_folder)
+            self._downloads_successful += stats.downloads_succeeded
+            self._downloads_failed += stats.downloads_failed
+            self._documents_processed += stats.documents_processed
+            self._records_extracted += stats.records_extracted
+            if stats.csv_filename and stats.csv_filename not in self._csv_filenames:
+                self._csv_filenames.append(stats.csv_filename)
+
+            upload_status = "SUCCESS" if 'SUCCESS' in (stats.upload_status or '') else (stats.upload_status or "UNKNOWN")
+            self._upload_statuses[upload_status] = self._upload_statuses.get(upload_status, 0) + 1
+
+            for error in stats.errors:
+                signature = self.make_signature(error)
+                entry = self._errors.setdefault(signature, [error, 0])
+                entry[1] += 1
+
+    def record_failure(self, zip_filename: str, error_message: str,
+                       document_name: Optional[str] = None) -> bool:
+        """Record a failure and decide whether it warrants an immediate email.
+
+        A failure is sent immediately only on its first occurrence; repeats of
+        the same signature within the window are aggregated into the digest.
+
+        Args:
+            zip_filename: Name of the ZIP file or workflow being processed
+            error_message: Description of the error that occurred
+            document_name: Optional name of specific document that failed
+
+        Returns:
+            bool: True if this is a first occurrence that should be sent now
+        """
+        signature = self.make_signature(zip_filename, error_message)
+        now = datetime.now()
+        now_monotonic = time.monotonic()
+
+        with self._lock:
+            failure = self._failures.get(signature)
+            if failure is None:
+                failure = DigestFailure(
+                    signature=signature,
+                    zip_filename=zip_filename,
+                    error_message=error_message,
+                    document_name=document_name,
+                    first_seen=now,
+                    last_seen=now
+                )
+                self._failures[signature] = failure
+            failure.count += 1
+            failure.last_seen = now
+
+            last_sent = self._immediate_sent.get(signature)
+            if last_sent is not None and now_monotonic - last_sent < self.window_seconds:
+                failure.suppressed += 1
+                return False
+
+            self._immediate_sent[signature] = now_monotonic
+            return True
+
+    def is_due(self) -> bool:
+        """Check whether the current window has elapsed.
+
+        Returns:
+            bool: True if the window is over and should be flushed
+        """
+        return time.monotonic() - self._window_started_at >= self.window_seconds
+
+    def drain(self) -> Optional[DigestSnapshot]:
+        """Close the current window and return its contents.
+
+        Returns:
+            DigestSnapshot for the closed window, or None if nothing was recorded
+        """
+        with self._lock:
+            # Failures that were only ever sent immediately need no digest entry
+            repeated_failures = [f for f in self._failures.values() if f.suppressed > 0]
+
+            snapshot = None
+            if self._cycles or repeated_failures:
+                snapshot = DigestSnapshot(
+                    window_start=self._window_start,
+                    window_end=datetime.now(),
+                    cycles=self._cycles,
+                    date_folders=list(self._date_folders),
+                    downloads_successful=self._downloads_successful,
+                    downloads_failed=self._downloads_failed,
+                    documents_processed=self._documents_processed,
+                    records_extracted=self._records_extracted,
+                    csv_filenames=list(self._csv_filenames),
+                    upload_statuses=dict(self._upload_statuses),
+                    errors={message: count for message, count in self._errors.values()},
+                    failures=sorted(repeated_failures, key=lambda f: f.count, reverse=True)
+                )
+
+            # Forget immediate-send markers older than one window
+            cutoff = time.monotonic() - self.window_seconds
+            self._immediate_sent = {
+                sig: sent for sig, sent in self._immediate_sent.items() if sent >= cutoff
+            }
+
+            self._reset_window()
+            return snapshot
+
+    def build_html_body(self, snapshot: DigestSnapshot) -> str:
+        """Build the HTML body for a digest email.
+
+        Args:
+            snapshot: Closed digest window
+
+        Returns:
+            str: HTML formatted email body
+        """
+        total_downloads = snapshot.downloads_successful + snapshot.downloads_failed
+        download_rate = (snapshot.downloads_successful / total_downloads * 100) if total_downloads > 0 else 0
+
+        html = f"""
+        <html>
+        <head></head>
+        <body>
+            <h2>Dictation Job ID Processing Digest</h2>
+            <p><strong>Window:</strong> {snapshot.window_start.strftime('%Y-%m-%d %H:%M:%S')} - {snapshot.window_end.strftime('%Y-%m-%d %H:%M:%S')}</p>
+
+            <h3>Overall Statistics</h3>
+            <ul>
+                <li><strong>Processing cycles:</strong> {snapshot.cycles}</li>
+                <li><strong>Date folders:</strong> {', '.join(snapshot.date_folders) or 'N/A'}</li>
+                <li><strong>Downloads:</strong> {snapshot.downloads_successful}/{total_downloads} successful ({download_rate:.1f}%)</li>
+                <li><strong>Documents processed:</strong> {snapshot.documents_processed}</li>
+                <li><strong>Records extracted:</strong> {snapshot.records_extracted}</li>
+                <li><strong>CSV files:</strong> {', '.join(snapshot.csv_filenames) or 'N/A'}</li>
+            </ul>
+        """
+
+        if snapshot.upload_statuses:
+            html += "<h3>Upload Status</h3><ul>"
+            for status, count in sorted(snapshot.upload_statuses.items()):
+                html += f"<li>{status}: {count}</li>"
+            html += "</ul>"
+
+        if snapshot.failures:
+            html += """
+            <h3 style="color: red;">Repeated Failures</h3>
+            <table border="1" cellpadding="5" cellspacing="0" style="border-collapse: collapse;">
+                <tr style="background-color: #f0f0f0;">
+                    <th>Source</th>
+                    <th>Error</th>
+                    <th>Occurrences</th>
+                    <th>First Seen</th>
+                    <th>Last Seen</th>
+                </tr>
+            """
+            for failure in snapshot.failures:
+                html += f"""
+                <tr>
+                    <td>{failure.zip_filename}</td>
+                    <td>{failure.error_message}</td>
+                    <td>{failure.count}</td>
+                    <td>{failure.first_seen.strftime('%H:%M:%S')}</td>
+                    <td>{failure.last_seen.strftime('%H:%M:%S')}</td>
+                </tr>
+                """
+            html += "</table>"
+
+        if snapshot.errors:
+            html += "<h3>Errors and Warnings</h3><ul>"
+            top_errors = sorted(snapshot.errors.items(), key=lambda item: item[1], reverse=True)
+            for message, count in top_errors[:10]:
+                html += f"<li>{message} (x{count})</li>"
+            if len(top_errors) > 10:
+                html += f"<li><em>... and {len(top_errors) - 10} more distinct errors</em></li>"
+            html += "</ul>"
+
+        html += """
+            <p><em>This is an automated digest from the Medical Document Processing System.</em></p>
+        </body>
+        </html>
+        """
+
+        return html
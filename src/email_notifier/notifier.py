@@ -1,6 +1,5 @@
 """Email notification system for the medical document processing system."""
 
-import smtplib
 import logging
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -8,12 +7,14 @@ from typing import List, Optional
 from datetime import datetime
 import time
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from config.models import EmailConfig, ProcessingResult
+from config.models import EmailConfig, DigestConfig, ProcessingResult
 from utils.error_handler import handle_error, ErrorCategory, ErrorSeverity
+from email_notifier.digest import NotificationDigest
+from utils.lazy_import import lazy_import
+
+
+# Imported when the first email is sent rather than at startup
+smtplib = lazy_import("smtplib")
 
 
 class EmailNotificationError(Exception):
@@ -24,14 +25,21 @@ class EmailNotificationError(Exception):
 class EmailNotifier:
     """Handles email notifications for processing results and failures."""
     
-    def __init__(self, config: EmailConfig):
+    def __init__(self, config: EmailConfig, digest_config: Optional[DigestConfig] = None):
         """Initialize the email notifier with configuration.
         
         Args:
             config: Email configuration containing SMTP settings
+            digest_config: Optional digest configuration; when enabled, cycle
+                summaries and repeated failures are coalesced into one email per window
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
+        
+        self.digest = None
+        if digest_config and digest_config.enabled:
+            self.digest = NotificationDigest(digest_config.window_seconds)
+            self.logger.info(f"Email digest mode enabled (window: {digest_config.window_seconds} seconds)")
     
     def send_success_summary(self, results: List[ProcessingResult]) -> bool:
         """Send a success summary email with processing statistics.
@@ -73,8 +81,14 @@ class EmailNotifier:
             document_name: Optional name of specific document that failed
             
         Returns:
-            bool: True if email was sent successfully, False otherwise
+            bool: True if email was sent successfully (or folded into the digest), False otherwise
         """
+        # In digest mode only the first occurrence of a failure is sent immediately
+        if self.digest and not self.digest.record_failure(zip_filename, error_message, document_name):
+            self.logger.info(f"Repeated failure for {zip_filename} added to email digest")
+            self.flush_digest()
+            return True
+        
         try:
             subject = f"URGENT: Medical Document Processing Failure - {zip_filename}"
             body = self._generate_failure_notification_body(
@@ -413,8 +427,14 @@ class EmailNotifier:
             stats: ProcessingStats object with processing statistics
             
         Returns:
-            bool: True if email was sent successfully, False otherwise
+            bool: True if email was sent successfully (or folded into the digest), False otherwise
         """
+        if self.digest:
+            self.digest.add_processing_stats(stats)
+            self.logger.info(f"Processing stats for {stats.date_folder} added to email digest")
+            self.flush_digest()
+            return True
+        
         try:
             subject = f"Dictation Job ID Processing Complete - {stats.date_folder}"
             
@@ -443,6 +463,48 @@ class EmailNotifier:
             )
             return False
     
+    def flush_digest(self, force: bool = False) -> bool:
+        """Send the rolled-up digest email if the current window has elapsed.
+        
+        Args:
+            force: Send whatever has been collected even if the window is still open
+            
+        Returns:
+            bool: True if a digest email was sent successfully, False otherwise
+        """
+        if not self.digest or not (force or self.digest.is_due()):
+            return False
+        
+        snapshot = self.digest.drain()
+        if snapshot is None:
+            self.logger.debug("Email digest window closed with nothing to report")
+            return False
+        
+        try:
+            subject = (f"Dictation Job ID Processing Digest - "
+                       f"{snapshot.window_start.strftime('%Y-%m-%d %H:%M')} to "
+                       f"{snapshot.window_end.strftime('%H:%M')}")
+            body = self.digest.build_html_body(snapshot)
+            
+            recipients = self.config.admin_emails if self.config.admin_emails else [self.config.admin_email]
+            
+            return self._send_email_to_multiple(
+                to_emails=recipients,
+                subject=subject,
+                body=body,
+                is_html=True
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to send email digest: {e}")
+            handle_error(
+                error=e,
+                category=ErrorCategory.EMAIL_NOTIFICATION,
+                severity=ErrorSeverity.MEDIUM,
+                component="EmailNotifier",
+                operation="flush_digest"
+            )
+            return False
+    
     def _build_webscribe_html_body(self, stats) -> str:
         """Build HTML email body for WebScribe workflow.
         
@@ -463,8 +525,8 @@ class EmailNotifier:
             duration_str = "N/A"
         
         # Calculate success rate
-        successful_downloads = sum(1 for d in stats.files_downloaded if d.success)
-        total_downloads = len(stats.files_downloaded)
+        successful_downloads = stats.downloads_succeeded
+        total_downloads = stats.downloads_total
         download_rate = (successful_downloads / total_downloads * 100) if total_downloads > 0 else 0
         
         # Build HTML
@@ -528,12 +590,8 @@ class EmailNotifier:
                         </tr>
         """
         
-        # Calculate downloaded files per type folder (converted files)
-        downloaded_per_folder = {}
-        for download in stats.files_downloaded:
-            if download.success:
-                folder = download.type_folder
-                downloaded_per_folder[folder] = downloaded_per_folder.get(folder, 0) + 1
+        # Downloaded files per type folder (converted files)
+        downloaded_per_folder = stats.downloads_by_folder
         
         # Add type folder rows showing converted/downloaded files
         for folder in sorted(stats.type_folders_scanned.keys()):
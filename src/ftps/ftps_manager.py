@@ -7,14 +7,12 @@ from ftplib import FTP_TLS, error_perm, error_temp
 from datetime import datetime
 from typing import List, Optional
 from contextlib import contextmanager
-from dataclasses import dataclass
 from pathlib import Path
 
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from config.models import FTPSConfig
+from config.models import FTPSConfig, FileInfo
 from utils.error_handler import handle_error, ErrorCategory, ErrorSeverity
+from utils.connection_pool import ConnectionPool
+from utils.metrics import FILES_TRANSFERRED, BYTES_TRANSFERRED, TRANSFER_RETRIES
 
 
 logger = logging.getLogger(__name__)
@@ -35,29 +33,21 @@ class FTPSFileError(FTPSError):
     pass
 
 
-@dataclass
-class FileInfo:
-    """Information about a remote file."""
-    filename: str
-    full_path: str
-    size: int
-    mtime: datetime
-    is_directory: bool = False
-
-
 class FTPSManager:
     """Manages FTPS connections and file operations with TLS support and retry logic."""
     
-    def __init__(self, max_retries: int = 3, retry_delay: float = 1.0):
+    def __init__(self, max_retries: int = 3, retry_delay: float = 1.0,
+                 connection_pool: Optional[ConnectionPool] = None):
         """Initialize FTPS manager.
         
         Args:
             max_retries: Maximum number of retry attempts for failed operations
             retry_delay: Delay in seconds between retry attempts
+            connection_pool: Optional shared pool for reusing connections across jobs
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self._ftps_client = None
+        self.connection_pool = connection_pool
     
     @contextmanager
     def connect_ftps(self, config: FTPSConfig):
@@ -72,6 +62,17 @@ class FTPSManager:
         Raises:
             FTPSConnectionError: If connection fails after all retries
         """
+        if self.connection_pool is not None:
+            key = ("ftps", config.host, config.port, config.username)
+            with self.connection_pool.connection(
+                key,
+                connect=lambda: self._establish_ftps_connection(config),
+                close=self._close_connection,
+                is_alive=lambda client: self._reset_pooled_connection(client, config)
+            ) as client:
+                yield client
+            return
+        
         client = None
         try:
             client = self._establish_ftps_connection(config)
@@ -80,6 +81,20 @@ class FTPSManager:
             if client:
                 self._close_connection(client)
     
+    def _reset_pooled_connection(self, client: FTP_TLS, config: FTPSConfig) -> bool:
+        """Check that a pooled connection is alive and return it to the configured path.
+        
+        Args:
+            client: Idle FTPS client taken from the pool
+            config: FTPS configuration of the caller
+            
+        Returns:
+            bool: True if the connection can be reused
+        """
+        client.voidcmd('NOOP')
+        client.cwd(config.remote_path or '/')
+        return True
+    
     def _establish_ftps_connection(self, config: FTPSConfig) -> FTP_TLS:
         """Establish FTPS connection with TLS and retry logic.
         
@@ -95,6 +110,7 @@ class FTPSManager:
         last_error = None
         
         for attempt in range(self.max_retries):
+            ftps = None
             try:
                 logger.info(f"Attempting FTPS connection to {config.host}:{config.port} (attempt {attempt + 1}/{self.max_retries})")
                 
@@ -136,7 +152,6 @@ class FTPSManager:
                         logger.warning(f"Remote path {config.remote_path} does not exist or is not accessible")
                 
                 logger.info(f"Successfully connected to FTPS server {config.host}:{config.port}")
-                self._ftps_client = ftps
                 return ftps
                 
             except Exception as e:
@@ -165,14 +180,14 @@ class FTPSManager:
                 )
                 
                 # Clean up failed connection
-                if self._ftps_client:
+                if ftps:
                     try:
-                        self._ftps_client.quit()
+                        ftps.close()
                     except:
                         pass
-                    self._ftps_client = None
                 
                 if attempt < self.max_retries - 1:
+                    TRANSFER_RETRIES.labels(protocol="ftps", operation="connect").inc()
                     logger.info(f"Retrying in {self.retry_delay} seconds...")
                     time.sleep(self.retry_delay)
         
@@ -366,6 +381,8 @@ class FTPSManager:
                         raise FTPSFileError(f"File size mismatch: remote={remote_size}, local={local_size}")
                     
                     logger.info(f"Successfully downloaded {remote_path} ({local_size} bytes)")
+                    FILES_TRANSFERRED.labels(protocol="ftps", direction="download", outcome="success").inc()
+                    BYTES_TRANSFERRED.labels(protocol="ftps", direction="download").inc(local_size)
                     return True
                 else:
                     raise FTPSFileError("Local file was not created")
@@ -382,10 +399,12 @@ class FTPSManager:
                         pass
                 
                 if attempt < self.max_retries - 1:
+                    TRANSFER_RETRIES.labels(protocol="ftps", operation="download").inc()
                     logger.info(f"Retrying download in {self.retry_delay} seconds...")
                     time.sleep(self.retry_delay)
         
         # All attempts failed
+        FILES_TRANSFERRED.labels(protocol="ftps", direction="download", outcome="failed").inc()
         error_msg = f"Failed to download {remote_path} after {self.max_retries} attempts"
         if last_error:
             error_msg += f". Last error: {str(last_error)}"
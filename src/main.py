@@ -5,18 +5,24 @@ import signal
 import logging
 import os
 import argparse
+import importlib.util
 from datetime import datetime
 from pathlib import Path
-from config.settings import ConfigManager, ConfigurationError
+from config.settings import ConfigManager, ConfigurationError, load_runner_config
 from controller.main_controller import MainController, ProcessingError
+from controller.job_runner import JobRunner
 from scheduler.job_scheduler import Scheduler
 from utils.error_handler import get_error_handler, ErrorCategory, ErrorSeverity, handle_error
 from utils.logging_config import setup_logging as setup_advanced_logging
+from utils.tracing import get_tracer
+from utils.metrics import MetricsServer, QUEUE_DEPTH, observe_span
 
 
 # Global variables for graceful shutdown
 scheduler = None
 main_controller = None
+job_runner = None
+metrics_server = None
 logger = None
 custom_processing_date = None
 
@@ -35,6 +41,8 @@ Examples:
   python src/main.py                    # Run with default settings (yesterday's date)
   python src/main.py --date 2025-12-01  # Process files for specific date
   python src/main.py --date today       # Process files for today's date
+  python src/main.py --profiles tenants.json  # Run several tenant profiles in one process
+  python src/main.py --date today --once      # Run a single cycle and exit (e.g. from cron)
         """
     )
     
@@ -45,6 +53,19 @@ Examples:
         metavar='DATE'
     )
     
+    parser.add_argument(
+        '--profiles',
+        type=str,
+        help='Run in job runner mode with the tenant profiles in this JSON file',
+        metavar='FILE'
+    )
+    
+    parser.add_argument(
+        '--once',
+        action='store_true',
+        help='Run a single processing cycle and exit without starting the scheduler'
+    )
+    
     return parser.parse_args()
 
 
@@ -83,13 +104,17 @@ def setup_logging(config_manager: ConfigManager):
         console_level="INFO",
         file_level="DEBUG",
         enable_colors=True,
-        retention_config=retention_config
+        retention_config=retention_config,
+        logging_config=config_manager.get_logging_config()
     )
     
     # Initialize error handler with storage path and retention config
     error_storage_path = log_dir / "error_context"
     get_error_handler(str(error_storage_path), retention_config)
     
+    # Initialize stage tracing (spans are exported next to the logs)
+    get_tracer(str(log_dir / "traces"), config_manager.get_tracing_config())
+    
     # Log system information
     logger = logging.getLogger(__name__)
     logger.info(f"Python version: {sys.version}")
@@ -100,14 +125,52 @@ def setup_logging(config_manager: ConfigManager):
     return logging_manager
 
 
+def setup_metrics(config_manager: ConfigManager, logging_manager) -> MetricsServer:
+    """Wire in-process metrics and start the metrics endpoint if enabled.
+    
+    Args:
+        config_manager: Configuration manager instance
+        logging_manager: Logging manager whose queue depth is exported
+        
+    Returns:
+        MetricsServer: Running server, or None if the endpoint is disabled
+    """
+    # Collectors are always updated; only the HTTP endpoint is opt-in
+    get_tracer().add_listener(observe_span)
+    QUEUE_DEPTH.labels(queue="logging").set_function(logging_manager.get_queue_depth)
+    QUEUE_DEPTH.labels(queue="error_context_writer").set_function(
+        get_error_handler().context_writer.queue_depth
+    )
+    
+    metrics_config = config_manager.get_metrics_config()
+    if not metrics_config.enabled:
+        return None
+    
+    server = MetricsServer(metrics_config.host, metrics_config.port)
+    try:
+        server.start()
+    except OSError as e:
+        logging.getLogger(__name__).warning(
+            f"Could not start metrics endpoint on {metrics_config.host}:{metrics_config.port}: {e}"
+        )
+        return None
+    
+    return server
+
+
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
-    global scheduler, logger
+    global scheduler, job_runner, logger
     
     if logger:
         logger.info(f"Received signal {signum}, initiating graceful shutdown...")
     
     # Stop scheduler first
+    if job_runner and job_runner.is_running():
+        if logger:
+            logger.info("Stopping job runner...")
+        job_runner.scheduler.stop()
+    
     if scheduler and scheduler.is_running():
         if logger:
             logger.info("Stopping scheduler...")
@@ -125,21 +188,19 @@ def validate_environment():
     if sys.version_info < (3, 7):
         raise RuntimeError("Python 3.7 or higher is required")
     
-    # Check for required packages with correct import names
+    # Check for required packages with correct import names. Only locate them:
+    # the heavy ones are imported lazily on first use, not at startup
     required_imports = [
         ('paramiko', 'paramiko'),
         ('python-docx', 'docx'),
         ('python-dotenv', 'dotenv'), 
-        ('schedule', 'schedule'),
         ('croniter', 'croniter'),
         ('pytz', 'pytz')
     ]
     
     missing_packages = []
     for package_name, import_name in required_imports:
-        try:
-            __import__(import_name)
-        except ImportError:
+        if importlib.util.find_spec(import_name) is None:
             missing_packages.append(package_name)
     
     if missing_packages:
@@ -166,21 +227,27 @@ def create_directories(config_manager: ConfigManager):
 
 
 def run_scheduled_processing():
-    """Function to be called by the scheduler."""
+    """Function to be called by the scheduler.
+    
+    Returns:
+        bool: True if the cycle found files to process, False if the scan was empty,
+              None if the cycle did not complete (used for adaptive polling)
+    """
     global main_controller, logger
     
     try:
         if main_controller:
             logger.info("Starting scheduled processing cycle")
-            results = main_controller.run_processing_cycle()
-            if results:
-                logger.info(f"Scheduled processing completed successfully. Processed {len(results)} ZIP files")
-                # Log summary statistics
-                total_docs = sum(r.total_documents for r in results)
-                successful_docs = sum(r.successful_extractions for r in results)
-                logger.info(f"Processing summary: {successful_docs}/{total_docs} documents processed successfully")
-            else:
-                logger.debug("Scheduled processing completed. No files to process")
+            stats = main_controller.run_processing_cycle()
+            if stats and stats.downloads_total:
+                logger.info(f"Scheduled processing completed successfully. "
+                            f"Downloaded {stats.downloads_total} files")
+                logger.info(f"Processing summary: {stats.records_extracted} records extracted "
+                            f"from {stats.documents_processed} documents")
+                return True
+            
+            logger.debug("Scheduled processing completed. No files to process")
+            return False
         else:
             error_msg = "Main controller not initialized for scheduled processing"
             logger.error(error_msg)
@@ -200,11 +267,82 @@ def run_scheduled_processing():
             component="main",
             operation="scheduled_processing"
         )
+    finally:
+        # Close the email digest window if it has elapsed, even on idle cycles
+        if main_controller:
+            main_controller.email_notifier.flush_digest()
+
+
+def run_once(config_manager: ConfigManager, runner_config=None) -> int:
+    """Run a single processing cycle (per tenant in job runner mode) without the scheduler.
+    
+    Args:
+        config_manager: Process-wide configuration manager
+        runner_config: Tenant profiles, or None for single-source mode
+        
+    Returns:
+        int: Process exit code (0 if every cycle completed, 1 otherwise)
+    """
+    global main_controller, job_runner, logger
+    
+    if runner_config is not None:
+        job_runner = JobRunner(config_manager, runner_config, custom_date=custom_processing_date)
+        logger.info(f"Running a single processing cycle for {len(job_runner.tenants)} tenants...")
+        outcomes = job_runner.run_all_once()
+        failed = [name for name, outcome in outcomes.items() if outcome is None]
+        for name in failed:
+            logger.warning(f"[{name}] Processing cycle failed")
+        return 1 if failed else 0
+    
+    main_controller = MainController(config_manager, custom_date=custom_processing_date)
+    logger.info("Running a single processing cycle...")
+    outcome = run_scheduled_processing()
+    return 1 if outcome is None else 0
+
+
+def run_job_runner(config_manager: ConfigManager, runner_config):
+    """Run all tenant profiles under one scheduler until shutdown.
+    
+    Args:
+        config_manager: Process-wide configuration manager
+        runner_config: Tenant profiles and shared pool settings
+    """
+    global job_runner, logger
+    
+    job_runner = JobRunner(config_manager, runner_config, custom_date=custom_processing_date)
+    
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+    
+    job_runner.start()
+    logger.info(f"Job runner started with {len(job_runner.tenants)} tenants")
+    
+    # Run an initial processing cycle for every tenant
+    logger.info("Running initial processing cycle for all tenants...")
+    for name, outcome in job_runner.run_all_once().items():
+        if outcome is None:
+            logger.warning(f"[{name}] Initial processing cycle failed")
+        elif outcome:
+            logger.info(f"[{name}] Initial processing completed")
+        else:
+            logger.info(f"[{name}] Initial processing completed. No files to process")
+    
+    logger.info("System is running and monitoring for files. Press Ctrl+C to stop.")
+    logger.info("=" * 60)
+    
+    try:
+        while job_runner.is_running():
+            signal.pause()  # Wait for signals
+    except AttributeError:
+        # signal.pause() is not available on Windows
+        import time
+        while job_runner.is_running():
+            time.sleep(1)
 
 
 def main():
     """Main application entry point."""
-    global scheduler, main_controller, logger, custom_processing_date
+    global scheduler, main_controller, job_runner, metrics_server, logger, custom_processing_date
     
     try:
         # Parse command-line arguments
@@ -224,9 +362,15 @@ def main():
         logger.info("Starting system validation...")
         validate_environment()
         
-        # Initialize configuration
+        # Initialize configuration (in job runner mode each tenant profile
+        # supplies its own server credentials on top of shared defaults)
         print("Initializing WebScribe FTPS workflow system...")
-        config_manager = ConfigManager()
+        runner_config = None
+        if args.profiles:
+            runner_config = load_runner_config(args.profiles)
+            config_manager = ConfigManager(overrides=runner_config.defaults, require_endpoints=False)
+        else:
+            config_manager = ConfigManager()
         
         # Set up comprehensive logging
         logging_manager = setup_logging(config_manager)
@@ -241,6 +385,18 @@ def main():
         create_directories(config_manager)
         logger.info("Directory structure validated")
         
+        # Set up metrics collection and the optional metrics endpoint
+        metrics_server = setup_metrics(config_manager, logging_manager)
+        
+        if args.once:
+            exit_code = run_once(config_manager, runner_config)
+            logger.info(f"Single processing cycle finished (exit code {exit_code})")
+            sys.exit(exit_code)
+        
+        if runner_config is not None:
+            run_job_runner(config_manager, runner_config)
+            return
+        
         # Initialize main controller with custom date if provided
         main_controller = MainController(config_manager, custom_date=custom_processing_date)
         logger.info("Main controller initialized successfully")
@@ -274,6 +430,10 @@ def main():
                 logger.info(f"Next scheduled run: {next_run}")
         else:
             logger.info(f"Scheduling mode: INTERVAL ({schedule_config.poll_interval_seconds} seconds)")
+            if schedule_config.adaptive_polling_enabled:
+                logger.info(f"Adaptive polling enabled: up to {schedule_config.adaptive_max_interval_seconds} seconds "
+                            f"after {schedule_config.adaptive_empty_threshold} empty scans")
+        logger.info(f"Overlap policy: {schedule_config.overlap_policy}")
         
         # Log system configuration summary
         storage_config = config_manager.get_storage_config()
@@ -283,11 +443,10 @@ def main():
         # Run an initial processing cycle
         logger.info("Running initial processing cycle...")
         try:
-            results = main_controller.run_processing_cycle()
-            if results:
-                total_docs = sum(r.total_documents for r in results)
-                successful_docs = sum(r.successful_extractions for r in results)
-                logger.info(f"Initial processing completed: {len(results)} ZIP files, {successful_docs}/{total_docs} documents")
+            stats = main_controller.run_processing_cycle()
+            if stats and stats.downloads_total:
+                logger.info(f"Initial processing completed: {stats.downloads_total} files, "
+                            f"{stats.records_extracted} records extracted")
             else:
                 logger.info("Initial processing completed. No files to process")
         except Exception as e:
@@ -366,6 +525,12 @@ def main():
             if scheduler and scheduler.is_running():
                 scheduler.stop()
             
+            if job_runner:
+                job_runner.stop()
+            
+            if metrics_server:
+                metrics_server.stop()
+            
             if logger:
                 logger.info("System shutdown complete")
                 
@@ -378,16 +543,38 @@ def main():
                         if line.strip():
                             logger.info(line)
                 
+                # Log per-stage latency percentiles for this run
+                tracer = get_tracer()
+                if tracer.get_stage_percentiles():
+                    logger.info("Stage latency percentiles:")
+                    for line in tracer.format_stage_report().split('\n'):
+                        logger.info(line)
+                
                 # Cleanup old error logs and log files (using configured retention times)
                 error_handler.cleanup_old_error_logs()
                 if 'logging_manager' in locals():
                     logging_manager.cleanup_old_logs()
+                    tracer.cleanup_old_traces(logging_manager.retention_config.log_retention_days)
+                
+                # Send any pending email digest before exiting
+                if main_controller:
+                    main_controller.email_notifier.flush_digest(force=True)
                 
                 # Cleanup old ZIP backups, CSV files, and summary files
-                if 'main_controller' in locals() and main_controller:
-                    main_controller.csv_generator.cleanup_expired_files()
-                    main_controller.csv_generator.cleanup_expired_zip_backups()
-                    main_controller.summary_logger.cleanup_old_summaries()
+                controllers = job_runner.get_controllers() if job_runner else []
+                if main_controller:
+                    controllers.append(main_controller)
+                for controller in controllers:
+                    controller.csv_generator.cleanup_expired_files()
+                    controller.csv_generator.cleanup_expired_zip_backups()
+                    controller.summary_logger.cleanup_old_summaries()
+                
+                # Write out any error contexts still queued for persistence
+                error_handler.close()
+                
+                # Flush queued log records last so shutdown messages are kept
+                if 'logging_manager' in locals():
+                    logging_manager.shutdown()
                 
         except Exception as cleanup_error:
             if logger:
@@ -1,33 +1,159 @@
 """Document parsing and text extraction for medical documents."""
 
+import io
 import os
 import re
+import tempfile
+import threading
 import zipfile
 import logging
-from typing import List, Optional, Dict, Any
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import fields
+from typing import BinaryIO, Callable, Deque, Iterator, List, Optional, Dict, Any, Tuple, Union
 from pathlib import Path
 
-import docx2txt
-from docx import Document
-
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from config.models import MedicalRecord
+from config.models import MedicalRecord, ParserConfig
 from utils.date_utils import normalize_date
 from utils.error_handler import handle_error, ErrorCategory, ErrorSeverity
+from utils.keyword_matcher import KeywordMatcher, PatternMatcher
+from utils.log_sampler import get_sampled_logger
+from utils.tracing import get_tracer
+from utils.metrics import EXTRACTOR_RESULTS, FIELD_REGION_RESULTS
+from utils.lazy_import import lazy_import
+from parser.docx_stream import TextWindows, iter_docx_paragraphs, read_docx_text
+from parser.extraction_quality import HIGH_CONFIDENCE, MIN_QUALITY, ExtractorStats, score_text
+from parser.pattern_profile import apply_pattern_order, get_pattern_profile, load_pattern_order
+
+
+# Imported on first extraction rather than at startup
+docx = lazy_import("docx")
+docx2txt = lazy_import("docx2txt")
 
 
 logger = logging.getLogger(__name__)
+sampled_logger = get_sampled_logger(logger, "parser")
+
+
+# Phrases that indicate a blank/empty document or addendum/reference document
+BLANK_INDICATORS = (
+    'no dictation',
+    'no dictation.',
+    'nodictation',
+    'there is no dictation',
+    'blank file',
+    'blank',
+    'this is a blank file',
+    'note: this is a blank file',
+    'dictation cancelled',
+    'dictation cancelled.',
+    'this is an addendum to file',
+    'addendum to file',
+    'addendum added to file',
+    're-dictated in file',
+    'redictated in file',
+)
+
+# Common non-location text and document headers that are not an exam place
+UNWANTED_EXAM_PLACE_PHRASES = (
+    'INTERNAL USE ONLY',
+    'INTERNAL',
+    'USE ONLY',
+    'RADIOLOGY REPORT',
+    'DICTATED BUT NOT READ',
+    'SIGNED REPORT',
+    'PATIENT',
+    'CHIROPRACTIC MEDICAL EXAM',
+    'MEDICAL EXAM',
+    'PHYSICAL EXAM',
+    'EXAMINATION',
+    'REPORT',
+    'EVALUATION',
+)
+
+# Dates, codes and labels that show a name candidate is not a name
+INVALID_NAME_PATTERNS = (
+    r'\d{1,2}/\d{1,2}/\d{4}',  # MM/DD/YYYY or DD/MM/YYYY
+    r'\d{4}-\d{1,2}-\d{1,2}',  # YYYY-MM-DD
+    r'\d{1,2}-\d{1,2}-\d{4}',  # MM-DD-YYYY or DD-MM-YYYY
+    r'D/Accident',  # Specific pattern from the issue
+    r'Date\s*of\s*',  # Date of something
+    r'Record\s*Number',  # Record number
+    r'Case\s*Number',  # Case number
+    r'^\d+$',  # Only numbers
+    r'[A-Z]{2}\d{6}',  # Case codes like WC032525
+    r'\d{4}-\d{3}',  # Job numbers like 1028-032
+    r'1\.\d+\.\d+',  # Record numbers like 1.221743.0
+    r'^[a-z]{2}/[a-z]{2}$',  # Transcriptionist codes like ad/ag
+    r'00/00/0000',  # Invalid dates
+)
+
+# Fields dictated in the footer block; all others are searched in the header window
+FOOTER_FIELDS = frozenset(('transcriptionist', 'dd_date', 'transcription_date', 'job_number', 'case_code'))
 
 
 class DocumentParser:
     """Parser for extracting medical data from .doc and .docx files."""
     
-    def __init__(self):
-        """Initialize the document parser with field extraction patterns."""
+    def __init__(self, parser_config: Optional[ParserConfig] = None):
+        """Initialize the document parser with field extraction patterns.
+        
+        Args:
+            parser_config: Pattern order and profiling settings (defaults: declared order, no profiling)
+        """
+        self.parser_config = parser_config or ParserConfig()
         self.field_patterns = self._initialize_field_patterns()
+        
+        # Keyword and pattern sets, each checked with one call
+        self._blank_matcher = KeywordMatcher(BLANK_INDICATORS)
+        self._unwanted_place_matcher = KeywordMatcher(UNWANTED_EXAM_PLACE_PHRASES)
+        self._invalid_name_matcher = PatternMatcher(INVALID_NAME_PATTERNS, re.IGNORECASE)
+        
+        if self.parser_config.pattern_order_file:
+            try:
+                order = load_pattern_order(self.parser_config.pattern_order_file)
+                self.field_patterns = apply_pattern_order(self.field_patterns, order)
+                logger.info(f"Loaded tuned pattern order for {len(order)} fields "
+                            f"from {self.parser_config.pattern_order_file}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not load pattern order file {self.parser_config.pattern_order_file}, "
+                               f"using declared order: {e}")
+        
+        self.pattern_profile = None
+        if self.parser_config.profile_patterns:
+            self.pattern_profile = get_pattern_profile(self.parser_config.pattern_profile_path)
+        
+        # Per-field region outcomes since the last log_region_stats() call
+        # (updated from ZIP worker threads too, hence the lock)
+        self._region_counts: Dict[str, Dict[str, int]] = {}
+        self._region_lock = threading.Lock()
+        
+        # Rolling success rates of the text extractors (used with extractor scoring)
+        self.extractor_stats = ExtractorStats()
+    
+    def save_pattern_profile(self) -> None:
+        """Write the accumulated pattern counts to disk (no-op unless profiling is enabled)."""
+        if self.pattern_profile is None:
+            return
+        try:
+            self.pattern_profile.save()
+        except OSError as e:
+            logger.warning(f"Could not save pattern profile {self.pattern_profile.path}: {e}")
+    
+    def log_region_stats(self) -> None:
+        """Log how often region mode had to fall back to the full text, then reset the counts."""
+        with self._region_lock:
+            region_counts, self._region_counts = self._region_counts, {}
+        if not region_counts:
+            return
+        documents = max(sum(counts.values()) for counts in region_counts.values())
+        unsplit = max(counts['no_window'] for counts in region_counts.values())
+        fallbacks = [
+            f"{field_name} {counts['fallback'] / (sum(counts.values()) - counts['no_window']):.1%}"
+            for field_name, counts in region_counts.items() if counts['fallback']
+        ]
+        logger.info(f"Region extraction on {documents} long documents ({unsplit} single-line, searched in full), "
+                    f"full-text fallback needed for: {', '.join(fallbacks) if fallbacks else 'no fields'}")
     
     def _is_valid_document_file(self, file_path: str) -> bool:
         """
@@ -66,7 +192,11 @@ class DocumentParser:
             return False
     
     def _initialize_field_patterns(self) -> Dict[str, List[str]]:
-        """Initialize regex patterns for extracting medical fields based on map.csv mapping."""
+        """Initialize regex patterns for extracting medical fields based on map.csv mapping.
+        
+        Patterns are matched case-insensitively (see extract_field_value), so
+        upper- or lower-case copies of a pattern would never change a result.
+        """
         return {
             'first_name': [
                 r'FIRST\s+NAME:\s*([A-Z][A-Z\s-]+?)(?:\n|$)',
@@ -80,13 +210,11 @@ class DocumentParser:
             ],
             'date_of_birth': [
                 r'Date\s+of\s+Birth:\s*(\d{1,2}/\d{1,2}/\d{4})',
-                r'DATE\s+OF\s+BIRTH:\s*(\d{1,2}/\d{1,2}/\d{4})',
                 r'Date\s+of\s+Birth\s*:\s*(\d{1,2}/\d{1,2}/\d{4})',
                 r'DOB:\s*(\d{1,2}/\d{1,2}/\d{4})'
             ],
             'record_number': [
                 r'Record\s+Number:\s*(\d+\.\d+\.\d+)',
-                r'RECORD\s+NUMBER:\s*(\d+\.\d+\.\d+)',
                 r'Record\s+Number\s*:\s*(\d+\.\d+\.\d+)',
                 r'RecordNumber:\s*(\d+\.\d+\.\d+)',
                 r'MRN:\s*(\d+\.\d+\.\d+)',
@@ -95,7 +223,6 @@ class DocumentParser:
             ],
             'case_number': [
                 r'Case\s+Number:\s*(\d+)',
-                r'CASE\s+NUMBER:\s*(\d+)',
                 r'Case\s+Number\s*:\s*(\d+)',
                 r'case\s+number[:\s]+(\d+)'
             ],
@@ -116,32 +243,25 @@ class DocumentParser:
                 r'PROVIDER\s+FIRST:\s*([A-Z][A-Z\s.\-]+?)(?:\n|$)',
                 r'PROVIDER\s+FRIST:\s*([A-Z][A-Z\s.\-]+?)(?:\n|$)',  # Note: "FRIST" as per mapping
                 r'PROVIDER\s+FIRST\s*:\s*([A-Z][A-Z\s.\-]+?)(?:\n|$)',
-                r'PROVIDER\s+FRIST\s*:\s*([A-Z][A-Z\s.\-]+?)(?:\n|$)',
-                # Case insensitive patterns
-                r'Provider\s+First:\s*([A-Z][A-Z\s.\-]+?)(?:\n|$)',
-                r'Provider\s+Frist:\s*([A-Z][A-Z\s.\-]+?)(?:\n|$)'
+                r'PROVIDER\s+FRIST\s*:\s*([A-Z][A-Z\s.\-]+?)(?:\n|$)'
             ],
             'provider_last': [
                 r'PROVIDER\s+LAST:\s*([A-Z][A-Z\s.\-]+?)(?:\n|$)',
-                r'PROVIDER\s+LAST\s*:\s*([A-Z][A-Z\s.\-]+?)(?:\n|$)',
-                r'Provider\s+Last:\s*([A-Z][A-Z\s.\-]+?)(?:\n|$)'
+                r'PROVIDER\s+LAST\s*:\s*([A-Z][A-Z\s.\-]+?)(?:\n|$)'
             ],
             'exam_date': [
                 r'Date\s+of\s+Exam:\s*(\d{1,2}/\d{1,2}/\d{4})',
-                r'DATE\s+OF\s+EXAM:\s*(\d{1,2}/\d{1,2}/\d{4})',
                 r'Date\s+of\s+Exam\s*:\s*(\d{1,2}/\d{1,2}/\d{4})',
                 r'Exam\s+Date:\s*(\d{1,2}/\d{1,2}/\d{4})'
             ],
             'exam_place': [
                 # Only match when there's actual content on the same line as the label
                 r'Place\s+of\s+Exam:\s*([A-Z][A-Za-z\s.\'-]+?)(?:\s*$)',
-                r'PLACE\s+OF\s+EXAM:\s*([A-Z][A-Za-z\s.\'-]+?)(?:\s*$)',
                 r'Place\s+of\s+Exam\s*:\s*([A-Z][A-Za-z\s.\'-]+?)(?:\s*$)',
                 r'Exam\s+Place:\s*([A-Z][A-Za-z\s.\'-]+?)(?:\s*$)'
             ],
             'transcriptionist': [
                 r'Transcriptionist:\s*([a-z]{2}/[a-z]{2})',
-                r'TRANSCRIPTIONIST:\s*([a-z]{2}/[a-z]{2})',
                 r'Transcriptionist\s*:\s*([a-z]{2}/[a-z]{2})',
                 # Extract from DD/Transcription pattern
                 r'([a-z]{2}/[a-z]{2})\s+DD:'
@@ -154,30 +274,23 @@ class DocumentParser:
             ],
             'transcription_date': [
                 r'Transcription\s+Date:\s*(\d{1,2}/\d{1,2}/\d{4})',
-                r'TRANSCRIPTION\s+DATE:\s*(\d{1,2}/\d{1,2}/\d{4})',
                 r'Transcription\s+Date\s*:\s*(\d{1,2}/\d{1,2}/\d{4})',
                 r'transcribed\s+date[:\s]+(\d{1,2}/\d{1,2}/\d{4})'
             ],
             'job_number': [
                 # Extract from document content - most flexible patterns first
                 r'Job\s*:\s*(\d{4}-\d{2,3})',
-                r'JOB\s*:\s*(\d{4}-\d{2,3})',
-                r'job\s*:\s*(\d{4}-\d{2,3})',
                 # Without colon
                 r'Job\s+(\d{4}-\d{2,3})',
-                r'JOB\s+(\d{4}-\d{2,3})',
                 # Extract from filename pattern like "U 1029-252"
                 r'[A-Z]\s+(\d{4}-\d{2,3})\s+\d',
                 # With optional letter prefix in content
-                r'Job\s*:\s*[A-Z]\s*(\d{4}-\d{2,3})',
-                r'JOB\s*:\s*[A-Z]\s*(\d{4}-\d{2,3})'
+                r'Job\s*:\s*[A-Z]\s*(\d{4}-\d{2,3})'
             ],
             'case_code': [
                 # Extract case codes based on "Case" label - handles spaces between letters and numbers
                 # Matches patterns like "AA061625", "AWC090924", "aa102425", "AA 061625" (with space)
                 r'Case:\s*([A-Za-z]{2,3}\s*\d+)(?=\s|$)',
-                r'CASE:\s*([A-Za-z]{2,3}\s*\d+)(?=\s|$)',
-                r'case:\s*([A-Za-z]{2,3}\s*\d+)(?=\s|$)',
                 r'Case\s*:\s*([A-Za-z]{2,3}\s*\d+)(?=\s|$)',
             ]
         }
@@ -206,9 +319,7 @@ class DocumentParser:
                 
                 for file_info in zip_contents:
                     # Check if file is a document and not in a subdirectory we want to skip
-                    if (file_info.filename.lower().endswith(('.doc', '.docx')) and 
-                        not file_info.filename.startswith('__MACOSX/') and
-                        not file_info.is_dir()):
+                    if self._is_zip_document(file_info):
                         
                         try:
                             # Extract the file
@@ -257,6 +368,151 @@ class DocumentParser:
         logger.info(f"Successfully extracted {len(extracted_files)} documents from {zip_path}")
         return extracted_files
     
+    @staticmethod
+    def _is_zip_document(file_info: zipfile.ZipInfo) -> bool:
+        """Check whether a ZIP member is a .doc/.docx document (macOS resource forks excluded)."""
+        return (file_info.filename.lower().endswith(('.doc', '.docx')) and
+                not file_info.filename.startswith('__MACOSX/') and
+                not file_info.is_dir())
+    
+    def iter_zip_records(self, zip_path: str, max_workers: int = 4, spill_dir: Optional[str] = None,
+                         ordered: bool = False) -> Iterator[MedicalRecord]:
+        """
+        Parse the documents of a ZIP archive on a thread pool without extracting the archive.
+        
+        Members are read straight from the archive and handed to the workers as
+        bytes; at most two per worker are in flight, so memory and temp disk use
+        do not grow with the archive. .docx members are parsed in memory. Legacy
+        .doc members need a path for antiword and friends and are written to a
+        temp file that is removed as soon as the member is parsed.
+        
+        Args:
+            zip_path: Path to the ZIP file
+            max_workers: Parse threads
+            spill_dir: Directory for the temp files of .doc members (default: system temp dir)
+            ordered: Yield records in archive order instead of as they complete
+            
+        Yields:
+            MedicalRecord: Parsed record per document (documents that fail are skipped)
+            
+        Raises:
+            Exception: If the ZIP file cannot be opened
+        """
+        try:
+            archive = zipfile.ZipFile(zip_path, 'r')
+        except zipfile.BadZipFile as e:
+            logger.error(f"Invalid ZIP file {zip_path}: {e}")
+            handle_error(
+                error=e,
+                category=ErrorCategory.FILE_PROCESSING,
+                severity=ErrorSeverity.HIGH,
+                component="DocumentParser",
+                operation="iter_zip_records",
+                additional_data={"zip_path": zip_path}
+            )
+            raise Exception(f"Invalid ZIP file: {e}")
+        
+        parsed = 0
+        pending: Deque[Future] = deque()
+        with archive, ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="zip-parse") as pool:
+            for file_info in archive.infolist():
+                if not self._is_zip_document(file_info):
+                    continue
+                
+                # Keep the workers busy without reading ahead of them
+                while len(pending) >= max_workers * 2:
+                    for record in self._collect_zip_results(pending, ordered):
+                        parsed += 1
+                        yield record
+                
+                try:
+                    data = archive.read(file_info)
+                except Exception as e:
+                    logger.warning(f"Failed to read {file_info.filename} from {zip_path}: {e}")
+                    handle_error(
+                        error=e,
+                        category=ErrorCategory.FILE_PROCESSING,
+                        severity=ErrorSeverity.MEDIUM,
+                        component="DocumentParser",
+                        operation="read_zip_member",
+                        additional_data={
+                            "zip_path": zip_path,
+                            "document_name": file_info.filename,
+                            "document_size": file_info.file_size
+                        }
+                    )
+                    continue
+                pending.append(pool.submit(self._parse_zip_member, file_info.filename, data, spill_dir))
+            
+            while pending:
+                for record in self._collect_zip_results(pending, ordered):
+                    parsed += 1
+                    yield record
+        
+        logger.info(f"Processed {parsed} documents from {zip_path}")
+    
+    @staticmethod
+    def _collect_zip_results(pending: Deque[Future], ordered: bool) -> List[MedicalRecord]:
+        """Wait for the oldest (ordered) or any finished parse and take the records off `pending`."""
+        if ordered:
+            done = [pending.popleft()]
+        else:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            done = [future for future in pending if future in finished]
+            for future in done:
+                pending.remove(future)
+        return [record for record in (future.result() for future in done) if record is not None]
+    
+    def _parse_zip_member(self, member_name: str, data: bytes, spill_dir: Optional[str]) -> Optional[MedicalRecord]:
+        """
+        Parse one document read from a ZIP archive.
+        
+        Args:
+            member_name: Member name within the archive
+            data: Member contents
+            spill_dir: Directory for the temp file of members that need a path
+            
+        Returns:
+            MedicalRecord object, or None if the document could not be processed
+        """
+        source_file = os.path.basename(member_name)
+        try:
+            if source_file.lower().endswith('.docx'):
+                if self.parser_config.docx_streaming:
+                    record = self.parse_docx_streaming(io.BytesIO(data), source_file)
+                    if record is not None:
+                        return record
+                else:
+                    try:
+                        text = read_docx_text(io.BytesIO(data))
+                    except ValueError:
+                        text = ""
+                    if text.strip():
+                        return self.parse_medical_fields(text, source_file)
+            
+            # Legacy .doc, or a .docx the in-memory reader cannot handle: run the
+            # regular extraction chain on a temp copy
+            fd, temp_path = tempfile.mkstemp(suffix=os.path.splitext(source_file)[1], dir=spill_dir)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                text = self.extract_text_from_document(temp_path)
+            finally:
+                os.remove(temp_path)
+            return self.parse_medical_fields(text, source_file)
+            
+        except Exception as e:
+            logger.error(f"Failed to process document {member_name}: {e}")
+            handle_error(
+                error=e,
+                category=ErrorCategory.DOCUMENT_PARSING,
+                severity=ErrorSeverity.MEDIUM,
+                component="DocumentParser",
+                operation="process_zip_member",
+                additional_data={"source_filename": source_file, "file_size": len(data)}
+            )
+            return None
+    
     def extract_text_from_docx(self, file_path: str) -> str:
         """
         Extract text from a .docx file.
@@ -272,7 +528,7 @@ class DocumentParser:
         """
         try:
             # Try using python-docx first for better formatting
-            doc = Document(file_path)
+            doc = docx.Document(file_path)
             text_parts = []
             
             for paragraph in doc.paragraphs:
@@ -293,7 +549,7 @@ class DocumentParser:
             # Try docx2txt as fallback
             try:
                 text = docx2txt.process(file_path)
-                logger.info(f"Fallback extraction successful for {file_path}")
+                sampled_logger.info("fallback_extraction", "Fallback extraction successful for %s", file_path)
                 return text
             except Exception as fallback_error:
                 logger.error(f"Fallback extraction also failed for {file_path}: {fallback_error}")
@@ -356,12 +612,12 @@ class DocumentParser:
             
             # Check if it's HTML content
             if b'<html' in first_1kb.lower() or b'<!doctype' in first_1kb.lower():
-                logger.info(f"Detected HTML content in {file_path}, attempting HTML extraction")
+                sampled_logger.info("detected_html", "Detected HTML content in %s, attempting HTML extraction", file_path)
                 return self._extract_from_html_doc(file_path)
             
             # Check if it's RTF content
             if b'{\\rtf' in first_1kb:
-                logger.info(f"Detected RTF content in {file_path}, attempting RTF extraction")
+                sampled_logger.info("detected_rtf", "Detected RTF content in %s, attempting RTF extraction", file_path)
                 return self._extract_from_rtf_doc(file_path)
                 
         except Exception as e:
@@ -375,7 +631,7 @@ class DocumentParser:
                 
                 # Look for readable text content
                 if len(content) > 100 and any(c.isalpha() for c in content):
-                    logger.info(f"Extracted text using {encoding} encoding from {file_path}")
+                    sampled_logger.info("encoding_extraction", "Extracted text using %s encoding from %s", encoding, file_path)
                     return content
                     
             except Exception as e:
@@ -448,7 +704,7 @@ class DocumentParser:
             
             if result.returncode == 0 and result.stdout:
                 text = result.stdout.strip()
-                logger.info(f"Antiword extracted {len(text)} characters from {file_path}")
+                sampled_logger.info("antiword_extraction", "Antiword extracted %d characters from %s", len(text), file_path)
                 return text
             else:
                 logger.warning(f"Antiword failed for {file_path}: {result.stderr}")
@@ -465,7 +721,8 @@ class DocumentParser:
                 import antiword
                 text = antiword.extract(file_path)
                 if text:
-                    logger.info(f"Python antiword extracted {len(text)} characters from {file_path}")
+                    sampled_logger.info("python_antiword_extraction", "Python antiword extracted %d characters from %s",
+                                        len(text), file_path)
                     return text
                 else:
                     return ""
@@ -515,24 +772,106 @@ class DocumentParser:
                 ('alternative_methods', self._extract_with_alternative_methods)
             ]
         
+        # Record the chosen method and attempts on the enclosing 'extract' span
+        span = get_tracer().current_span()
+        
+        if self.parser_config.extractor_scoring:
+            return self._extract_with_scoring(file_path, file_extension, extraction_methods, span)
+        
         # Try each extraction method
         for method_name, method_func in extraction_methods:
             try:
                 logger.debug(f"Trying {method_name} for {file_path}")
+                if span:
+                    span.add("attempts")
                 text = method_func(file_path)
                 if text and text.strip():
-                    logger.info(f"Successfully extracted text using {method_name} for {os.path.basename(file_path)}")
+                    EXTRACTOR_RESULTS.labels(extension=file_extension, method=method_name, outcome="success").inc()
+                    if span:
+                        span.set(method=method_name)
+                    sampled_logger.info("extractor_chosen", "Successfully extracted text using %s for %s",
+                                        method_name, os.path.basename(file_path))
                     return text
                 else:
+                    EXTRACTOR_RESULTS.labels(extension=file_extension, method=method_name, outcome="empty").inc()
                     logger.warning(f"{method_name} returned empty text for {file_path}")
             except Exception as e:
+                EXTRACTOR_RESULTS.labels(extension=file_extension, method=method_name, outcome="error").inc()
                 logger.warning(f"{method_name} failed for {file_path}: {e}")
                 continue
         
         # If all methods failed, log and return empty string
+        if span:
+            span.set(method="none")
         logger.error(f"All extraction methods failed for {file_path}")
         return ""
     
+    def _extract_with_scoring(self, file_path: str, file_extension: str,
+                              extraction_methods: List[Tuple[str, Callable[[str], str]]], span) -> str:
+        """
+        Run the extractor chain, keeping the best-scoring result.
+        
+        The chain stops at the first high-confidence result. Results below
+        MIN_QUALITY (e.g. binary decoded as text) are discarded, and
+        extractors that keep failing for this file type are skipped.
+        
+        Args:
+            file_path: Path to the document file
+            file_extension: Lower-case file extension
+            extraction_methods: (name, function) pairs in the order to try them
+            span: Enclosing 'extract' span, or None
+            
+        Returns:
+            Extracted text content, or empty string if no extractor produced usable text
+        """
+        stats = self.extractor_stats
+        best_text, best_method, best_score = "", None, 0.0
+        
+        for method_name, method_func in extraction_methods:
+            if stats.should_skip(file_extension, method_name):
+                EXTRACTOR_RESULTS.labels(extension=file_extension, method=method_name, outcome="skipped").inc()
+                continue
+            
+            try:
+                logger.debug(f"Trying {method_name} for {file_path}")
+                if span:
+                    span.add("attempts")
+                text = method_func(file_path)
+            except Exception as e:
+                stats.record(file_extension, method_name, False)
+                EXTRACTOR_RESULTS.labels(extension=file_extension, method=method_name, outcome="error").inc()
+                logger.warning(f"{method_name} failed for {file_path}: {e}")
+                continue
+            
+            score = score_text(text)
+            stats.record(file_extension, method_name, score >= MIN_QUALITY)
+            if score >= HIGH_CONFIDENCE:
+                outcome = "success"
+            elif score >= MIN_QUALITY:
+                outcome = "usable"
+            else:
+                outcome = "low_quality" if text and text.strip() else "empty"
+            EXTRACTOR_RESULTS.labels(extension=file_extension, method=method_name, outcome=outcome).inc()
+            
+            if score > best_score and score >= MIN_QUALITY:
+                best_text, best_method, best_score = text, method_name, score
+            if score >= HIGH_CONFIDENCE:
+                break
+            if outcome == "low_quality":
+                logger.warning(f"{method_name} returned unusable text for {file_path} (score {score:.2f})")
+        
+        if best_method is None:
+            if span:
+                span.set(method="none")
+            logger.error(f"All extraction methods failed for {file_path}")
+            return ""
+        
+        if span:
+            span.set(method=best_method, quality=round(best_score, 2))
+        sampled_logger.info("extractor_chosen", "Successfully extracted text using %s for %s (score %.2f)",
+                            best_method, os.path.basename(file_path), best_score)
+        return best_text
+    
     def extract_field_value(self, text: str, field_name: str) -> str:
         """
         Extract a specific field value from text using regex patterns.
@@ -547,11 +886,30 @@ class DocumentParser:
         if not text or field_name not in self.field_patterns:
             return ""
         
+        result, winner, matched = self._search_field(text, field_name)
+        self._record_pattern_profile(field_name, winner, matched)
+        return result
+    
+    def _search_field(self, text: str, field_name: str) -> Tuple[str, Optional[int], List[int]]:
+        """
+        Try a field's patterns in order until one yields a valid value.
+        
+        Args:
+            text: The text to search in
+            field_name: The name of the field to extract (must have patterns)
+            
+        Returns:
+            Tuple of (value or empty string, index of the pattern that produced it,
+            indices of all patterns that matched)
+        """
         patterns = self.field_patterns[field_name]
+        matched = []
+        result, winner = "", None
         
-        for pattern in patterns:
+        for index, pattern in enumerate(patterns):
             match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
             if match:
+                matched.append(index)
                 value = match.group(1).strip()
                 
                 # Clean up the extracted value
@@ -567,24 +925,7 @@ class DocumentParser:
                 # Special filtering for exam_place to exclude unwanted text
                 if field_name == 'exam_place':
                     # Filter out common non-location text and document headers
-                    unwanted_phrases = [
-                        'INTERNAL USE ONLY',
-                        'INTERNAL',
-                        'USE ONLY',
-                        'RADIOLOGY REPORT',
-                        'DICTATED BUT NOT READ',
-                        'SIGNED REPORT',
-                        'PATIENT',
-                        'CHIROPRACTIC MEDICAL EXAM',
-                        'MEDICAL EXAM',
-                        'PHYSICAL EXAM',
-                        'EXAMINATION',
-                        'REPORT',
-                        'EVALUATION'
-                    ]
-                    
-                    # Check if the extracted value is one of the unwanted phrases
-                    if any(unwanted.lower() in value.lower() for unwanted in unwanted_phrases):
+                    if self._unwanted_place_matcher.contains_any(value):
                         continue  # Skip this match and try next pattern
                     
                     # If the value is too short or empty, skip it
@@ -605,15 +946,81 @@ class DocumentParser:
                 if field_name in ['date_of_birth', 'accident_date', 'exam_date', 'dd_date', 'transcription_date']:
                     normalized_date = normalize_date(value)
                     if normalized_date:
-                        return normalized_date
+                        result, winner = normalized_date, index
+                        break
                     # If date normalization fails, continue to next pattern
                     continue
                 
                 if value:
                     logger.debug(f"Extracted {field_name}: {value}")
-                    return value
+                    result, winner = value, index
+                    break
         
-        return ""
+        return result, winner, matched
+    
+    def _record_pattern_profile(self, field_name: str, winner: Optional[int], matched: List[int]) -> None:
+        """Count one field extraction in the pattern profile (if profiling is enabled)."""
+        if self.pattern_profile is not None:
+            self.pattern_profile.record(field_name, self.field_patterns[field_name], winner, matched)
+    
+    def _split_regions(self, text: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Cut the header and footer windows out of a long text.
+        
+        Windows end on line boundaries so no value is cut in half and
+        end-of-line anchors match only where they would in the full text. A
+        window without a line break is None and its fields are searched in
+        the full text.
+        
+        Args:
+            text: The full document text
+            
+        Returns:
+            Tuple of (header window, footer window)
+        """
+        head_end = text.rfind('\n', 0, self.parser_config.head_chars)
+        tail_start = text.find('\n', len(text) - self.parser_config.tail_chars)
+        head = text[:head_end + 1] if head_end >= 0 else None
+        tail = text[tail_start + 1:] if tail_start >= 0 else None
+        return head, tail
+    
+    def _extract_field_in_region(self, field_name: str, head: Optional[str], tail: Optional[str],
+                                 full_text: Callable[[], str]) -> str:
+        """
+        Extract a field from its window, falling back to the full text if the window has no value.
+        
+        Args:
+            field_name: The name of the field to extract
+            head: Header window (from _split_regions)
+            tail: Footer window (from _split_regions)
+            full_text: Returns the full document text (only called on fallback)
+            
+        Returns:
+            Extracted field value or empty string if not found
+        """
+        window = tail if field_name in FOOTER_FIELDS else head
+        if window is None:
+            # Single-line text (e.g. flattened HTML): there is no safe place to cut
+            value = self.extract_field_value(full_text(), field_name)
+            outcome = 'no_window'
+        else:
+            # The profile counts one extraction per field: the window pass if it
+            # found the value, otherwise only the full-text pass
+            value, winner, matched = self._search_field(window, field_name)
+            if value:
+                self._record_pattern_profile(field_name, winner, matched)
+                outcome = 'window'
+            else:
+                value = self.extract_field_value(full_text(), field_name)
+                outcome = 'fallback' if value else 'missing'
+        
+        with self._region_lock:
+            counts = self._region_counts.get(field_name)
+            if counts is None:
+                counts = self._region_counts[field_name] = {'window': 0, 'fallback': 0, 'missing': 0, 'no_window': 0}
+            counts[outcome] += 1
+        FIELD_REGION_RESULTS.labels(field=field_name, outcome=outcome).inc()
+        return value
     
     def _is_invalid_name(self, value: str) -> bool:
         """
@@ -628,34 +1035,9 @@ class DocumentParser:
         if not value or len(value.strip()) < 2:
             return True
         
-        # Check for date patterns (MM/DD/YYYY, DD/MM/YYYY, etc.)
-        date_patterns = [
-            r'\d{1,2}/\d{1,2}/\d{4}',  # MM/DD/YYYY or DD/MM/YYYY
-            r'\d{4}-\d{1,2}-\d{1,2}',  # YYYY-MM-DD
-            r'\d{1,2}-\d{1,2}-\d{4}',  # MM-DD-YYYY or DD-MM-YYYY
-        ]
-        
-        for pattern in date_patterns:
-            if re.search(pattern, value):
-                return True
-        
-        # Check for common non-name patterns
-        invalid_patterns = [
-            r'D/Accident',  # Specific pattern from the issue
-            r'Date\s*of\s*',  # Date of something
-            r'Record\s*Number',  # Record number
-            r'Case\s*Number',  # Case number
-            r'^\d+$',  # Only numbers
-            r'[A-Z]{2}\d{6}',  # Case codes like WC032525
-            r'\d{4}-\d{3}',  # Job numbers like 1028-032
-            r'1\.\d+\.\d+',  # Record numbers like 1.221743.0
-            r'^[a-z]{2}/[a-z]{2}$',  # Transcriptionist codes like ad/ag
-            r'00/00/0000',  # Invalid dates
-        ]
-        
-        for pattern in invalid_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
-                return True
+        # Check for dates, codes and other non-name patterns in one search
+        if self._invalid_name_matcher.contains_any(value):
+            return True
         
         # Check if value contains mostly non-alphabetic characters
         alpha_chars = sum(1 for c in value if c.isalpha())
@@ -714,11 +1096,94 @@ class DocumentParser:
         if not text:
             logger.warning(f"No text provided for parsing from {source_file}")
             return MedicalRecord(source_file=source_file)
-
+        
+        # Region mode searches header/footer windows first, so a long report
+        # costs about as much as a short one unless a field is missing
+        config = self.parser_config
+        if config.region_mode and len(text) > config.head_chars + config.tail_chars:
+            head, tail = self._split_regions(text)
+            
+            def extract(field_name: str) -> str:
+                return self._extract_field_in_region(field_name, head, tail, lambda: text)
+        else:
+            def extract(field_name: str) -> str:
+                return self.extract_field_value(text, field_name)
+        
+        return self._build_record(source_file, text, extract)
+    
+    def parse_docx_streaming(self, file_path: Union[str, BinaryIO],
+                             source_file: Optional[str] = None) -> Optional[MedicalRecord]:
+        """
+        Parse medical fields from a .docx read with the streaming paragraph reader.
+        
+        In region mode, only the header and footer windows are kept while the
+        paragraphs are streamed, and fields are extracted from them. The document
+        is streamed a second time, into a full text, only if a window misses a
+        field. Without region mode, the streamed full text is parsed with
+        parse_medical_fields, so pattern precedence is the same as for the
+        regular path.
+        
+        Args:
+            file_path: Path to the .docx file, or a seekable binary file object holding it
+            source_file: The source filename for reference (default: the file's basename)
+            
+        Returns:
+            MedicalRecord object with extracted fields, or None if the file cannot be
+            streamed (not a valid package, or no body text) and needs the regular
+            extract_text_from_document + parse_medical_fields path
+        """
+        source_file = source_file or os.path.basename(file_path)
+        config = self.parser_config
+        if not config.region_mode:
+            try:
+                text = read_docx_text(file_path)
+            except (OSError, ValueError) as e:
+                logger.debug(f"Streaming extraction not possible for {source_file}: {e}")
+                return None
+            return self.parse_medical_fields(text, source_file) if text else None
+        
+        windows = TextWindows(config.head_chars, config.tail_chars)
+        try:
+            for paragraph in iter_docx_paragraphs(file_path):
+                windows.add(paragraph)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Streaming extraction not possible for {source_file}: {e}")
+            return None
+        
+        if not windows.length:
+            return None
+        if windows.complete:
+            return self.parse_medical_fields(windows.text, source_file)
+        
+        head, tail = windows.windows()
+        loaded = []
+        
+        def full_text() -> str:
+            if not loaded:
+                loaded.append(read_docx_text(file_path))
+            return loaded[0]
+        
+        def extract(field_name: str) -> str:
+            return self._extract_field_in_region(field_name, head, tail, full_text)
+        
+        return self._build_record(source_file, (head or '') + (tail or ''), extract)
+    
+    def _build_record(self, source_file: str, text: str, extract: Callable[[str], str]) -> MedicalRecord:
+        """
+        Build a record from extracted fields and the filename.
+        
+        Args:
+            source_file: The source filename for reference
+            text: Document text checked for blank indicators (logged only)
+            extract: Returns the value of a field by name
+            
+        Returns:
+            MedicalRecord object with extracted fields
+        """
         # Check if filename contains "MERGED" - these files have paragraph format
         # and should only show source_file in CSV with all other fields blank
         if 'MERGED' in source_file.upper():
-            logger.info(f"Detected MERGED document (paragraph format): {source_file}")
+            sampled_logger.info("merged_document", "Detected MERGED document (paragraph format): %s", source_file)
             return MedicalRecord(source_file=source_file)
 
 
@@ -726,28 +1191,9 @@ class DocumentParser:
         # Check if document is essentially blank or has "No dictation"
         # Remove whitespace and check content length
         text_stripped = text.strip()
-        text_lower = text_stripped.lower()
-        
-        # Patterns that indicate a blank/empty document or addendum/reference document
-        blank_indicators = [
-            'no dictation',
-            'no dictation.',
-            'nodictation',
-            'there is no dictation',
-            'blank file',
-            'blank',
-            'this is a blank file',
-            'note: this is a blank file',
-            'dictation cancelled',
-            'dictation cancelled.',
-            'this is an addendum to file',
-            'addendum to file',
-            'addendum added to file',
-            're-dictated in file',
-            'redictated in file',
-        ]
+        
         # Check if document contains blank indicators
-        is_blank_document = any(indicator in text_lower for indicator in blank_indicators)
+        is_blank_document = self._blank_matcher.contains_any(text_stripped)
         
         # Also check if document has very minimal content (less than 50 characters after stripping)
         # This catches documents that only have headers/logos but no actual medical content
@@ -756,25 +1202,26 @@ class DocumentParser:
         
         # Log if document is blank or addendum (but still process it to include in CSV)
         if is_blank_document:
-           logger.info(f"Detected blank/cancelled/addendum document (will still include in CSV): {source_file}")
+           sampled_logger.info("blank_document",
+                               "Detected blank/cancelled/addendum document (will still include in CSV): %s", source_file)
         # Extract fields from text
         record = MedicalRecord(
             source_file=source_file,
-            first_name=self.extract_field_value(text, 'first_name'),
-            last_name=self.extract_field_value(text, 'last_name'),
-            date_of_birth=self.extract_field_value(text, 'date_of_birth'),
-            record_number=self.extract_field_value(text, 'record_number'),
-            case_number=self.extract_field_value(text, 'case_number'),
-            accident_date=self.extract_field_value(text, 'accident_date'),
-            provider_first=self.extract_field_value(text, 'provider_first'),
-            provider_last=self.extract_field_value(text, 'provider_last'),
-            exam_date=self.extract_field_value(text, 'exam_date'),
-            exam_place=self.extract_field_value(text, 'exam_place'),
-            transcriptionist=self.extract_field_value(text, 'transcriptionist'),
-            dd_date=self.extract_field_value(text, 'dd_date'),
-            transcription_date=self.extract_field_value(text, 'transcription_date'),
-            job_number=self.extract_field_value(text, 'job_number'),
-            case_code=self.extract_field_value(text, 'case_code')
+            first_name=extract('first_name'),
+            last_name=extract('last_name'),
+            date_of_birth=extract('date_of_birth'),
+            record_number=extract('record_number'),
+            case_number=extract('case_number'),
+            accident_date=extract('accident_date'),
+            provider_first=extract('provider_first'),
+            provider_last=extract('provider_last'),
+            exam_date=extract('exam_date'),
+            exam_place=extract('exam_place'),
+            transcriptionist=extract('transcriptionist'),
+            dd_date=extract('dd_date'),
+            transcription_date=extract('transcription_date'),
+            job_number=extract('job_number'),
+            case_code=extract('case_code')
         )
         
         # Extract job_number from filename if not found in document content
@@ -787,9 +1234,10 @@ class DocumentParser:
                 logger.debug(f"Extracted job_number from filename: {record.job_number}")
         
         # Log extraction summary
-        extracted_fields = [field for field, value in record.__dict__.items() 
-                          if field != 'source_file' and value]
-        logger.info(f"Extracted {len(extracted_fields)} fields from {source_file}: {extracted_fields}")
+        extracted_fields = [f.name for f in fields(record)
+                            if f.name != 'source_file' and getattr(record, f.name)]
+        sampled_logger.info("fields_extracted", "Extracted %d fields from %s: %s",
+                            len(extracted_fields), source_file, extracted_fields)
         
         return record
     
@@ -819,11 +1267,11 @@ class DocumentParser:
             record = self.parse_medical_fields(text, source_filename)
             
             # Count extracted fields for logging
-            extracted_fields = [field for field, value in record.__dict__.items() 
-                              if field != 'source_file' and value]
+            extracted_fields = [f.name for f in fields(record)
+                                if f.name != 'source_file' and getattr(record, f.name)]
             
-            logger.info(f"Successfully processed document: {source_filename} "
-                       f"({len(extracted_fields)} fields extracted)")
+            sampled_logger.info("document_processed", "Successfully processed document: %s (%d fields extracted)",
+                                source_filename, len(extracted_fields))
             return record
             
         except Exception as e:
@@ -848,6 +1296,9 @@ class DocumentParser:
         """
         Process all documents in a ZIP file.
         
+        With PARSER_ZIP_WORKERS set, members are parsed in memory on that many
+        threads (see iter_zip_records) instead of being extracted first.
+        
         Args:
             zip_path: Path to the ZIP file
             temp_dir: Temporary directory for extraction
@@ -858,6 +1309,13 @@ class DocumentParser:
         Raises:
             Exception: If ZIP file cannot be processed
         """
+        if self.parser_config.zip_workers > 0:
+            records = list(self.iter_zip_records(zip_path, self.parser_config.zip_workers,
+                                                 spill_dir=temp_dir, ordered=True))
+            if not records:
+                logger.warning(f"No documents parsed from {zip_path}")
+            return records
+        
         records = []
         extracted_files = []
         
@@ -0,0 +1,184 @@
+"""Streaming paragraph reader for .docx files.
+
+extract_text_from_docx loads the whole document through python-docx and
+joins every paragraph into one string before a single field is searched.
+The reader here walks word/document.xml with iterparse instead, yields one
+paragraph's text at a time and drops each parsed element straight away.
+TextWindows keeps only the header window and a rolling footer window of
+that paragraph stream, so memory stays bounded however long the report is.
+
+Paragraph text follows python-docx: only the body's own paragraphs count
+(not table cells or text boxes), runs directly in a paragraph or in a
+hyperlink contribute, and tabs, breaks and non-breaking hyphens map to the
+same characters. The streamed text is therefore identical to what
+extract_text_from_docx returns.
+"""
+
+import posixpath
+import zipfile
+from collections import deque
+from typing import BinaryIO, Deque, Iterator, List, Optional, Tuple, Union
+from xml.etree import ElementTree
+
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_BODY = _W + 'body'
+_P = _W + 'p'
+_R = _W + 'r'
+_HYPERLINK = _W + 'hyperlink'
+_T = _W + 't'
+_BR = _W + 'br'
+_BR_TYPE = _W + 'type'
+
+# Run children with a fixed text equivalent (w:t carries its own text, w:br depends on its type)
+_RUN_CHARACTERS = {
+    _W + 'tab': '\t',
+    _W + 'ptab': '\t',
+    _W + 'cr': '\n',
+    _W + 'noBreakHyphen': '-',
+}
+
+_OFFICE_DOCUMENT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+_RELATIONSHIP = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+
+
+def _main_part_name(package: zipfile.ZipFile) -> str:
+    """Find the main document part through the package relationships."""
+    try:
+        with package.open('_rels/.rels') as rels:
+            for relationship in ElementTree.parse(rels).getroot().iter(_RELATIONSHIP):
+                if relationship.get('Type') == _OFFICE_DOCUMENT:
+                    return posixpath.normpath(relationship.get('Target', '').lstrip('/'))
+    except KeyError:
+        pass
+    return 'word/document.xml'
+
+
+def iter_docx_paragraphs(file_path: Union[str, BinaryIO]) -> Iterator[str]:
+    """
+    Yield the text of each body paragraph of a .docx file in document order.
+
+    Args:
+        file_path: Path to the .docx file, or a seekable binary file object holding it
+
+    Yields:
+        str: Paragraph text (possibly empty)
+
+    Raises:
+        ValueError: If the file is not a readable .docx package
+    """
+    try:
+        with zipfile.ZipFile(file_path) as package:
+            with package.open(_main_part_name(package)) as part:
+                stack: List[str] = []
+                body = None
+                parts: List[str] = []
+                for event, element in ElementTree.iterparse(part, events=('start', 'end')):
+                    if event == 'start':
+                        stack.append(element.tag)
+                        if element.tag == _BODY and len(stack) == 2:
+                            body = element
+                        continue
+
+                    depth = len(stack)
+                    tag = stack.pop()
+                    if depth == 3 and body is not None:
+                        # A body-level block (paragraph, table, section) is complete
+                        if tag == _P:
+                            yield ''.join(parts)
+                            parts = []
+                        body.clear()
+                    elif depth >= 5 and stack[-1] == _R and stack[2] == _P and (
+                            depth == 5 or (depth == 6 and stack[3] == _HYPERLINK)):
+                        if tag == _T:
+                            parts.append(element.text or '')
+                        elif tag == _BR:
+                            if element.get(_BR_TYPE, 'textWrapping') == 'textWrapping':
+                                parts.append('\n')
+                        elif tag in _RUN_CHARACTERS:
+                            parts.append(_RUN_CHARACTERS[tag])
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+        raise ValueError(f"Not a readable .docx package: {file_path}: {e}")
+
+
+def read_docx_text(file_path: Union[str, BinaryIO]) -> str:
+    """
+    Get the full text of a .docx file as extract_text_from_docx builds it.
+
+    Raises:
+        ValueError: If the file is not a readable .docx package
+    """
+    return '\n'.join(paragraph for paragraph in iter_docx_paragraphs(file_path) if paragraph.strip())
+
+
+class TextWindows:
+    """Header and footer windows of a text fed one paragraph at a time.
+
+    The text is the one extract_text_from_docx builds: non-blank paragraphs
+    joined by newlines. Leading paragraphs are kept until they cover both
+    windows, so a short text is kept whole; after that only the trailing
+    paragraphs that cover the footer window are retained.
+    """
+
+    def __init__(self, head_chars: int, tail_chars: int):
+        """
+        Initialize empty windows.
+
+        Args:
+            head_chars: Header window size in characters
+            tail_chars: Footer window size in characters
+        """
+        self.head_chars = head_chars
+        self.tail_chars = tail_chars
+        self.length = 0
+        self._leading: List[str] = []
+        self._leading_length = 0
+        self._trailing: Deque[str] = deque()
+        self._trailing_length = 0
+
+    def add(self, paragraph: str) -> None:
+        """Append a paragraph (blank ones are skipped, as in extract_text_from_docx)."""
+        if not paragraph.strip():
+            return
+        piece = '\n' + paragraph if self.length else paragraph
+        self.length += len(piece)
+
+        if self._leading_length <= self.head_chars + self.tail_chars:
+            self._leading.append(piece)
+            self._leading_length += len(piece)
+            return
+
+        self._trailing.append(piece)
+        self._trailing_length += len(piece)
+        while self._trailing_length - len(self._trailing[0]) >= self.tail_chars:
+            self._trailing_length -= len(self._trailing.popleft())
+
+    @property
+    def complete(self) -> bool:
+        """Whether the whole text fits in the windows and is available as `text`."""
+        return self.length <= self.head_chars + self.tail_chars
+
+    @property
+    def text(self) -> str:
+        """The whole text (only valid while `complete`)."""
+        return ''.join(self._leading)
+
+    def windows(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Cut the header and footer windows, exactly as DocumentParser._split_regions cuts the full text.
+
+        Returns:
+            Tuple of (header window, footer window); a window without a line break is None
+        """
+        leading = ''.join(self._leading)
+        trailing = ''.join(self._trailing)
+        if len(trailing) < self.tail_chars:
+            trailing = leading + trailing
+
+        leading = leading[:self.head_chars]
+        trailing = trailing[-self.tail_chars:]
+        head_end = leading.rfind('\n')
+        tail_start = trailing.find('\n')
+        head = leading[:head_end + 1] if head_end >= 0 else None
+        tail = trailing[tail_start + 1:] if tail_start >= 0 else None
+        return head, tail
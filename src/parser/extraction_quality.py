@@ -0,0 +1,132 @@
+"""Quality scoring of extracted text and rolling per-extractor success rates.
+
+extract_text_from_document tries a chain of extractors per file type. With
+PARSER_EXTRACTOR_SCORING enabled it scores each result instead of taking
+the first non-empty one: a high-confidence result ends the chain, binary
+decoded as text is rejected, and extractors that keep failing for a file
+type are skipped (with an occasional probe so they can recover, e.g. once
+antiword is installed).
+"""
+
+import re
+import threading
+from collections import deque
+from typing import Deque, Dict, Tuple
+
+
+# Score at or above which a result is accepted without trying further extractors
+HIGH_CONFIDENCE = 0.75
+
+# Score below which a result is treated as a failed extraction
+MIN_QUALITY = 0.5
+
+# Highest score of a text without any known label, so such text is usable but never high-confidence
+UNLABELLED_MAX = 0.7
+
+# Lower-case labels and phrases that dictation text contains; the blank
+# indicators count too, since a "No dictation" document is correctly extracted
+KNOWN_LABELS = (
+    'first name', 'last name', 'dob', 'record number', 'case number', 'provider',
+    'exam', 'transcri', 'dd:', 'job', 'dictation', 'blank', 'addendum',
+)
+
+# A word-like token: ASCII letters, digits and common punctuation, plus single
+# accented letters or typographic characters (a run of two or more non-ASCII
+# characters is what binary decoded as Latin-1 looks like). Tokens longer than
+# 40 characters are not words either: random bytes rarely decode to whitespace.
+_WORD_CHAR = r"[A-Za-z0-9.,;:!?'\"()\[\]/&#%@*+=$_-]"
+_SINGLE_EXTENDED = "[\u00c0-\u00d6\u00d8-\u00f6\u00f8-\u00ff\u00b0\u00b1\u00b5\u00b7\u2013\u2014\u2018\u2019\u201c\u201d\u2022\u2026]"
+_PLAUSIBLE_TOKEN = re.compile(
+    rf"(?<!\S)(?:{_WORD_CHAR}|{_SINGLE_EXTENDED}(?!{_SINGLE_EXTENDED})){{1,40}}(?!\S)"
+)
+_WHITESPACE = re.compile(r"\s+")
+
+# Characters scored from each end of long texts
+_SAMPLE_CHARS = 16384
+
+
+def score_text(text: str) -> float:
+    """
+    Score how much an extraction result looks like dictation text.
+
+    The base score is the share of non-whitespace characters that belong to
+    word-like tokens (see _PLAUSIBLE_TOKEN), so control characters, symbol
+    soup and runs of high Latin-1 characters all lower it. NUL padding is
+    ignored (legacy .doc text read by the fallback readers is NUL-padded but
+    usable). Text without any known label is capped at UNLABELLED_MAX, below
+    HIGH_CONFIDENCE.
+
+    Args:
+        text: Extracted text
+
+    Returns:
+        float: Score between 0 (empty or binary) and 1
+    """
+    if not text or not text.strip():
+        return 0.0
+    if len(text) > 2 * _SAMPLE_CHARS:
+        text = text[:_SAMPLE_CHARS] + text[-_SAMPLE_CHARS:]
+    text = text.replace('\x00', '')
+
+    visible = len(text) - sum(len(space) for space in _WHITESPACE.findall(text))
+    if not visible:
+        return 0.0
+    plausible = sum(len(token) for token in _PLAUSIBLE_TOKEN.findall(text))
+    quality = plausible / visible
+
+    lowered = text.lower()
+    if not any(label in lowered for label in KNOWN_LABELS):
+        return min(quality, UNLABELLED_MAX)
+    return quality
+
+
+class ExtractorStats:
+    """Thread-safe rolling success rates per (file extension, extractor)."""
+
+    def __init__(self, window: int = 50, min_attempts: int = 20, probe_every: int = 25):
+        """
+        Initialize empty statistics.
+
+        Args:
+            window: Recent attempts kept per extractor
+            min_attempts: Attempts needed before an extractor can be skipped
+            probe_every: Run a skipped extractor anyway on every n-th document
+        """
+        self.window = window
+        self.min_attempts = min_attempts
+        self.probe_every = probe_every
+        self._lock = threading.Lock()
+        self._outcomes: Dict[Tuple[str, str], Deque[bool]] = {}
+        self._skips: Dict[Tuple[str, str], int] = {}
+
+    def record(self, extension: str, method: str, success: bool) -> None:
+        """Record whether an extractor produced usable text."""
+        key = (extension, method)
+        with self._lock:
+            outcomes = self._outcomes.get(key)
+            if outcomes is None:
+                outcomes = self._outcomes[key] = deque(maxlen=self.window)
+            outcomes.append(success)
+
+    def should_skip(self, extension: str, method: str) -> bool:
+        """
+        Check whether an extractor is known to fail for a file type.
+
+        An extractor is skipped once it failed on all of at least `min_attempts`
+        recent attempts, except on every `probe_every`-th call.
+
+        Args:
+            extension: File extension (e.g. '.doc')
+            method: Extractor name
+
+        Returns:
+            bool: True if the extractor should not be run for this document
+        """
+        key = (extension, method)
+        with self._lock:
+            outcomes = self._outcomes.get(key)
+            if outcomes is None or len(outcomes) < self.min_attempts or any(outcomes):
+                return False
+            skips = self._skips.get(key, 0) + 1
+            self._skips[key] = skips
+            return skips % self.probe_every != 0
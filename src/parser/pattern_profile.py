@@ -0,0 +1,278 @@
+"""Per-pattern hit-rate profiling and tuned pattern order for field extraction.
+
+extract_field_value tries each field's patterns in order and stops at the
+first one that yields a valid value. With profiling enabled the parser
+counts, per pattern, how often it was evaluated, how often it matched and
+how often it produced the field's value. The counts accumulate across runs
+in a JSON profile, from which this module prints a report and derives a
+tuned order that the parser loads through PARSER_PATTERN_ORDER_FILE.
+
+Usage:
+    python src/parser/pattern_profile.py logs/pattern_profile.json
+    python src/parser/pattern_profile.py logs/pattern_profile.json --write-order config/pattern_order.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+
+logger = logging.getLogger(__name__)
+
+# 'safe' only moves patterns that never produced a value behind the ones that
+# did, so every profiled document still parses to the same record.
+# 'frequency' sorts by win count, which can change which of two matching
+# patterns takes precedence.
+STRATEGIES = ("safe", "frequency")
+
+
+class PatternProfile:
+    """Thread-safe per-field, per-pattern evaluation counters."""
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize the profile, resuming the counts stored at `path`.
+
+        Args:
+            path: JSON file the profile is loaded from and saved to (None keeps it in memory)
+        """
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._fields: Dict[str, Dict[str, Any]] = {}
+
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._fields = json.load(f).get('fields', {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not load pattern profile {self.path}, starting empty: {e}")
+
+    def record(self, field_name: str, patterns: Sequence[str], winner: Optional[int],
+               matched: Sequence[int]) -> None:
+        """Count one extract_field_value call.
+
+        Args:
+            field_name: Field that was extracted
+            patterns: The field's patterns in the order they were tried
+            winner: Index of the pattern that produced the value (None if none did)
+            matched: Indices of the patterns that matched (including rejected matches)
+        """
+        evaluated = len(patterns) if winner is None else winner + 1
+        with self._lock:
+            stats = self._fields.get(field_name)
+            if stats is None:
+                stats = self._fields[field_name] = {"calls": 0, "evaluations": 0, "misses": 0, "patterns": {}}
+            stats["calls"] += 1
+            stats["evaluations"] += evaluated
+            if winner is None:
+                stats["misses"] += 1
+
+            pattern_stats = stats["patterns"]
+            for index in range(evaluated):
+                counts = pattern_stats.get(patterns[index])
+                if counts is None:
+                    counts = pattern_stats[patterns[index]] = {"evaluated": 0, "matched": 0, "won": 0}
+                counts["evaluated"] += 1
+            for index in matched:
+                pattern_stats[patterns[index]]["matched"] += 1
+            if winner is not None:
+                pattern_stats[patterns[winner]]["won"] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get a copy of the counters."""
+        with self._lock:
+            return json.loads(json.dumps(self._fields))
+
+    def save(self) -> None:
+        """Atomically write the accumulated counts to the profile file."""
+        if self.path is None:
+            return
+        data = {"fields": self.snapshot()}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.path.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            # Key order matters: each field's patterns are kept in the order they are tried
+            json.dump(data, f, indent=2)
+        os.replace(temp_file, self.path)
+
+
+_profiles: Dict[str, PatternProfile] = {}
+_profiles_lock = threading.Lock()
+
+
+def get_pattern_profile(path: str) -> PatternProfile:
+    """Get the process-wide profile for a file.
+
+    Parsers of several controllers (e.g. one per tenant profile) share one
+    instance per file, so their counts add up instead of overwriting each other.
+
+    Args:
+        path: Profile JSON file
+
+    Returns:
+        PatternProfile: Shared profile
+    """
+    key = os.path.abspath(path)
+    with _profiles_lock:
+        profile = _profiles.get(key)
+        if profile is None:
+            profile = _profiles[key] = PatternProfile(key)
+        return profile
+
+
+def tuned_order(stats: Dict[str, Any], strategy: str = "safe") -> List[str]:
+    """Derive a field's pattern order from its profile counts.
+
+    Args:
+        stats: One field's counters from a profile
+        strategy: 'safe' or 'frequency' (see STRATEGIES)
+
+    Returns:
+        List: Patterns in tuned order (only the ones the profile has seen)
+    """
+    # Patterns are always evaluated as a prefix of the field's list, so the
+    # order they were first counted in is the order the parser tries them
+    patterns = list(stats["patterns"])
+    won = {pattern: stats["patterns"][pattern]["won"] for pattern in patterns}
+    winners = [pattern for pattern in patterns if won[pattern]]
+    if strategy == "frequency":
+        winners.sort(key=lambda pattern: -won[pattern])
+    return winners + [pattern for pattern in patterns if not won[pattern]]
+
+
+def projected_evaluations(stats: Dict[str, Any], order: List[str]) -> float:
+    """Average patterns evaluated per call had the profiled calls used `order`."""
+    if not stats["calls"]:
+        return 0.0
+    position = {pattern: index + 1 for index, pattern in enumerate(order)}
+    total = sum(counts["won"] * position[pattern] for pattern, counts in stats["patterns"].items())
+    total += stats["misses"] * len(order)
+    return total / stats["calls"]
+
+
+def build_pattern_order(profile: Dict[str, Dict[str, Any]], strategy: str = "safe",
+                        min_calls: int = 1) -> Dict[str, Any]:
+    """Build the contents of a PARSER_PATTERN_ORDER_FILE from profile counts.
+
+    Args:
+        profile: Per-field counters (PatternProfile.snapshot() or a profile file's 'fields')
+        strategy: 'safe' or 'frequency'
+        min_calls: Fields profiled fewer times than this keep their declared order
+
+    Returns:
+        Dict: {'strategy': ..., 'fields': {field: [patterns...]}}
+    """
+    return {
+        "strategy": strategy,
+        "fields": {
+            field_name: tuned_order(stats, strategy)
+            for field_name, stats in sorted(profile.items())
+            if stats["calls"] >= min_calls
+        },
+    }
+
+
+def load_pattern_order(path: str) -> Dict[str, List[str]]:
+    """Read a pattern order file.
+
+    Args:
+        path: JSON file written by build_pattern_order
+
+    Returns:
+        Dict: Field name -> patterns in preferred order
+
+    Raises:
+        ValueError: If the file is not a pattern order file
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    fields = data.get('fields') if isinstance(data, dict) else None
+    if not isinstance(fields, dict) or not all(isinstance(v, list) for v in fields.values()):
+        raise ValueError(f"{path} is not a pattern order file (expected a 'fields' mapping of lists)")
+    return fields
+
+
+def apply_pattern_order(field_patterns: Dict[str, List[str]],
+                        order: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Reorder declared patterns according to a loaded pattern order.
+
+    Patterns listed in the order come first, in that order. Declared patterns
+    the order does not mention (e.g. added after it was tuned) follow in
+    declaration order, and listed patterns that are no longer declared are
+    ignored, so a stale order file can never drop a pattern.
+
+    Args:
+        field_patterns: Declared patterns per field
+        order: Preferred order per field
+
+    Returns:
+        Dict: Patterns per field in the order to try them
+    """
+    reordered = {}
+    for field_name, patterns in field_patterns.items():
+        preferred = [pattern for pattern in order.get(field_name, []) if pattern in patterns]
+        reordered[field_name] = preferred + [pattern for pattern in patterns if pattern not in preferred]
+    return reordered
+
+
+def format_report(profile: Dict[str, Dict[str, Any]], strategy: str = "safe") -> str:
+    """Format per-field win rates, never-winning patterns and projected savings."""
+    lines = []
+    total_calls = total_current = total_projected = 0.0
+    for field_name, stats in sorted(profile.items()):
+        calls = stats["calls"]
+        if not calls:
+            continue
+        current = stats["evaluations"] / calls
+        projected = projected_evaluations(stats, tuned_order(stats, strategy))
+        total_calls += calls
+        total_current += stats["evaluations"]
+        total_projected += projected * calls
+
+        lines.append(f"{field_name}: {calls} calls, {stats['misses'] / calls:.1%} without a value, "
+                     f"{current:.2f} patterns/call (tuned: {projected:.2f})")
+        for index, (pattern, counts) in enumerate(stats["patterns"].items()):
+            flag = "" if counts["won"] else "   never won"
+            lines.append(f"  [{index}] won {counts['won'] / calls:>6.1%}  matched {counts['matched']:>7}  "
+                         f"evaluated {counts['evaluated']:>7}  {pattern}{flag}")
+
+    if total_calls:
+        lines.append(f"\nOverall: {total_current / total_calls:.2f} patterns evaluated per field, "
+                     f"{total_projected / total_calls:.2f} with the {strategy} tuned order")
+    else:
+        lines.append("Profile is empty")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Report field pattern hit rates and write a tuned pattern order")
+    parser.add_argument("profile", nargs="?", default="./logs/pattern_profile.json",
+                        help="Profile written with PARSER_PROFILE_PATTERNS=true (default: ./logs/pattern_profile.json)")
+    parser.add_argument("--write-order", metavar="FILE", help="Write a tuned order for PARSER_PATTERN_ORDER_FILE")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="safe",
+                        help="'safe' demotes patterns that never won (same results); "
+                             "'frequency' sorts by wins (may change precedence). Default: safe")
+    parser.add_argument("--min-calls", type=int, default=100,
+                        help="Only reorder fields profiled at least this many times (default: 100)")
+    args = parser.parse_args()
+
+    with open(args.profile, 'r', encoding='utf-8') as f:
+        profile = json.load(f).get('fields', {})
+
+    print(format_report(profile, args.strategy))
+
+    if args.write_order:
+        order = build_pattern_order(profile, args.strategy, args.min_calls)
+        with open(args.write_order, 'w', encoding='utf-8') as f:
+            json.dump(order, f, indent=2)
+            f.write("\n")
+        print(f"\nTuned order for {len(order['fields'])} fields written to {args.write_order}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
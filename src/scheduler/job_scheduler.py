@@ -1,236 +1,551 @@
 """Job scheduler for the medical document processing system."""
 
+import heapq
+import itertools
 import logging
 import threading
 import time
-from datetime import datetime, timezone
-from typing import Callable, Optional
-import schedule
-from croniter import croniter
-import pytz
-
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from config.models import ScheduleConfig
+from scheduler.policies import AdaptivePollingPolicy, OVERLAP_SKIP, OVERLAP_COALESCE, OVERLAP_POLICIES
+from utils.metrics import SCHEDULER_DECISIONS, SCHEDULER_INTERVAL
+from utils.lazy_import import lazy_import
+
+
+# Imported when the first job is scheduled rather than at startup
+croniter = lazy_import("croniter")
+pytz = lazy_import("pytz")
 
 
 logger = logging.getLogger(__name__)
 
 
+class IntervalTrigger:
+    """Fixed-rate trigger firing every N seconds.
+
+    Fire times are anchored to the first fire time, so the interval does not
+    drift by the job's own run time. Ticks that were missed while a job was
+    still running are skipped rather than fired back-to-back.
+    """
+
+    def __init__(self, seconds: float):
+        """
+        Initialize the trigger.
+
+        Args:
+            seconds: Interval between fire times
+        """
+        if seconds <= 0:
+            raise ValueError(f"Poll interval must be positive, got: {seconds}")
+        self.seconds = seconds
+
+    def first_fire_time(self, now: float) -> float:
+        """Get the first fire time (monotonic seconds)."""
+        return now + self.seconds
+
+    def next_fire_time(self, previous: float, now: float) -> float:
+        """
+        Get the fire time following a previous one.
+
+        Args:
+            previous: Previous scheduled fire time (monotonic seconds)
+            now: Current monotonic time
+
+        Returns:
+            float: Next fire time on the interval grid that is not in the past
+        """
+        next_time = previous + self.seconds
+        if next_time <= now:
+            missed = int((now - next_time) // self.seconds) + 1
+            next_time += missed * self.seconds
+        return next_time
+
+    def describe(self) -> str:
+        return f"every {self.seconds:g} seconds"
+
+
+class CronTrigger:
+    """Cron expression trigger evaluated in a configured timezone.
+
+    Due times are computed as timezone-aware wall-clock datetimes (so DST
+    transitions follow the cron expression) and converted to a monotonic
+    deadline for sleeping.
+    """
+
+    def __init__(self, expression: str, timezone: str = "UTC"):
+        """
+        Initialize the trigger.
+
+        Args:
+            expression: Cron expression (e.g. '0 2 * * *')
+            timezone: IANA timezone name the expression is evaluated in
+
+        Raises:
+            ValueError: If the expression or timezone is invalid
+        """
+        try:
+            self.tz = pytz.timezone(timezone)
+        except pytz.exceptions.UnknownTimeZoneError as e:
+            raise ValueError(f"Invalid timezone '{timezone}': {e}")
+
+        try:
+            croniter.croniter(expression, datetime.now(self.tz)).get_next(datetime)
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError(f"Invalid cron expression '{expression}': {e}")
+
+        self.expression = expression
+        self.timezone = timezone
+        self.last_wall_time: Optional[datetime] = None
+
+    def next_wall_time(self, after: Optional[datetime] = None) -> datetime:
+        """
+        Get the next matching wall-clock time.
+
+        Args:
+            after: Time to search from (defaults to now)
+
+        Returns:
+            datetime: Timezone-aware next fire time
+        """
+        after = after or datetime.now(self.tz)
+        return croniter.croniter(self.expression, after.astimezone(self.tz)).get_next(datetime)
+
+    def first_fire_time(self, now: float) -> float:
+        """Get the first fire time (monotonic seconds)."""
+        self.last_wall_time = self.next_wall_time()
+        return self._to_monotonic(self.last_wall_time, now)
+
+    def next_fire_time(self, previous: float, now: float) -> float:
+        """Get the next fire time after both the current moment and the previous fire time."""
+        after = datetime.now(self.tz)
+        if self.last_wall_time is not None and after < self.last_wall_time:
+            after = self.last_wall_time
+        self.last_wall_time = self.next_wall_time(after)
+        return self._to_monotonic(self.last_wall_time, now)
+
+    def _to_monotonic(self, wall_time: datetime, now: float) -> float:
+        """Convert a wall-clock fire time to a monotonic deadline."""
+        delay = (wall_time - datetime.now(self.tz)).total_seconds()
+        return now + max(0.0, delay)
+
+    def describe(self) -> str:
+        return f"cron '{self.expression}' ({self.timezone})"
+
+
+class ScheduledJob:
+    """A job registered with the scheduler."""
+
+    def __init__(self, job_id: str, func: Callable[[], Any], trigger,
+                 overlap_policy: str = OVERLAP_SKIP,
+                 adaptive_policy: Optional[AdaptivePollingPolicy] = None):
+        self.job_id = job_id
+        self.func = func
+        self.trigger = trigger
+        self.overlap_policy = overlap_policy
+        self.adaptive_policy = adaptive_policy
+        self.next_run: Optional[float] = None  # Monotonic fire time
+        self.wall_time: Optional[datetime] = None  # Expected wall-clock fire time (cron only)
+        self.last_fire_time: Optional[float] = None
+        self.cancelled = False
+        self.running = False  # Single flight: at most one run in progress
+        self.pending = False  # A coalesced tick is waiting for the current run
+        self.worker: Optional[threading.Thread] = None
+        self.run_count = 0
+        self.skipped_count = 0
+        self.coalesced_count = 0
+        self.last_run_duration: Optional[float] = None
+
+
 class Scheduler:
     """
-    Scheduler class supporting both interval and cron-based scheduling modes.
-    
+    Heap-based timer scheduler supporting interval and cron triggers.
+
+    Jobs are kept in a min-heap ordered by their next fire time. The scheduler
+    thread sleeps on a condition variable exactly until the earliest job is
+    due (or until a job is added or the scheduler is stopped), so an idle
+    scheduler does not wake up at all. All state belongs to the instance.
+
+    Each run executes on its own worker thread so ticks keep being evaluated
+    while a long run is in progress. Runs of the same job never overlap: a
+    tick that fires mid-run is skipped or coalesced into one follow-up run,
+    depending on the job's overlap policy. Interval jobs can additionally use
+    an AdaptivePollingPolicy, fed by the job function's return value (True if
+    the run found work, False if it found none).
+
     Supports:
-    - Interval-based scheduling with configurable seconds
+    - Interval-based scheduling with fixed-rate, drift-free fire times
     - Cron expression scheduling with timezone support
+    - Multiple jobs per scheduler
+    - Single-flight execution with skip/coalesce handling of overlapping ticks
+    - Adaptive interval backoff on empty runs
     - Graceful startup and shutdown
     """
-    
-    def __init__(self, config: ScheduleConfig, job_function: Callable[[], None]):
+
+    def __init__(self, config: ScheduleConfig, job_function: Optional[Callable[[], None]] = None):
         """
         Initialize the scheduler.
-        
+
         Args:
             config: Schedule configuration containing interval/cron settings
-            job_function: The function to execute on schedule
+            job_function: Optional function to schedule using the configured trigger
         """
         self.config = config
-        self.job_function = job_function
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
-        
-        # Validate configuration
-        self._validate_config()
-        
-    def _validate_config(self) -> None:
-        """Validate the schedule configuration."""
-        if self.config.poll_cron:
-            # Validate cron expression
-            try:
-                # Test if cron expression is valid
-                cron = croniter(self.config.poll_cron)
-                # Test getting next execution time
-                cron.get_next(datetime)
-                logger.info(f"Validated cron expression: {self.config.poll_cron}")
-            except (ValueError, TypeError) as e:
-                raise ValueError(f"Invalid cron expression '{self.config.poll_cron}': {e}")
-                
-            # Validate timezone
-            try:
-                pytz.timezone(self.config.timezone)
-                logger.info(f"Validated timezone: {self.config.timezone}")
-            except pytz.exceptions.UnknownTimeZoneError as e:
-                raise ValueError(f"Invalid timezone '{self.config.timezone}': {e}")
+
+        self._condition = threading.Condition()
+        self._heap: List[Tuple[float, int, ScheduledJob]] = []
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._sequence = itertools.count()
+
+        if job_function is not None:
+            self.add_configured_job(job_function, config, job_id="default")
+
+    def add_configured_job(self, func: Callable[[], Any], config: ScheduleConfig,
+                           job_id: Optional[str] = None) -> "ScheduledJob":
+        """
+        Schedule a function with the trigger and policies described by a schedule config.
+
+        Args:
+            func: Function to run
+            config: Schedule configuration (interval/cron, overlap and adaptive polling)
+            job_id: Optional unique job identifier
+
+        Returns:
+            ScheduledJob: The scheduled job
+        """
+        trigger = self.create_trigger(config)
+        adaptive_policy = None
+        if config.adaptive_polling_enabled and isinstance(trigger, IntervalTrigger):
+            adaptive_policy = AdaptivePollingPolicy(
+                base_interval=config.poll_interval_seconds,
+                max_interval=config.adaptive_max_interval_seconds,
+                backoff_factor=config.adaptive_backoff_factor,
+                empty_threshold=config.adaptive_empty_threshold
+            )
+        return self.add_job(func, trigger, job_id=job_id,
+                            overlap_policy=config.overlap_policy, adaptive_policy=adaptive_policy)
+
+    @staticmethod
+    def create_trigger(config: ScheduleConfig):
+        """
+        Build the trigger described by a schedule configuration.
+
+        Args:
+            config: Schedule configuration
+
+        Returns:
+            CronTrigger if a cron expression is configured, otherwise IntervalTrigger
+
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        if config.poll_cron:
+            trigger = CronTrigger(config.poll_cron, config.timezone)
+            logger.info(f"Validated cron expression: {config.poll_cron} (timezone: {config.timezone})")
         else:
-            # Validate interval
-            if self.config.poll_interval_seconds <= 0:
-                raise ValueError(f"Poll interval must be positive, got: {self.config.poll_interval_seconds}")
-            logger.info(f"Validated interval: {self.config.poll_interval_seconds} seconds")
-    
-    def _setup_interval_schedule(self) -> None:
-        """Set up interval-based scheduling."""
-        logger.info(f"Setting up interval scheduling: every {self.config.poll_interval_seconds} seconds")
-        schedule.every(self.config.poll_interval_seconds).seconds.do(self._safe_job_execution)
-        
-    def _setup_cron_schedule(self) -> None:
-        """Set up cron-based scheduling."""
-        logger.info(f"Setting up cron scheduling: {self.config.poll_cron} (timezone: {self.config.timezone})")
-        # For cron scheduling, we'll use a different approach since the schedule library
-        # doesn't directly support cron expressions. We'll use croniter to calculate
-        # next execution times and schedule accordingly.
-        self._schedule_next_cron_job()
-        
-    def _schedule_next_cron_job(self) -> None:
-        """Schedule the next cron job execution."""
-        if not self._running:
+            trigger = IntervalTrigger(config.poll_interval_seconds)
+            logger.info(f"Validated interval: {config.poll_interval_seconds} seconds")
+        return trigger
+
+    def add_job(self, func: Callable[[], Any], trigger, job_id: Optional[str] = None,
+                overlap_policy: str = OVERLAP_SKIP,
+                adaptive_policy: Optional[AdaptivePollingPolicy] = None) -> ScheduledJob:
+        """
+        Register a job.
+
+        Args:
+            func: Function to execute when the job fires
+            trigger: IntervalTrigger or CronTrigger
+            job_id: Unique job identifier (generated if omitted)
+            overlap_policy: 'skip' or 'coalesce' for ticks that fire while a run is in progress
+            adaptive_policy: Optional adaptive interval policy (interval triggers only)
+
+        Returns:
+            ScheduledJob: The registered job
+
+        Raises:
+            ValueError: If a job with the same ID already exists or the policy is invalid
+        """
+        if overlap_policy not in OVERLAP_POLICIES:
+            raise ValueError(f"Invalid overlap policy '{overlap_policy}', expected one of {OVERLAP_POLICIES}")
+        if adaptive_policy is not None and not isinstance(trigger, IntervalTrigger):
+            raise ValueError("Adaptive polling requires an interval trigger")
+
+        with self._condition:
+            job_id = job_id or f"job-{next(self._sequence)}"
+            if job_id in self._jobs:
+                raise ValueError(f"Job '{job_id}' is already scheduled")
+
+            job = ScheduledJob(job_id, func, trigger, overlap_policy, adaptive_policy)
+            self._jobs[job_id] = job
+            if isinstance(trigger, IntervalTrigger):
+                SCHEDULER_INTERVAL.labels(job=job_id).set(trigger.seconds)
+
+            # Jobs added before start() are queued when the scheduler starts
+            if self._running:
+                self._push(job, trigger.first_fire_time(time.monotonic()))
+
+            logger.info(f"Scheduled job '{job_id}': {trigger.describe()}")
+            return job
+
+    def remove_job(self, job_id: str) -> bool:
+        """
+        Remove a job.
+
+        Args:
+            job_id: Identifier of the job to remove
+
+        Returns:
+            bool: True if the job existed
+        """
+        with self._condition:
+            job = self._jobs.pop(job_id, None)
+            if job is None:
+                return False
+            job.cancelled = True
+            self._condition.notify()
+            return True
+
+    def get_jobs(self) -> List[ScheduledJob]:
+        """Get all registered jobs."""
+        with self._condition:
+            return list(self._jobs.values())
+
+    def _push(self, job: ScheduledJob, fire_time: float) -> None:
+        """Queue a job's next fire time and wake the scheduler thread (caller holds the lock)."""
+        job.next_run = fire_time
+        if isinstance(job.trigger, CronTrigger):
+            job.wall_time = job.trigger.last_wall_time
+        heapq.heappush(self._heap, (fire_time, next(self._sequence), job))
+        self._condition.notify()
+
+    def _next_due_job(self) -> Optional[ScheduledJob]:
+        """Block until a job is due and pop it, or return None when stopped."""
+        with self._condition:
+            while self._running:
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+
+                fire_time, _, job = self._heap[0]
+                if job.cancelled or fire_time != job.next_run:
+                    heapq.heappop(self._heap)
+                    continue
+
+                delay = fire_time - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+
+                # A cron deadline can arrive early if the wall clock was adjusted
+                if job.wall_time is not None:
+                    remaining = (job.wall_time - datetime.now(job.trigger.tz)).total_seconds()
+                    if remaining > 0.001:
+                        heapq.heappop(self._heap)
+                        self._push(job, time.monotonic() + remaining)
+                        continue
+
+                # Queue the following tick now, so ticks keep coming during the run
+                heapq.heappop(self._heap)
+                job.last_fire_time = fire_time
+                self._push(job, job.trigger.next_fire_time(fire_time, time.monotonic()))
+                return job
+
+            return None
+
+    def _dispatch(self, job: ScheduledJob) -> None:
+        """Start a run of a due job, or apply its overlap policy if one is in progress."""
+        with self._condition:
+            if job.cancelled or not self._running:
+                return
+
+            if job.running:
+                if job.overlap_policy == OVERLAP_COALESCE:
+                    job.pending = True
+                    job.coalesced_count += 1
+                    SCHEDULER_DECISIONS.labels(job=job.job_id, decision="coalesced").inc()
+                    logger.info(f"Job '{job.job_id}' is still running; tick coalesced into a follow-up run")
+                else:
+                    job.skipped_count += 1
+                    SCHEDULER_DECISIONS.labels(job=job.job_id, decision="skipped").inc()
+                    logger.warning(f"Job '{job.job_id}' is still running; skipped overlapping tick")
+                return
+
+            job.running = True
+            SCHEDULER_DECISIONS.labels(job=job.job_id, decision="run").inc()
+            job.worker = threading.Thread(target=self._run_job, args=(job,),
+                                          name=f"scheduler-job-{job.job_id}", daemon=True)
+            job.worker.start()
+
+    def _run_job(self, job: ScheduledJob) -> None:
+        """Worker thread body: run a job, then any coalesced follow-up run."""
+        while True:
+            result = self._safe_job_execution(job)
+
+            with self._condition:
+                if job.adaptive_policy is not None:
+                    self._apply_adaptive_interval(job, result)
+
+                if job.pending and self._running and not job.cancelled:
+                    job.pending = False
+                    SCHEDULER_DECISIONS.labels(job=job.job_id, decision="coalesced_run").inc()
+                    continue
+
+                job.pending = False
+                job.running = False
+                return
+
+    def _apply_adaptive_interval(self, job: ScheduledJob, result: Any) -> None:
+        """Feed a run's result to the job's adaptive policy and requeue it if the interval changed (caller holds the lock)."""
+        found_work = result if isinstance(result, bool) else None
+        interval = job.adaptive_policy.record_result(found_work)
+        if interval == job.trigger.seconds:
             return
-            
-        try:
-            # Get timezone object
-            tz = pytz.timezone(self.config.timezone)
-            
-            # Get current time in the specified timezone
-            now = datetime.now(tz)
-            
-            # Calculate next execution time
-            cron = croniter(self.config.poll_cron, now)
-            next_run = cron.get_next(datetime)
-            
-            # Calculate seconds until next run
-            seconds_until_next = (next_run - now).total_seconds()
-            
-            logger.info(f"Next cron execution scheduled for: {next_run} ({seconds_until_next:.1f} seconds)")
-            
-            # Schedule the job
-            schedule.every(int(seconds_until_next)).seconds.do(self._cron_job_wrapper).tag('cron_job')
-            
-        except Exception as e:
-            logger.error(f"Error scheduling next cron job: {e}")
-            # Fallback to interval scheduling
-            self._setup_interval_schedule()
-    
-    def _cron_job_wrapper(self) -> None:
-        """Wrapper for cron job execution that reschedules the next run."""
-        try:
-            # Execute the job
-            self._safe_job_execution()
-            
-            # Clear the current cron job
-            schedule.clear('cron_job')
-            
-            # Schedule the next cron job
-            self._schedule_next_cron_job()
-            
-        except Exception as e:
-            logger.error(f"Error in cron job wrapper: {e}")
-    
-    def _safe_job_execution(self) -> None:
-        """Safely execute the job function with error handling."""
+
+        decision = "backoff" if interval > job.trigger.seconds else "reset"
+        SCHEDULER_DECISIONS.labels(job=job.job_id, decision=decision).inc()
+        SCHEDULER_INTERVAL.labels(job=job.job_id).set(interval)
+
+        job.trigger.seconds = interval
+        if self._running and not job.cancelled and job.last_fire_time is not None:
+            self._push(job, job.trigger.next_fire_time(job.last_fire_time, time.monotonic()))
+
+    def _safe_job_execution(self, job: ScheduledJob) -> Any:
+        """Safely execute a job's function with error handling.
+
+        Returns:
+            The job function's return value, or None if it raised
+        """
+        result = None
         try:
-            logger.info("Executing scheduled job")
-            start_time = time.time()
-            
-            self.job_function()
-            
-            execution_time = time.time() - start_time
-            logger.info(f"Job completed successfully in {execution_time:.2f} seconds")
-            
+            logger.info(f"Executing scheduled job '{job.job_id}'")
+            start_time = time.monotonic()
+
+            result = job.func()
+
+            job.last_run_duration = time.monotonic() - start_time
+            logger.info(f"Job '{job.job_id}' completed successfully in {job.last_run_duration:.2f} seconds")
+
         except Exception as e:
-            logger.error(f"Error executing scheduled job: {e}", exc_info=True)
-    
+            logger.error(f"Error executing scheduled job '{job.job_id}': {e}", exc_info=True)
+        finally:
+            job.run_count += 1
+
+        return result
+
     def _run_scheduler(self) -> None:
         """Main scheduler loop running in a separate thread."""
         logger.info("Scheduler thread started")
-        
+
         try:
-            # Set up the appropriate scheduling mode
-            if self.config.poll_cron:
-                self._setup_cron_schedule()
-            else:
-                self._setup_interval_schedule()
-            
-            # Main scheduling loop
-            while self._running and not self._stop_event.is_set():
-                try:
-                    schedule.run_pending()
-                    # Check every second for pending jobs
-                    self._stop_event.wait(1.0)
-                    
-                except Exception as e:
-                    logger.error(f"Error in scheduler loop: {e}", exc_info=True)
-                    # Continue running even if there's an error
-                    time.sleep(1.0)
-                    
+            while True:
+                job = self._next_due_job()
+                if job is None:
+                    break
+
+                self._dispatch(job)
+
         except Exception as e:
             logger.error(f"Fatal error in scheduler thread: {e}", exc_info=True)
         finally:
             logger.info("Scheduler thread stopped")
-    
+
     def start(self) -> None:
         """Start the scheduler."""
-        if self._running:
-            logger.warning("Scheduler is already running")
-            return
-            
-        logger.info("Starting scheduler")
-        self._running = True
-        self._stop_event.clear()
-        
+        with self._condition:
+            if self._running:
+                logger.warning("Scheduler is already running")
+                return
+
+            logger.info("Starting scheduler")
+            self._running = True
+
+            now = time.monotonic()
+            for job in self._jobs.values():
+                self._push(job, job.trigger.first_fire_time(now))
+
         # Start the scheduler thread
-        self._thread = threading.Thread(target=self._run_scheduler, daemon=True)
+        self._thread = threading.Thread(target=self._run_scheduler, name="scheduler", daemon=True)
         self._thread.start()
-        
+
         # Log the scheduling mode
         if self.config.poll_cron:
             logger.info(f"Scheduler started in cron mode: {self.config.poll_cron} (timezone: {self.config.timezone})")
         else:
             logger.info(f"Scheduler started in interval mode: every {self.config.poll_interval_seconds} seconds")
-    
+
     def stop(self) -> None:
         """Stop the scheduler gracefully."""
-        if not self._running:
-            logger.warning("Scheduler is not running")
-            return
-            
-        logger.info("Stopping scheduler")
-        self._running = False
-        self._stop_event.set()
-        
-        # Clear all scheduled jobs
-        schedule.clear()
-        
-        # Wait for the thread to finish
-        if self._thread and self._thread.is_alive():
+        with self._condition:
+            if not self._running:
+                logger.warning("Scheduler is not running")
+                return
+
+            logger.info("Stopping scheduler")
+            self._running = False
+            self._heap.clear()
+            self._condition.notify_all()
+
+        # Wait for the scheduler thread, then give in-flight runs a chance to finish
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
             self._thread.join(timeout=5.0)
             if self._thread.is_alive():
                 logger.warning("Scheduler thread did not stop within timeout")
             else:
                 logger.info("Scheduler stopped successfully")
-        
+
+        for job in self.get_jobs():
+            worker = job.worker
+            if worker and worker.is_alive() and worker is not threading.current_thread():
+                worker.join(timeout=5.0)
+                if worker.is_alive():
+                    logger.warning(f"Job '{job.job_id}' was still running when the scheduler stopped")
+
         self._thread = None
-    
+
     def is_running(self) -> bool:
         """Check if the scheduler is currently running."""
         return self._running and self._thread is not None and self._thread.is_alive()
-    
-    def get_next_run_time(self) -> Optional[datetime]:
-        """Get the next scheduled run time."""
+
+    def get_next_run_time(self, job_id: Optional[str] = None) -> Optional[datetime]:
+        """
+        Get the next scheduled run time.
+
+        Args:
+            job_id: Job to query (defaults to the earliest due job)
+
+        Returns:
+            datetime: Timezone-aware next run time, or None if nothing is scheduled
+        """
         try:
-            if self.config.poll_cron:
-                # For cron scheduling, calculate next run time
-                tz = pytz.timezone(self.config.timezone)
-                now = datetime.now(tz)
-                cron = croniter(self.config.poll_cron, now)
-                return cron.get_next(datetime)
-            else:
-                # For interval scheduling, we can't easily predict the exact next run
-                # since it depends on when the last job finished
-                return None
-                
+            with self._condition:
+                if job_id is not None:
+                    jobs = [self._jobs[job_id]] if job_id in self._jobs else []
+                else:
+                    jobs = list(self._jobs.values())
+
+                run_times = [self._next_wall_clock(job) for job in jobs]
+                run_times = [run_time for run_time in run_times if run_time is not None]
+                return min(run_times) if run_times else None
+
         except Exception as e:
             logger.error(f"Error calculating next run time: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def _next_wall_clock(self, job: ScheduledJob) -> Optional[datetime]:
+        """Get a job's next fire time as a timezone-aware wall-clock time."""
+        if job.wall_time is not None:
+            return job.wall_time
+
+        if job.next_run is None:
+            # Not started yet: report when it would first fire
+            if isinstance(job.trigger, CronTrigger):
+                return job.trigger.next_wall_time()
+            delay = job.trigger.seconds
+        else:
+            delay = max(0.0, job.next_run - time.monotonic())
+
+        return datetime.now(pytz.timezone(self.config.timezone)) + timedelta(seconds=delay)
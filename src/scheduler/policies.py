@@ -0,0 +1,84 @@
+"""Scheduling policies: overlap handling and adaptive polling intervals."""
+
+import logging
+import threading
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+# What to do with a tick that fires while the previous run is still in progress
+OVERLAP_SKIP = "skip"          # Drop the tick; the next run happens at the next tick
+OVERLAP_COALESCE = "coalesce"  # Remember it; run once as soon as the current run finishes
+OVERLAP_POLICIES = (OVERLAP_SKIP, OVERLAP_COALESCE)
+
+
+class AdaptivePollingPolicy:
+    """Lengthens the polling interval while scans come back empty.
+
+    After ``empty_threshold`` consecutive runs that found no work, each further
+    empty run multiplies the interval by ``backoff_factor`` up to
+    ``max_interval``. The first run that finds work resets the interval to the
+    base interval, so latency stays low as soon as files start arriving.
+    """
+
+    def __init__(self, base_interval: float, max_interval: float,
+                 backoff_factor: float = 2.0, empty_threshold: int = 3):
+        """
+        Initialize the policy.
+
+        Args:
+            base_interval: Normal polling interval in seconds
+            max_interval: Upper bound for the backed-off interval in seconds
+            backoff_factor: Multiplier applied per empty run once backing off
+            empty_threshold: Consecutive empty runs before backing off
+        """
+        if max_interval < base_interval:
+            raise ValueError("Adaptive polling max interval must be at least the base interval")
+        if backoff_factor <= 1.0:
+            raise ValueError("Adaptive polling backoff factor must be greater than 1")
+
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.empty_threshold = max(1, empty_threshold)
+
+        self._lock = threading.Lock()
+        self._interval = base_interval
+        self._consecutive_empty = 0
+
+    @property
+    def interval(self) -> float:
+        """Current polling interval in seconds."""
+        return self._interval
+
+    def record_result(self, found_work: Optional[bool]) -> float:
+        """
+        Update the interval from the outcome of a run.
+
+        Args:
+            found_work: True if the run found files, False if the scan was empty,
+                None if unknown (e.g. the run failed), which leaves the interval as is
+
+        Returns:
+            float: Interval to use until the next run
+        """
+        with self._lock:
+            if found_work is None:
+                return self._interval
+
+            previous = self._interval
+            if found_work:
+                self._consecutive_empty = 0
+                self._interval = self.base_interval
+            else:
+                self._consecutive_empty += 1
+                if self._consecutive_empty > self.empty_threshold:
+                    self._interval = min(self.max_interval, self._interval * self.backoff_factor)
+
+            if self._interval != previous:
+                reason = "files found" if found_work else f"{self._consecutive_empty} consecutive empty scans"
+                logger.info(f"Adaptive polling: interval {previous:g}s -> {self._interval:g}s ({reason})")
+
+            return self._interval
@@ -4,19 +4,21 @@ import os
 import time
 import logging
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from contextlib import contextmanager
-from dataclasses import dataclass
 
-import paramiko
-from paramiko import SFTPClient, SSHClient
+from config.models import SFTPConfig, FileInfo
+from utils.error_handler import handle_error, ErrorCategory, ErrorSeverity
+from utils.connection_pool import ConnectionPool
+from utils.metrics import FILES_TRANSFERRED, BYTES_TRANSFERRED, TRANSFER_RETRIES
+from utils.lazy_import import lazy_import
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if TYPE_CHECKING:
+    from paramiko import SFTPClient
 
-from config.models import SFTPConfig
-from utils.error_handler import handle_error, ErrorCategory, ErrorSeverity
+
+# Imported on the first connection rather than at startup
+paramiko = lazy_import("paramiko")
 
 
 logger = logging.getLogger(__name__)
@@ -37,31 +39,22 @@ class SFTPFileError(SFTPError):
     pass
 
 
-@dataclass
-class FileInfo:
-    """Information about a remote file."""
-    filename: str
-    full_path: str
-    size: int
-    mtime: datetime
-    is_directory: bool = False
-
-
 class SFTPManager:
     """Manages SFTP connections and file operations with retry logic."""
     
-    def __init__(self, max_retries: int = 3, retry_delay: float = 1.0):
+    def __init__(self, max_retries: int = 3, retry_delay: float = 1.0,
+                 connection_pool: Optional[ConnectionPool] = None):
         """
         Initialize SFTP manager.
         
         Args:
             max_retries: Maximum number of retry attempts for failed operations
             retry_delay: Delay in seconds between retry attempts
+            connection_pool: Optional shared pool for reusing connections across jobs
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self._ssh_client = None
-        self._sftp_client = None
+        self.connection_pool = connection_pool
     
     @contextmanager
     def connect(self, config: SFTPConfig):
@@ -77,15 +70,42 @@ class SFTPManager:
         Raises:
             SFTPConnectionError: If connection fails after all retries
         """
+        if self.connection_pool is not None:
+            key = ("sftp", config.host, config.port, config.username)
+            with self.connection_pool.connection(
+                key,
+                connect=lambda: self._establish_connection(config),
+                close=self._close_connection,
+                is_alive=self._is_connection_alive
+            ) as client:
+                yield client
+            return
+        
         client = None
         try:
             client = self._establish_connection(config)
             yield client
         finally:
             if client:
-                self._close_connection()
+                self._close_connection(client)
+    
+    def _is_connection_alive(self, client: 'SFTPClient') -> bool:
+        """
+        Check that a pooled SFTP connection is still usable.
+        
+        Args:
+            client: Idle SFTP client taken from the pool
+            
+        Returns:
+            True if the underlying transport is active and responds
+        """
+        transport = client.get_channel().get_transport()
+        if transport is None or not transport.is_active():
+            return False
+        client.stat('.')
+        return True
     
-    def _establish_connection(self, config: SFTPConfig) -> SFTPClient:
+    def _establish_connection(self, config: SFTPConfig) -> 'SFTPClient':
         """
         Establish SFTP connection with retry logic.
         
@@ -101,15 +121,16 @@ class SFTPManager:
         last_error = None
         
         for attempt in range(self.max_retries):
+            ssh_client = None
             try:
                 logger.info(f"Attempting SFTP connection to {config.host}:{config.port} (attempt {attempt + 1}/{self.max_retries})")
                 
                 # Create SSH client
-                self._ssh_client = SSHClient()
-                self._ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+                ssh_client = paramiko.SSHClient()
+                ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
                 
                 # Connect with timeout
-                self._ssh_client.connect(
+                ssh_client.connect(
                     hostname=config.host,
                     port=config.port,
                     username=config.username,
@@ -120,17 +141,17 @@ class SFTPManager:
                 )
                 
                 # Open SFTP channel
-                self._sftp_client = self._ssh_client.open_sftp()
+                sftp_client = ssh_client.open_sftp()
                 
                 # Test connection by listing the remote path
                 try:
-                    self._sftp_client.listdir(config.remote_path)
+                    sftp_client.listdir(config.remote_path)
                     logger.debug(f"Verified remote path exists: {config.remote_path}")
                 except FileNotFoundError:
                     logger.warning(f"Remote path {config.remote_path} does not exist, will be created if needed")
                 
                 logger.info(f"Successfully connected to SFTP server {config.host}:{config.port}")
-                return self._sftp_client
+                return sftp_client
                 
             except Exception as e:
                 last_error = e
@@ -157,9 +178,14 @@ class SFTPManager:
                 )
                 
                 # Clean up failed connection
-                self._close_connection()
+                if ssh_client:
+                    try:
+                        ssh_client.close()
+                    except Exception:
+                        pass
                 
                 if attempt < self.max_retries - 1:
+                    TRANSFER_RETRIES.labels(protocol="sftp", operation="connect").inc()
                     logger.info(f"Retrying in {self.retry_delay} seconds...")
                     time.sleep(self.retry_delay)
         
@@ -171,25 +197,31 @@ class SFTPManager:
         logger.error(error_msg)
         raise SFTPConnectionError(error_msg)
     
-    def _close_connection(self):
-        """Close SFTP and SSH connections."""
-        if self._sftp_client:
-            try:
-                self._sftp_client.close()
-            except Exception as e:
-                logger.warning(f"Error closing SFTP client: {e}")
-            finally:
-                self._sftp_client = None
+    def _close_connection(self, client: 'SFTPClient'):
+        """
+        Close an SFTP client and the SSH transport it runs on.
+        
+        Args:
+            client: SFTP client to close
+        """
+        transport = None
+        try:
+            transport = client.get_channel().get_transport()
+        except Exception:
+            pass
+        
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"Error closing SFTP client: {e}")
         
-        if self._ssh_client:
+        if transport is not None:
             try:
-                self._ssh_client.close()
+                transport.close()
             except Exception as e:
-                logger.warning(f"Error closing SSH client: {e}")
-            finally:
-                self._ssh_client = None
+                logger.warning(f"Error closing SSH transport: {e}")
     
-    def list_zip_files(self, client: SFTPClient, remote_path: str) -> List[FileInfo]:
+    def list_zip_files(self, client: 'SFTPClient', remote_path: str) -> List[FileInfo]:
         """
         List all ZIP files in the remote directory.
         
@@ -267,7 +299,7 @@ class SFTPManager:
             
             raise SFTPFileError(error_msg)
     
-    def download_file(self, client: SFTPClient, remote_path: str, local_path: str) -> bool:
+    def download_file(self, client: 'SFTPClient', remote_path: str, local_path: str) -> bool:
         """
         Download a file from the remote server with retry logic.
         
@@ -305,6 +337,8 @@ class SFTPManager:
                     local_size = os.path.getsize(local_path)
                     if local_size == remote_size:
                         logger.info(f"Successfully downloaded {remote_path} ({local_size} bytes)")
+                        FILES_TRANSFERRED.labels(protocol="sftp", direction="download", outcome="success").inc()
+                        BYTES_TRANSFERRED.labels(protocol="sftp", direction="download").inc(local_size)
                         return True
                     else:
                         raise SFTPFileError(f"File size mismatch: remote={remote_size}, local={local_size}")
@@ -323,10 +357,12 @@ class SFTPManager:
                         pass
                 
                 if attempt < self.max_retries - 1:
+                    TRANSFER_RETRIES.labels(protocol="sftp", operation="download").inc()
                     logger.info(f"Retrying download in {self.retry_delay} seconds...")
                     time.sleep(self.retry_delay)
         
         # All attempts failed
+        FILES_TRANSFERRED.labels(protocol="sftp", direction="download", outcome="failed").inc()
         error_msg = f"Failed to download {remote_path} after {self.max_retries} attempts"
         if last_error:
             error_msg += f". Last error: {str(last_error)}"
@@ -334,7 +370,7 @@ class SFTPManager:
         logger.error(error_msg)
         raise SFTPFileError(error_msg)
     
-    def upload_file(self, client: SFTPClient, local_path: str, remote_path: str) -> bool:
+    def upload_file(self, client: 'SFTPClient', local_path: str, remote_path: str) -> bool:
         """
         Upload a file to the remote server with retry logic.
         
@@ -374,6 +410,8 @@ class SFTPManager:
                     
                     if remote_size == local_size:
                         logger.info(f"Successfully uploaded {local_path} ({local_size} bytes)")
+                        FILES_TRANSFERRED.labels(protocol="sftp", direction="upload", outcome="success").inc()
+                        BYTES_TRANSFERRED.labels(protocol="sftp", direction="upload").inc(local_size)
                         return True
                     else:
                         raise SFTPFileError(f"File size mismatch: local={local_size}, remote={remote_size}")
@@ -392,10 +430,12 @@ class SFTPManager:
                     pass
                 
                 if attempt < self.max_retries - 1:
+                    TRANSFER_RETRIES.labels(protocol="sftp", operation="upload").inc()
                     logger.info(f"Retrying upload in {self.retry_delay} seconds...")
                     time.sleep(self.retry_delay)
         
         # All attempts failed
+        FILES_TRANSFERRED.labels(protocol="sftp", direction="upload", outcome="failed").inc()
         error_msg = f"Failed to upload {local_path} after {self.max_retries} attempts"
         if last_error:
             error_msg += f". Last error: {str(last_error)}"
@@ -403,7 +443,7 @@ class SFTPManager:
         logger.error(error_msg)
         raise SFTPFileError(error_msg)
     
-    def get_file_mtime(self, client: SFTPClient, remote_path: str) -> Optional[datetime]:
+    def get_file_mtime(self, client: 'SFTPClient', remote_path: str) -> Optional[datetime]:
         """
         Get the modification time of a remote file.
         
@@ -427,7 +467,7 @@ class SFTPManager:
             logger.error(error_msg)
             raise SFTPFileError(error_msg)
     
-    def file_exists(self, client: SFTPClient, remote_path: str) -> bool:
+    def file_exists(self, client: 'SFTPClient', remote_path: str) -> bool:
         """
         Check if a remote file exists.
         
@@ -447,7 +487,7 @@ class SFTPManager:
             logger.warning(f"Error checking if file exists {remote_path}: {e}")
             return False
     
-    def _ensure_remote_directory(self, client: SFTPClient, remote_dir: str):
+    def _ensure_remote_directory(self, client: 'SFTPClient', remote_dir: str):
         """
         Ensure remote directory exists, creating it if necessary.
         
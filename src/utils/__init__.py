@@ -1,7 +1,7 @@
 # Utilities module
 
-from .date_utils import normalize_date, extract_date_from_text
+from .date_utils import normalize_date, normalize_dates, extract_date_from_text
 from .file_tracker import FileTracker
 from .csv_generator import CSVGenerator
 
-__all__ = ['normalize_date', 'extract_date_from_text', 'FileTracker', 'CSVGenerator']
\ No newline at end of file
+__all__ = ['normalize_date', 'normalize_dates', 'extract_date_from_text', 'FileTracker', 'CSVGenerator']
\ No newline at end of file
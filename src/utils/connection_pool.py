@@ -0,0 +1,136 @@
+"""Shared connection pool with per-host connection limits."""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """Keeps idle connections for reuse and caps concurrent connections per host.
+
+    Connections are keyed by (protocol, host, port, username), so jobs that
+    talk to the same server share connections while different accounts on
+    the same host do not. A connection is returned to the pool only when the
+    block using it completed without an exception; anything that failed
+    mid-transfer is closed rather than handed to the next caller.
+    """
+
+    def __init__(self, max_connections_per_host: int = 4, max_idle_per_host: int = 2,
+                 idle_timeout: float = 300.0):
+        """
+        Initialize the pool.
+
+        Args:
+            max_connections_per_host: Concurrent connections allowed per key (0 = unlimited)
+            max_idle_per_host: Idle connections kept per key for reuse (0 = no reuse)
+            idle_timeout: Seconds after which an idle connection is discarded
+        """
+        self.max_connections_per_host = max_connections_per_host
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout = idle_timeout
+
+        self._lock = threading.Lock()
+        self._idle: Dict[Hashable, Deque[Tuple[Any, float, Callable]]] = {}
+        self._limits: Dict[Hashable, threading.BoundedSemaphore] = {}
+        self._closed = False
+
+    def _limit_for(self, key: Hashable) -> Optional[threading.BoundedSemaphore]:
+        """Get the connection limit semaphore for a key."""
+        if self.max_connections_per_host <= 0:
+            return None
+        with self._lock:
+            limit = self._limits.get(key)
+            if limit is None:
+                limit = threading.BoundedSemaphore(self.max_connections_per_host)
+                self._limits[key] = limit
+            return limit
+
+    def _checkout(self, key: Hashable, is_alive: Optional[Callable[[Any], bool]]) -> Optional[Any]:
+        """Take a live idle connection for a key, discarding stale ones."""
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                client, released_at, close = idle.pop()
+
+            if time.monotonic() - released_at > self.idle_timeout:
+                close(client)
+                continue
+
+            try:
+                if is_alive is None or is_alive(client):
+                    return client
+            except Exception as e:
+                logger.debug(f"Pooled connection to {key} failed liveness check: {e}")
+            close(client)
+
+    def _checkin(self, key: Hashable, client: Any, close: Callable[[Any], None]) -> None:
+        """Return a connection to the pool, or close it if the pool is full."""
+        with self._lock:
+            if not self._closed and self.max_idle_per_host > 0:
+                idle = self._idle.setdefault(key, deque())
+                if len(idle) < self.max_idle_per_host:
+                    idle.append((client, time.monotonic(), close))
+                    return
+        close(client)
+
+    @contextmanager
+    def connection(self, key: Hashable, connect: Callable[[], Any], close: Callable[[Any], None],
+                   is_alive: Optional[Callable[[Any], bool]] = None):
+        """
+        Context manager that lends a pooled or newly opened connection.
+
+        Blocks while the key is at its connection limit.
+
+        Args:
+            key: Pool key identifying the server and account
+            connect: Opens a new connection
+            close: Closes a connection
+            is_alive: Checks that an idle connection is still usable
+
+        Yields:
+            The connection
+        """
+        limit = self._limit_for(key)
+        if limit is not None:
+            limit.acquire()
+
+        try:
+            client = self._checkout(key, is_alive)
+            if client is None:
+                client = connect()
+            else:
+                logger.debug(f"Reusing pooled connection to {key}")
+
+            try:
+                yield client
+            except BaseException:
+                close(client)
+                raise
+            else:
+                self._checkin(key, client, close)
+        finally:
+            if limit is not None:
+                limit.release()
+
+    def get_idle_count(self) -> int:
+        """Get the number of idle connections across all keys."""
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
+
+    def close_all(self) -> None:
+        """Close all idle connections and stop pooling returned ones."""
+        with self._lock:
+            self._closed = True
+            idle_entries = [entry for idle in self._idle.values() for entry in idle]
+            self._idle.clear()
+
+        for client, _, close in idle_entries:
+            close(client)
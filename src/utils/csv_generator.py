@@ -4,20 +4,100 @@ import csv
 import os
 import shutil
 from datetime import datetime, timedelta
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 import logging
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from config.models import MedicalRecord, StorageConfig, RetentionConfig
 
 
 logger = logging.getLogger(__name__)
 
 
+class CSVRecordSink:
+    """Streams medical records to a CSV file as they are produced.
+
+    Rows are written as plain tuples in CSV_COLUMNS order through a buffered
+    file handle, so memory use does not grow with the number of records. The
+    file is written under a temporary name and renamed into place by close(),
+    so readers never see a partial CSV; abort() discards it instead. Used as
+    a context manager, the file is committed on success and discarded if the
+    block raises.
+    """
+
+    # MedicalRecord attributes in CSV_COLUMNS order
+    RECORD_FIELDS = (
+        'source_file', 'first_name', 'last_name', 'date_of_birth', 'record_number',
+        'case_number', 'accident_date', 'provider_first', 'provider_last', 'exam_date',
+        'exam_place', 'transcriptionist', 'dd_date', 'transcription_date', 'job_number',
+        'case_code'
+    )
+
+    _record_row = attrgetter(*RECORD_FIELDS)
+
+    def __init__(self, csv_path: str, buffer_size: int = 64 * 1024):
+        """Open the temporary file and write the header row.
+
+        Args:
+            csv_path: Final path of the CSV file
+            buffer_size: Write buffer size in bytes
+        """
+        self.csv_path = Path(csv_path)
+        self.tmp_path = self.csv_path.with_name(self.csv_path.name + ".tmp")
+        self.rows = 0
+        self.size = 0
+
+        self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.tmp_path, 'w', newline='', encoding='utf-8', buffering=buffer_size)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(CSVGenerator.CSV_COLUMNS)
+        self._file.flush()
+
+    def write(self, record: MedicalRecord) -> None:
+        """Append one record."""
+        self._writer.writerow(self._record_row(record))
+        self.rows += 1
+
+    def write_all(self, records: Iterable[MedicalRecord]) -> None:
+        """Append every record from an iterable."""
+        for record in records:
+            self.write(record)
+
+    def close(self) -> str:
+        """Flush the file and rename it into place.
+
+        Returns:
+            str: Path of the committed CSV file
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            os.replace(self.tmp_path, self.csv_path)
+            self.size = self.csv_path.stat().st_size
+        return str(self.csv_path)
+
+    def abort(self) -> None:
+        """Close and delete the temporary file without committing it."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            try:
+                self.tmp_path.unlink()
+            except OSError:
+                pass
+
+    def __enter__(self) -> "CSVRecordSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+
 class CSVGenerator:
     """Handles CSV generation and file management for medical records."""
     
@@ -138,42 +218,59 @@ class CSVGenerator:
         csv_path = csv_dir / csv_filename
         
         try:
-            with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.CSV_COLUMNS)
-                
-                # Write header
-                writer.writeheader()
-                
-                # Write medical records
-                for record in medical_records:
-                    # Convert dataclass to dict with exact column ordering
-                    row_data = {
-                        'source_file': record.source_file,
-                        'first_name': record.first_name,
-                        'last_name': record.last_name,
-                        'date_of_birth': record.date_of_birth,
-                        'record_number': record.record_number,
-                        'case_number': record.case_number,
-                        'accident_date/Injury_date': record.accident_date,  # Maps to accident_date field in MedicalRecord
-                        'provider_first': record.provider_first,
-                        'provider_last': record.provider_last,
-                        'exam_date': record.exam_date,
-                        'exam_place': record.exam_place,
-                        'transcriptionist': record.transcriptionist,
-                        'dd_date': record.dd_date,
-                        'transcription_date': record.transcription_date,
-                        'job_number': record.job_number,
-                        'case_code': record.case_code
-                    }
-                    writer.writerow(row_data)
+            with CSVRecordSink(str(csv_path)) as sink:
+                sink.write_all(medical_records)
             
-            logger.info(f"Generated CSV file: {csv_path} with {len(medical_records)} records")
+            logger.info(f"Generated CSV file: {csv_path} with {sink.rows} records")
             return str(csv_path)
             
         except IOError as e:
             logger.error(f"Failed to create CSV file {csv_path}: {e}")
             raise
-    
+
+    def merge_csv_files(self, part_paths: List[str], output_path: str) -> int:
+        """Concatenate part CSVs (each with a header row) into one CSV.
+
+        The output is written to a temporary file and renamed into place, so
+        readers never see a partially merged file.
+
+        Args:
+            part_paths: Part CSV files in the order their rows should appear
+            output_path: Path of the merged CSV file
+
+        Returns:
+            int: Number of data rows written
+
+        Raises:
+            IOError: If a part cannot be read or the output cannot be written
+        """
+        output_path = Path(output_path)
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        rows = 0
+
+        try:
+            with open(tmp_path, 'w', newline='', encoding='utf-8') as out:
+                writer = csv.writer(out)
+                writer.writerow(self.CSV_COLUMNS)
+
+                for part_path in part_paths:
+                    with open(part_path, 'r', newline='', encoding='utf-8') as part:
+                        reader = csv.reader(part)
+                        next(reader, None)  # Skip the part's header
+                        for row in reader:
+                            writer.writerow(row)
+                            rows += 1
+
+            os.replace(tmp_path, output_path)
+        except (IOError, OSError) as e:
+            logger.error(f"Failed to merge CSV parts into {output_path}: {e}")
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+        logger.info(f"Merged {len(part_paths)} CSV parts into {output_path} ({rows} records)")
+        return rows
+
     def cleanup_temp_files(self, temp_dir: Optional[str] = None) -> None:
         """Clean up temporary files after processing.
         
@@ -1,76 +1,26 @@
 """Date normalization utilities for medical document processing."""
 
+import calendar
 import re
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional
 
 
-def normalize_date(date_str: str) -> str:
-    """
-    Normalize various date formats to MM/DD/YYYY format.
-    
-    Args:
-        date_str: Input date string in various formats
-        
-    Returns:
-        Normalized date string in MM/DD/YYYY format, or empty string if parsing fails
-    """
-    if not date_str or not date_str.strip():
-        return ""
-    
-    # Clean the input string
-    date_str = date_str.strip()
-    
-    # Common date patterns to match
-    patterns = [
-        # MM/DD/YYYY, M/D/YYYY, MM/D/YYYY, M/DD/YYYY
-        (r'^(\d{1,2})/(\d{1,2})/(\d{4})$', lambda m: f"{int(m.group(1)):02d}/{int(m.group(2)):02d}/{m.group(3)}"),
-        
-        # MM-DD-YYYY, M-D-YYYY, MM-D-YYYY, M-DD-YYYY
-        (r'^(\d{1,2})-(\d{1,2})-(\d{4})$', lambda m: f"{int(m.group(1)):02d}/{int(m.group(2)):02d}/{m.group(3)}"),
-        
-        # YYYY/MM/DD, YYYY/M/D
-        (r'^(\d{4})/(\d{1,2})/(\d{1,2})$', lambda m: f"{int(m.group(2)):02d}/{int(m.group(3)):02d}/{m.group(1)}"),
-        
-        # YYYY-MM-DD, YYYY-M-D
-        (r'^(\d{4})-(\d{1,2})-(\d{1,2})$', lambda m: f"{int(m.group(2)):02d}/{int(m.group(3)):02d}/{m.group(1)}"),
-        
-        # DD/MM/YYYY (European format) - assuming day comes first when > 12
-        (r'^(\d{1,2})/(\d{1,2})/(\d{4})$', lambda m: f"{int(m.group(2)):02d}/{int(m.group(1)):02d}/{m.group(3)}" if int(m.group(1)) > 12 else f"{int(m.group(1)):02d}/{int(m.group(2)):02d}/{m.group(3)}"),
-        
-        # Month DD, YYYY or Month D, YYYY
-        (r'^([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})$', _parse_month_day_year),
-        
-        # DD Month YYYY or D Month YYYY
-        (r'^(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})$', _parse_day_month_year),
-        
-        # YYYYMMDD
-        (r'^(\d{4})(\d{2})(\d{2})$', lambda m: f"{int(m.group(2)):02d}/{int(m.group(3)):02d}/{m.group(1)}"),
-        
-        # MMDDYYYY
-        (r'^(\d{2})(\d{2})(\d{4})$', lambda m: f"{int(m.group(1)):02d}/{int(m.group(2)):02d}/{m.group(3)}"),
-    ]
-    
-    for pattern, formatter in patterns:
-        match = re.match(pattern, date_str, re.IGNORECASE)
-        if match:
-            try:
-                result = formatter(match)
-                # Validate the date by trying to parse it
-                if _validate_date(result):
-                    return result
-            except (ValueError, AttributeError):
-                continue
-    
-    # If no pattern matches, try to parse with datetime
-    try:
-        parsed_date = datetime.strptime(date_str, "%m/%d/%Y")
-        return parsed_date.strftime("%m/%d/%Y")
-    except ValueError:
-        pass
-    
-    # Return empty string if all parsing attempts fail
-    return ""
+_MONTHS = {
+    'january': 1, 'jan': 1,
+    'february': 2, 'feb': 2,
+    'march': 3, 'mar': 3,
+    'april': 4, 'apr': 4,
+    'may': 5,
+    'june': 6, 'jun': 6,
+    'july': 7, 'jul': 7,
+    'august': 8, 'aug': 8,
+    'september': 9, 'sep': 9, 'sept': 9,
+    'october': 10, 'oct': 10,
+    'november': 11, 'nov': 11,
+    'december': 12, 'dec': 12
+}
 
 
 def _parse_month_day_year(match) -> str:
@@ -99,30 +49,115 @@ def _parse_day_month_year(match) -> str:
 
 def _month_name_to_number(month_name: str) -> Optional[int]:
     """Convert month name to number."""
-    months = {
-        'january': 1, 'jan': 1,
-        'february': 2, 'feb': 2,
-        'march': 3, 'mar': 3,
-        'april': 4, 'apr': 4,
-        'may': 5,
-        'june': 6, 'jun': 6,
-        'july': 7, 'jul': 7,
-        'august': 8, 'aug': 8,
-        'september': 9, 'sep': 9, 'sept': 9,
-        'october': 10, 'oct': 10,
-        'november': 11, 'nov': 11,
-        'december': 12, 'dec': 12
-    }
-    return months.get(month_name.lower())
+    return _MONTHS.get(month_name.lower())
 
 
-def _validate_date(date_str: str) -> bool:
-    """Validate that a date string in MM/DD/YYYY format represents a valid date."""
+def _month_day_year(m) -> str:
+    """Format 'MM/DD/YYYY'-ordered groups."""
+    return f"{int(m.group(1)):02d}/{int(m.group(2)):02d}/{m.group(3)}"
+
+
+def _day_month_year_numeric(m) -> str:
+    """Format European 'DD/MM/YYYY' groups (only when the first number cannot be a month)."""
+    if int(m.group(1)) <= 12:
+        raise ValueError("Not a day-first date")
+    return f"{int(m.group(2)):02d}/{int(m.group(1)):02d}/{m.group(3)}"
+
+
+def _year_month_day(m) -> str:
+    """Format 'YYYY/MM/DD'-ordered groups."""
+    return f"{int(m.group(2)):02d}/{int(m.group(3)):02d}/{m.group(1)}"
+
+
+# Supported formats in order of preference: compiled pattern and the
+# formatters tried on a match until one yields a valid MM/DD/YYYY date
+_DATE_FORMATS = (
+    # MM/DD/YYYY, M/D/YYYY, MM/D/YYYY, M/DD/YYYY, then DD/MM/YYYY when the day comes first
+    (re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$'), (_month_day_year, _day_month_year_numeric)),
+    # MM-DD-YYYY, M-D-YYYY, MM-D-YYYY, M-DD-YYYY
+    (re.compile(r'^(\d{1,2})-(\d{1,2})-(\d{4})$'), (_month_day_year,)),
+    # YYYY/MM/DD, YYYY/M/D
+    (re.compile(r'^(\d{4})/(\d{1,2})/(\d{1,2})$'), (_year_month_day,)),
+    # YYYY-MM-DD, YYYY-M-D
+    (re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$'), (_year_month_day,)),
+    # Month DD, YYYY or Month D, YYYY
+    (re.compile(r'^([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})$', re.IGNORECASE), (_parse_month_day_year,)),
+    # DD Month YYYY or D Month YYYY
+    (re.compile(r'^(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})$', re.IGNORECASE), (_parse_day_month_year,)),
+    # YYYYMMDD
+    (re.compile(r'^(\d{4})(\d{2})(\d{2})$'), (_year_month_day,)),
+    # MMDDYYYY
+    (re.compile(r'^(\d{2})(\d{2})(\d{4})$'), (_month_day_year,)),
+)
+
+
+def normalize_date(date_str: str) -> str:
+    """
+    Normalize various date formats to MM/DD/YYYY format.
+    
+    Results are cached per input string: the same birth and exam dates
+    recur across a day's documents.
+    
+    Args:
+        date_str: Input date string in various formats
+        
+    Returns:
+        Normalized date string in MM/DD/YYYY format, or empty string if parsing fails
+    """
+    if not date_str:
+        return ""
+    return _normalize_date_cached(date_str)
+
+
+def normalize_dates(date_strs: Iterable[str]) -> List[str]:
+    """
+    Normalize several date strings.
+    
+    Args:
+        date_strs: Input date strings in any format normalize_date accepts
+        
+    Returns:
+        List of normalized dates in input order ('' where parsing fails)
+    """
+    return [normalize_date(date_str) for date_str in date_strs]
+
+
+@lru_cache(maxsize=4096)
+def _normalize_date_cached(date_str: str) -> str:
+    """Normalize a non-empty date string (see normalize_date)."""
+    date_str = date_str.strip()
+    if not date_str:
+        return ""
+    
+    for pattern, formatters in _DATE_FORMATS:
+        match = pattern.match(date_str)
+        if not match:
+            continue
+        for formatter in formatters:
+            try:
+                result = formatter(match)
+            except (ValueError, AttributeError):
+                continue
+            if _validate_date(result):
+                return result
+    
+    # If no pattern matches, try to parse with datetime
     try:
-        datetime.strptime(date_str, "%m/%d/%Y")
-        return True
+        return datetime.strptime(date_str, "%m/%d/%Y").strftime("%m/%d/%Y")
     except ValueError:
+        pass
+    
+    # Return empty string if all parsing attempts fail
+    return ""
+
+
+def _validate_date(date_str: str) -> bool:
+    """Validate that a date string in MM/DD/YYYY format represents a valid date."""
+    month, day, year = date_str.split('/')
+    if len(month) != 2 or len(day) != 2 or len(year) != 4:
         return False
+    month, day, year = int(month), int(day), int(year)
+    return 1 <= year and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]
 
 
 def extract_date_from_text(text: str, field_name: str) -> str:
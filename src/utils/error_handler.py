@@ -3,19 +3,20 @@
 import logging
 import traceback
 import time
+import queue
+import atexit
+import threading
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Callable, Union
+from typing import Dict, Any, Optional, List, Callable, Union, Deque
+from collections import deque
 from enum import Enum
 from dataclasses import dataclass, field
 from pathlib import Path
-import json
 import os
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from config.models import RetentionConfig
+from utils.error_log_store import SegmentedErrorLog
+from utils.metrics import ERRORS, ERROR_RETRIES
 
 
 class ErrorCategory(Enum):
@@ -57,6 +58,17 @@ class ErrorContext:
     is_recoverable: bool = True
 
 
+@dataclass
+class ErrorBucket:
+    """Error counters for one fixed-width time bucket."""
+    bucket_index: int  # Bucket start as epoch seconds // bucket width
+    total: int = 0
+    by_category: Dict[str, int] = field(default_factory=dict)
+    by_severity: Dict[str, int] = field(default_factory=dict)
+    by_component: Dict[str, int] = field(default_factory=dict)
+    by_error_type: Dict[str, int] = field(default_factory=dict)  # "category:exception_type"
+
+
 @dataclass
 class RetryConfig:
     """Configuration for retry logic."""
@@ -67,6 +79,157 @@ class RetryConfig:
     jitter: bool = True
 
 
+class ErrorContextWriter:
+    """Background writer that persists error contexts in batches.
+    
+    Callers only enqueue records; a single daemon thread serializes them and
+    appends them to the segmented error log in batches, either when the batch fills up
+    or every ``flush_interval`` seconds. The queue is bounded so an error storm
+    cannot exhaust memory; records that do not fit are dropped and counted.
+    Records submitted after close() are written directly.
+    """
+    
+    def __init__(self, error_log: SegmentedErrorLog, max_queue_size: int = 10000,
+                 flush_interval: float = 1.0, batch_size: int = 500):
+        """Initialize the writer and start its background thread.
+        
+        Args:
+            error_log: Segmented error log to append error contexts to
+            max_queue_size: Maximum number of pending records before dropping
+            flush_interval: Maximum seconds a record waits before being written
+            batch_size: Maximum number of records written per file open
+        """
+        self.error_log = error_log
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.dropped_count = 0
+        self.logger = logging.getLogger(__name__)
+        
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max_queue_size)
+        self._closed = False
+        # Orders submit() against close(): nothing is queued behind the stop sentinel
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="ErrorContextWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def submit(self, error_data: Dict[str, Any]) -> bool:
+        """Queue an error record for persistence without blocking.
+        
+        Args:
+            error_data: JSON-serializable error record
+            
+        Returns:
+            bool: True if queued or written, False if dropped because the queue is full
+        """
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                try:
+                    self._queue.put_nowait(error_data)
+                    return True
+                except queue.Full:
+                    self.dropped_count += 1
+                    dropped = self.dropped_count
+        
+        if closed:
+            # The writer thread is stopping or gone; persist synchronously
+            self._write_batch([error_data])
+            return True
+        
+        if dropped == 1 or dropped % 1000 == 0:
+            self.logger.warning(f"Error context queue full, {dropped} records dropped so far")
+        return False
+    
+    def queue_depth(self) -> int:
+        """Get the number of records waiting to be written."""
+        return self._queue.qsize()
+    
+    def flush(self, timeout: Optional[float] = 10.0) -> None:
+        """Block until all queued records have been written.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+        """
+        if not self._thread.is_alive():
+            return
+        
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                self.logger.warning("Timed out waiting for error context writer to flush")
+                return
+            time.sleep(0.01)
+    
+    def close(self, timeout: float = 10.0) -> None:
+        """Flush pending records and stop the background thread.
+        
+        Args:
+            timeout: Maximum seconds to wait for the writer to finish
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        
+        # Submits after this point write directly, so the sentinel is the last item queued
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            self.logger.warning("Error context writer queue full during shutdown")
+            return
+        self._thread.join(timeout=timeout)
+    
+    def _run(self) -> None:
+        """Writer loop: collect a batch, write it, repeat until closed."""
+        while True:
+            batch = []
+            stop = False
+            
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    stop = True
+                    self._queue.task_done()
+                    break
+                
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            
+            if batch:
+                self._write_batch(batch)
+                for _ in batch:
+                    self._queue.task_done()
+            
+            if stop:
+                return
+    
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Append a batch of records to the segmented error log.
+        
+        Args:
+            batch: Error records to write
+        """
+        try:
+            self.error_log.append(batch)
+        except Exception as e:
+            self.logger.warning(f"Failed to store {len(batch)} error contexts: {e}")
+
+
 class ErrorHandler:
     """Comprehensive error handler with categorized error handling, retry logic, and context tracking."""
     
@@ -82,8 +245,14 @@ class ErrorHandler:
         self.retention_config = retention_config or RetentionConfig()
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
-        # Error tracking
-        self.error_history: List[ErrorContext] = []
+        # Error tracking: bounded ring buffer of recent contexts plus
+        # time-bucketed counters that keep statistics O(buckets) to query
+        self.error_history: Deque[ErrorContext] = deque(maxlen=1000)
+        self.bucket_seconds = 300
+        self.bucket_retention_hours = 7 * 24
+        self._buckets: Deque[ErrorBucket] = deque()
+        self._recent_critical_errors: Deque[ErrorContext] = deque(maxlen=100)
+        self._stats_lock = threading.Lock()
         self.error_counts: Dict[str, int] = {}
         self.last_error_times: Dict[str, datetime] = {}
         
@@ -99,8 +268,10 @@ class ErrorHandler:
             ErrorCategory.VALIDATION: RetryConfig(max_attempts=1, base_delay=0.0),        # No retry for validation
         }
         
-        # Initialize error log file
-        self.error_log_file = self.storage_path / "error_context.jsonl"
+        # Initialize daily-segmented error log and its background writer
+        self.error_log = SegmentedErrorLog(self.storage_path)
+        self._migrate_legacy_error_log()
+        self.context_writer = ErrorContextWriter(self.error_log)
         
         self.logger.info("ErrorHandler initialized successfully")
     
@@ -128,6 +299,12 @@ class ErrorHandler:
         Returns:
             ErrorContext object with error details
         """
+        # Stack traces are expensive to format, so only capture them where they
+        # are worth the cost; retried and low-severity errors skip them entirely
+        stack_trace = ""
+        if severity in (ErrorSeverity.HIGH, ErrorSeverity.CRITICAL):
+            stack_trace = traceback.format_exc()
+        
         # Create error context
         context = ErrorContext(
             category=category,
@@ -136,7 +313,7 @@ class ErrorHandler:
             operation=operation,
             error_message=str(error),
             exception_type=type(error).__name__,
-            stack_trace=traceback.format_exc(),
+            stack_trace=stack_trace,
             additional_data=additional_data or {},
             retry_count=retry_count,
             max_retries=max_retries,
@@ -149,13 +326,15 @@ class ErrorHandler:
         # Track error statistics
         self._track_error_statistics(context)
         
+        ERRORS.labels(category=category.value, severity=severity.value).inc()
+        if retry_count < max_retries:
+            ERROR_RETRIES.labels(component=component).inc()
+        
         # Store error context
         self._store_error_context(context)
         
-        # Add to error history (keep last 1000 errors)
+        # Add to error history (ring buffer keeps the last 1000 errors)
         self.error_history.append(context)
-        if len(self.error_history) > 1000:
-            self.error_history.pop(0)
         
         return context
     
@@ -249,8 +428,8 @@ class ErrorHandler:
         else:
             self.logger.info(log_message)
         
-        # Always log stack trace for debugging at debug level
-        if context.stack_trace:
+        # Log stack trace for debugging at debug level
+        if context.stack_trace and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(f"Stack trace for {context.component}.{context.operation}:\n{context.stack_trace}")
     
     def _track_error_statistics(self, context: ErrorContext):
@@ -261,12 +440,49 @@ class ErrorHandler:
         self.error_counts[error_key] = self.error_counts.get(error_key, 0) + 1
         self.last_error_times[error_key] = context.timestamp
         
+        # Update rolling-window counters
+        self._add_to_buckets(context)
+        
         # Log statistics periodically
         if self.error_counts[error_key] % 10 == 0:
             self.logger.warning(f"Error {error_key} has occurred {self.error_counts[error_key]} times")
     
+    def _add_to_buckets(self, context: ErrorContext):
+        """Add an error to its time bucket and evict buckets past retention."""
+        bucket_index = int(context.timestamp.timestamp()) // self.bucket_seconds
+        
+        with self._stats_lock:
+            # Errors are almost always recorded in time order, so search for
+            # the bucket from the newest end and insert a missing one in order
+            position = len(self._buckets)
+            while position and self._buckets[position - 1].bucket_index > bucket_index:
+                position -= 1
+            if position and self._buckets[position - 1].bucket_index == bucket_index:
+                bucket = self._buckets[position - 1]
+            else:
+                bucket = ErrorBucket(bucket_index=bucket_index)
+                self._buckets.insert(position, bucket)
+            
+            category = context.category.value
+            severity = context.severity.value
+            error_type = f"{category}:{context.exception_type}"
+            
+            bucket.total += 1
+            bucket.by_category[category] = bucket.by_category.get(category, 0) + 1
+            bucket.by_severity[severity] = bucket.by_severity.get(severity, 0) + 1
+            bucket.by_component[context.component] = bucket.by_component.get(context.component, 0) + 1
+            bucket.by_error_type[error_type] = bucket.by_error_type.get(error_type, 0) + 1
+            
+            if context.severity == ErrorSeverity.CRITICAL:
+                self._recent_critical_errors.append(context)
+            
+            oldest_index = (self._buckets[-1].bucket_index
+                            - (self.bucket_retention_hours * 3600) // self.bucket_seconds)
+            while self._buckets and self._buckets[0].bucket_index < oldest_index:
+                self._buckets.popleft()
+    
     def _store_error_context(self, context: ErrorContext):
-        """Store error context to persistent storage for analysis."""
+        """Queue error context for persistent storage by the background writer."""
         try:
             error_data = {
                 "timestamp": context.timestamp.isoformat(),
@@ -282,9 +498,7 @@ class ErrorHandler:
                 "additional_data": context.additional_data
             }
             
-            # Append to JSONL file
-            with open(self.error_log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(error_data) + '\n')
+            self.context_writer.submit(error_data)
                 
         except Exception as e:
             self.logger.warning(f"Failed to store error context: {e}")
@@ -377,6 +591,10 @@ class ErrorHandler:
     def get_error_statistics(self, hours: int = 24) -> Dict[str, Any]:
         """Get error statistics for the specified time period.
         
+        Statistics are aggregated from time buckets, so the cost depends on the
+        number of buckets in the window rather than the number of errors. The
+        window is rounded out to whole buckets and capped at the bucket retention.
+        
         Args:
             hours: Number of hours to look back
             
@@ -384,13 +602,11 @@ class ErrorHandler:
             Dictionary containing error statistics
         """
         cutoff_time = datetime.now() - timedelta(hours=hours)
-        
-        # Filter recent errors
-        recent_errors = [e for e in self.error_history if e.timestamp >= cutoff_time]
+        cutoff_index = int(cutoff_time.timestamp()) // self.bucket_seconds
         
         # Calculate statistics
         stats = {
-            "total_errors": len(recent_errors),
+            "total_errors": 0,
             "time_period_hours": hours,
             "errors_by_category": {},
             "errors_by_severity": {},
@@ -398,34 +614,30 @@ class ErrorHandler:
             "most_frequent_errors": {},
             "recent_critical_errors": []
         }
+        error_type_counts = {}
         
-        for error in recent_errors:
-            # By category
-            category = error.category.value
-            stats["errors_by_category"][category] = stats["errors_by_category"].get(category, 0) + 1
-            
-            # By severity
-            severity = error.severity.value
-            stats["errors_by_severity"][severity] = stats["errors_by_severity"].get(severity, 0) + 1
-            
-            # By component
-            component = error.component
-            stats["errors_by_component"][component] = stats["errors_by_component"].get(component, 0) + 1
+        with self._stats_lock:
+            for bucket in reversed(self._buckets):
+                if bucket.bucket_index < cutoff_index:
+                    break
+                
+                stats["total_errors"] += bucket.total
+                for target, counts in ((stats["errors_by_category"], bucket.by_category),
+                                       (stats["errors_by_severity"], bucket.by_severity),
+                                       (stats["errors_by_component"], bucket.by_component),
+                                       (error_type_counts, bucket.by_error_type)):
+                    for key, count in counts.items():
+                        target[key] = target.get(key, 0) + count
             
-            # Track critical errors
-            if error.severity == ErrorSeverity.CRITICAL:
-                stats["recent_critical_errors"].append({
-                    "timestamp": error.timestamp.isoformat(),
-                    "component": error.component,
-                    "operation": error.operation,
-                    "message": error.error_message
-                })
-        
-        # Most frequent error types
-        error_type_counts = {}
-        for error in recent_errors:
-            error_key = f"{error.category.value}:{error.exception_type}"
-            error_type_counts[error_key] = error_type_counts.get(error_key, 0) + 1
+            # Track critical errors (oldest first)
+            for error in self._recent_critical_errors:
+                if error.timestamp >= cutoff_time:
+                    stats["recent_critical_errors"].append({
+                        "timestamp": error.timestamp.isoformat(),
+                        "component": error.component,
+                        "operation": error.operation,
+                        "message": error.error_message
+                    })
         
         # Sort by frequency
         stats["most_frequent_errors"] = dict(sorted(error_type_counts.items(), 
@@ -451,35 +663,56 @@ class ErrorHandler:
                 
             cutoff_time = datetime.now() - timedelta(days=retention_days)
             
+            # Make sure queued records are on disk before pruning segments
+            self.context_writer.flush()
+            
             # Clean up in-memory error history
-            self.error_history = [e for e in self.error_history if e.timestamp >= cutoff_time]
+            self.error_history = deque(
+                (e for e in self.error_history if e.timestamp >= cutoff_time),
+                maxlen=self.error_history.maxlen
+            )
             
-            # Clean up persistent error log file
-            if self.error_log_file.exists():
-                temp_file = self.error_log_file.with_suffix('.tmp')
-                
-                with open(self.error_log_file, 'r', encoding='utf-8') as infile, \
-                     open(temp_file, 'w', encoding='utf-8') as outfile:
-                    
-                    for line in infile:
-                        try:
-                            error_data = json.loads(line.strip())
-                            error_time = datetime.fromisoformat(error_data['timestamp'])
-                            
-                            if error_time >= cutoff_time:
-                                outfile.write(line)
-                        except (json.JSONDecodeError, KeyError, ValueError):
-                            # Skip malformed lines
-                            continue
-                
-                # Replace original file with cleaned version
-                temp_file.replace(self.error_log_file)
-                
-                self.logger.info(f"Cleaned up error logs older than {days_to_keep} days")
+            # Clean up persistent error log by dropping whole daily segments
+            deleted_segments = self.error_log.delete_segments_before(cutoff_time)
+            
+            self.logger.info(f"Cleaned up error logs older than {retention_days} days "
+                             f"({deleted_segments} segments removed)")
                 
         except Exception as e:
             self.logger.warning(f"Failed to cleanup old error logs: {e}")
     
+    def query_error_contexts(self, start: Optional[datetime] = None,
+                             end: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Read persisted error contexts within a time range.
+        
+        Only the daily segments overlapping the range are read.
+        
+        Args:
+            start: Inclusive lower bound (None for unbounded)
+            end: Inclusive upper bound (None for unbounded)
+            
+        Returns:
+            List of error context records, oldest first
+        """
+        self.context_writer.flush()
+        return list(self.error_log.iter_records(start, end))
+    
+    def _migrate_legacy_error_log(self):
+        """Move records from the pre-segmentation error_context.jsonl into segments."""
+        legacy_file = self.storage_path / "error_context.jsonl"
+        try:
+            self.error_log.migrate_legacy_file(legacy_file)
+        except Exception as e:
+            self.logger.warning(f"Failed to migrate legacy error log {legacy_file}: {e}")
+    
+    def flush(self) -> None:
+        """Block until all queued error contexts have been written to disk."""
+        self.context_writer.flush()
+    
+    def close(self) -> None:
+        """Flush queued error contexts and stop the background writer."""
+        self.context_writer.close()
+    
     def generate_error_report(self, hours: int = 24) -> str:
         """Generate a human-readable error report.
         
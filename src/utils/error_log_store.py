@@ -0,0 +1,303 @@
+"""Daily-segmented, indexed storage for persisted error contexts."""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class SegmentedErrorLog:
+    """Append-only error context log split into one JSONL segment per day.
+
+    A small sidecar index records the time range and record count of each
+    segment. Retention deletes whole segments by consulting the index, and
+    time-range queries only open the segments that overlap the range, so
+    neither operation has to parse the full history.
+    """
+
+    def __init__(self, directory: Path, prefix: str = "error_context"):
+        """Initialize the segmented log.
+
+        Args:
+            directory: Directory holding the segment files and the index
+            prefix: Filename prefix for segments and the index
+        """
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.index_file = self.directory / f"{prefix}_index.json"
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+
+    def segment_path(self, day: str) -> Path:
+        """Get the segment file for a day.
+
+        Args:
+            day: Day in YYYY-MM-DD format
+
+        Returns:
+            Path: Segment file path (e.g. error_context_20250101.jsonl)
+        """
+        return self.directory / f"{self.prefix}_{day.replace('-', '')}.jsonl"
+
+    def append(self, records: List[Dict[str, Any]]) -> None:
+        """Append records to their daily segments and update the index.
+
+        Args:
+            records: Error records, each with an ISO format 'timestamp' field
+        """
+        by_day: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            by_day.setdefault(record['timestamp'][:10], []).append(record)
+
+        with self._lock:
+            for day, day_records in by_day.items():
+                lines = [json.dumps(record, default=str) + '\n' for record in day_records]
+                with open(self.segment_path(day), 'a', encoding='utf-8') as f:
+                    f.writelines(lines)
+
+                timestamps = [record['timestamp'] for record in day_records]
+                entry = self._index.get(day)
+                if entry is None:
+                    self._index[day] = {
+                        "start": min(timestamps, key=datetime.fromisoformat),
+                        "end": max(timestamps, key=datetime.fromisoformat),
+                        "count": len(day_records)
+                    }
+                else:
+                    entry["start"] = min(entry["start"], min(timestamps), key=datetime.fromisoformat)
+                    entry["end"] = max(entry["end"], max(timestamps), key=datetime.fromisoformat)
+                    entry["count"] += len(day_records)
+
+            self._save_index()
+
+    def delete_segments_before(self, cutoff: datetime) -> int:
+        """Delete every segment whose newest record is older than the cutoff.
+
+        Segments that straddle the cutoff are kept whole, so retention has
+        day granularity.
+
+        Args:
+            cutoff: Records older than this are eligible for deletion
+
+        Returns:
+            int: Number of segments deleted
+        """
+        deleted = 0
+
+        with self._lock:
+            for day, entry in sorted(self._index.items()):
+                if datetime.fromisoformat(entry["end"]) >= cutoff:
+                    continue
+
+                try:
+                    self.segment_path(day).unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"Failed to delete error log segment for {day}: {e}")
+                    continue
+
+                del self._index[day]
+                deleted += 1
+
+            if deleted:
+                self._save_index()
+
+        return deleted
+
+    def iter_records(self, start: Optional[datetime] = None,
+                     end: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over records in a time range, oldest segment first.
+
+        Args:
+            start: Inclusive lower bound (None for unbounded)
+            end: Inclusive upper bound (None for unbounded)
+
+        Yields:
+            Dict: Error records whose timestamp falls within the range
+        """
+        with self._lock:
+            segments = []
+            for day, entry in sorted(self._index.items()):
+                if start is not None and datetime.fromisoformat(entry["end"]) < start:
+                    continue
+                if end is not None and datetime.fromisoformat(entry["start"]) > end:
+                    continue
+                # Records only need filtering in segments that cross a bound
+                fully_inside = (
+                    (start is None or datetime.fromisoformat(entry["start"]) >= start) and
+                    (end is None or datetime.fromisoformat(entry["end"]) <= end)
+                )
+                segments.append((self.segment_path(day), fully_inside))
+
+        for path, fully_inside in segments:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                            if not fully_inside:
+                                timestamp = datetime.fromisoformat(record['timestamp'])
+                                if (start is not None and timestamp < start) or \
+                                   (end is not None and timestamp > end):
+                                    continue
+                            yield record
+                        except (json.JSONDecodeError, KeyError, ValueError):
+                            # Skip malformed lines
+                            continue
+            except FileNotFoundError:
+                continue
+
+    def migrate_legacy_file(self, legacy_file: Path) -> int:
+        """Split a legacy single-file JSONL error log into daily segments.
+
+        The legacy file is removed once its records have been re-segmented.
+
+        Args:
+            legacy_file: Path to the old error_context.jsonl file
+
+        Returns:
+            int: Number of records migrated
+        """
+        if not legacy_file.exists():
+            return 0
+
+        migrated = 0
+        batch = []
+
+        with open(legacy_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    datetime.fromisoformat(record['timestamp'])
+                except (json.JSONDecodeError, KeyError, ValueError, TypeError):
+                    continue
+
+                batch.append(record)
+                if len(batch) >= 1000:
+                    self.append(batch)
+                    migrated += len(batch)
+                    batch = []
+
+        if batch:
+            self.append(batch)
+            migrated += len(batch)
+
+        legacy_file.unlink()
+        logger.info(f"Migrated {migrated} error records from {legacy_file} into daily segments")
+        return migrated
+
+    def get_index(self) -> Dict[str, Dict[str, Any]]:
+        """Get a copy of the segment index (day -> start, end, count)."""
+        with self._lock:
+            return {day: dict(entry) for day, entry in self._index.items()}
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the sidecar index and reconcile it with the segment files.
+
+        A segment is appended before the index is rewritten, so a crash in
+        between leaves a segment the index does not know about, or one that
+        holds more records than its entry says. Segments missing from the
+        index or modified since it was written are rescanned, entries whose
+        segment is gone are dropped, and a missing or unreadable index is
+        rebuilt from all segments. A changed index is written back.
+        """
+        index: Dict[str, Dict[str, Any]] = {}
+        index_mtime = None
+
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                index_mtime = self.index_file.stat().st_mtime
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Error log index is unreadable, rebuilding: {e}")
+                index = {}
+
+        segments = {}
+        for path in self.directory.glob(f"{self.prefix}_*.jsonl"):
+            day = self._segment_day(path)
+            if day is not None:
+                segments[day] = path
+
+        reconciled = 0
+        for day in [day for day in index if day not in segments]:
+            del index[day]
+            reconciled += 1
+
+        for day, path in sorted(segments.items()):
+            try:
+                if day in index and index_mtime is not None and path.stat().st_mtime < index_mtime:
+                    continue
+                entry = self._scan_segment(path)
+            except OSError as e:
+                logger.warning(f"Failed to read error log segment {path}: {e}")
+                continue
+
+            if entry is None:
+                if index.pop(day, None) is not None:
+                    reconciled += 1
+            elif index.get(day) != entry:
+                index[day] = entry
+                reconciled += 1
+
+        self._index = index
+        if index_mtime is None or reconciled:
+            if index_mtime is not None:
+                logger.warning(f"Reconciled {reconciled} error log segment(s) with the index")
+            self._save_index()
+
+        return index
+
+    def _segment_day(self, path: Path) -> Optional[str]:
+        """Get the YYYY-MM-DD day of a segment file from its name."""
+        stamp = path.stem[len(self.prefix) + 1:]
+        try:
+            return datetime.strptime(stamp, "%Y%m%d").strftime("%Y-%m-%d")
+        except ValueError:
+            return None
+
+    def _scan_segment(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Build the index entry of one segment by reading its records.
+
+        Returns:
+            Optional[Dict]: start, end and count, or None if the segment
+            holds no readable records
+
+        Raises:
+            OSError: If the segment cannot be read
+        """
+        start = end = None
+        count = 0
+
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    timestamp = json.loads(line)['timestamp']
+                    datetime.fromisoformat(timestamp)
+                except (json.JSONDecodeError, KeyError, ValueError, TypeError):
+                    continue
+                if start is None or datetime.fromisoformat(timestamp) < datetime.fromisoformat(start):
+                    start = timestamp
+                if end is None or datetime.fromisoformat(timestamp) > datetime.fromisoformat(end):
+                    end = timestamp
+                count += 1
+
+        if not count:
+            return None
+        return {"start": start, "end": end, "count": count}
+
+    def _save_index(self) -> None:
+        """Atomically write the sidecar index (caller holds the lock)."""
+        temp_file = self.index_file.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f, indent=2, sort_keys=True)
+        os.replace(temp_file, self.index_file)
@@ -6,10 +6,6 @@ from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
 import logging
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from config.models import ProcessingRecord, RetentionConfig
 
 logger = logging.getLogger(__name__)
@@ -0,0 +1,74 @@
+"""Matching many keywords or patterns against a text in one call."""
+
+import re
+from typing import Iterable
+
+
+class KeywordMatcher:
+    """Case-insensitive check for any of a fixed set of keywords.
+
+    Replaces ``any(keyword in text.lower() for keyword in keywords)``. The
+    keyword set is reduced once: a keyword that contains another keyword can
+    never be the only one present, so it is dropped. Short texts (field
+    values) are then checked with a single compiled alternation. Long texts
+    (whole documents) are not checked in a single pass: they get one
+    substring scan per remaining keyword, O(k·n) for k keywords, because
+    CPython's substring search still outruns the regex alternation on long
+    inputs.
+    """
+
+    def __init__(self, keywords: Iterable[str], scan_threshold: int = 256):
+        """
+        Build the matcher.
+
+        Args:
+            keywords: Keywords to look for (case-insensitive)
+            scan_threshold: Text length from which substring scans are used instead of the alternation
+        """
+        lowered = {keyword.lower() for keyword in keywords if keyword}
+        if not lowered:
+            raise ValueError("KeywordMatcher needs at least one keyword")
+
+        self.keywords = sorted(
+            (keyword for keyword in lowered
+             if not any(other != keyword and other in keyword for other in lowered)),
+            key=lambda keyword: (-len(keyword), keyword)
+        )
+        self.scan_threshold = scan_threshold
+        # No capture groups: they stop the regex engine from skipping ahead to candidate positions
+        self._pattern = re.compile("|".join(re.escape(keyword) for keyword in self.keywords))
+
+    def contains_any(self, text: str) -> bool:
+        """Check whether any keyword occurs in the text."""
+        if not text:
+            return False
+        text = text.lower()
+        if len(text) >= self.scan_threshold:
+            return any(keyword in text for keyword in self.keywords)
+        return self._pattern.search(text) is not None
+
+
+class PatternMatcher:
+    """Check for any of a fixed set of regexes with a single search.
+
+    The patterns are compiled into one alternation of non-capturing groups,
+    so a check is one search instead of one re.search call per pattern.
+    Patterns must not use numbered groups or backreferences.
+    """
+
+    def __init__(self, patterns: Iterable[str], flags: int = 0):
+        """
+        Compile the patterns into one alternation.
+
+        Args:
+            patterns: Regular expressions
+            flags: re flags applied to all of them
+        """
+        self.patterns = list(patterns)
+        if not self.patterns:
+            raise ValueError("PatternMatcher needs at least one pattern")
+        self._pattern = re.compile("|".join(f"(?:{pattern})" for pattern in self.patterns), flags)
+
+    def contains_any(self, text: str) -> bool:
+        """Check whether any pattern matches somewhere in the text."""
+        return bool(text) and self._pattern.search(text) is not None
@@ -0,0 +1,56 @@
+"""Deferred imports of heavy third-party modules."""
+
+import importlib
+import threading
+from types import ModuleType
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    Heavy dependencies (paramiko, python-docx, croniter, smtplib, ...) are
+    only needed once a cycle actually connects, parses or schedules, so
+    binding them through a LazyModule keeps them out of process startup.
+    The import runs once under a lock, so worker threads touching the
+    module at the same time all see the fully initialized module.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize the stand-in without importing anything.
+
+        Args:
+            name: Absolute module name, e.g. 'paramiko' or 'docx2txt'
+        """
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        """Import the module if needed and return it."""
+        module = self._module
+        if module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+                module = self._module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Bind a module that is imported the first time one of its attributes is used.
+
+    Args:
+        name: Absolute module name
+
+    Returns:
+        LazyModule: Module stand-in
+    """
+    return LazyModule(name)
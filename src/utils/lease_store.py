@@ -0,0 +1,203 @@
+"""Lease stores that coordinate work across worker nodes."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+LEASE_HELD = "leased"
+LEASE_DONE = "done"
+
+
+class LeaseStore:
+    """Interface for a shared store of time-limited work leases.
+
+    A lease is identified by a scope (e.g. a date folder) and a key (e.g. a
+    type folder). At most one owner holds an unexpired lease on a key; a
+    lease whose owner stops renewing it expires and can be taken over by
+    another node. Completed keys stay done, together with a small result
+    summary, until the scope is cleared.
+    """
+
+    def acquire(self, scope: str, key: str, owner: str, ttl: float) -> bool:
+        """Take the lease on a key if it is free, expired or already ours.
+
+        Returns:
+            bool: True if the caller now holds the lease
+        """
+        raise NotImplementedError
+
+    def renew(self, scope: str, key: str, owner: str, ttl: float) -> bool:
+        """Extend a held lease.
+
+        Returns:
+            bool: False if the lease was lost to another owner
+        """
+        raise NotImplementedError
+
+    def release(self, scope: str, key: str, owner: str) -> None:
+        """Give up a held lease without completing the work."""
+        raise NotImplementedError
+
+    def complete(self, scope: str, key: str, owner: str, result: Optional[Dict[str, Any]] = None) -> bool:
+        """Mark a held lease's work as done.
+
+        Returns:
+            bool: False if the lease was lost to another owner
+        """
+        raise NotImplementedError
+
+    def get_status(self, scope: str) -> Dict[str, Dict[str, Any]]:
+        """Get the state of every key in a scope.
+
+        Returns:
+            Dict: Key -> {'owner', 'state', 'expires_at', 'result'}
+        """
+        raise NotImplementedError
+
+    def clear_scope(self, scope: str) -> None:
+        """Remove all leases of a scope so its work can start over."""
+        raise NotImplementedError
+
+
+class SQLiteLeaseStore(LeaseStore):
+    """Lease store backed by a SQLite database, usually on shared storage.
+
+    Every operation runs in its own short IMMEDIATE transaction, so
+    concurrent nodes serialize on SQLite's database lock. Lease expiry uses
+    wall-clock time, so node clocks should be kept in sync (e.g. NTP).
+    """
+
+    def __init__(self, db_path: str, busy_timeout: float = 30.0):
+        """
+        Initialize the store and create its table if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+            busy_timeout: Seconds to wait for another node's transaction
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+
+        with self._transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS leases ("
+                " scope TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " owner TEXT NOT NULL,"
+                " state TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " updated_at REAL NOT NULL,"
+                " result TEXT,"
+                " PRIMARY KEY (scope, key))"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=self.busy_timeout, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Run a block in an IMMEDIATE transaction (commit on success, rollback on error)."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+
+    def acquire(self, scope: str, key: str, owner: str, ttl: float) -> bool:
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT owner, state, expires_at FROM leases WHERE scope = ? AND key = ?",
+                (scope, key)
+            ).fetchone()
+
+            if row is not None:
+                current_owner, state, expires_at = row
+                if state == LEASE_DONE:
+                    return False
+                if current_owner != owner and expires_at > now:
+                    return False
+                if current_owner != owner:
+                    logger.info(f"Taking over expired lease {scope}/{key} from {current_owner}")
+
+            conn.execute(
+                "INSERT OR REPLACE INTO leases (scope, key, owner, state, expires_at, updated_at, result) "
+                "VALUES (?, ?, ?, ?, ?, ?, NULL)",
+                (scope, key, owner, LEASE_HELD, now + ttl, now)
+            )
+            return True
+
+    def renew(self, scope: str, key: str, owner: str, ttl: float) -> bool:
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE leases SET expires_at = ?, updated_at = ? "
+                "WHERE scope = ? AND key = ? AND owner = ? AND state = ?",
+                (now + ttl, now, scope, key, owner, LEASE_HELD)
+            )
+            return cursor.rowcount == 1
+
+    def release(self, scope: str, key: str, owner: str) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM leases WHERE scope = ? AND key = ? AND owner = ? AND state = ?",
+                (scope, key, owner, LEASE_HELD)
+            )
+
+    def complete(self, scope: str, key: str, owner: str, result: Optional[Dict[str, Any]] = None) -> bool:
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE leases SET state = ?, updated_at = ?, result = ? "
+                "WHERE scope = ? AND key = ? AND owner = ? AND state = ?",
+                (LEASE_DONE, now, json.dumps(result or {}), scope, key, owner, LEASE_HELD)
+            )
+            return cursor.rowcount == 1
+
+    def get_status(self, scope: str) -> Dict[str, Dict[str, Any]]:
+        conn = self._connection()
+        rows = conn.execute(
+            "SELECT key, owner, state, expires_at, result FROM leases WHERE scope = ?",
+            (scope,)
+        ).fetchall()
+        return {
+            key: {
+                "owner": owner,
+                "state": state,
+                "expires_at": expires_at,
+                "result": json.loads(result) if result else None
+            }
+            for key, owner, state, expires_at, result in rows
+        }
+
+    def clear_scope(self, scope: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM leases WHERE scope = ?", (scope,))
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
@@ -0,0 +1,149 @@
+"""Sampled, rate-limited logging for high-volume per-file messages."""
+
+import logging
+import threading
+from typing import Dict, Optional
+
+
+# Default number of messages per key emitted in full each cycle (0 = unlimited)
+DEFAULT_SAMPLE_LIMIT = 5
+
+# Level that keeps a detail logger silent
+_DETAIL_OFF = logging.CRITICAL + 1
+
+_sample_limit = DEFAULT_SAMPLE_LIMIT
+_detail_enabled = False
+_component_limits: Dict[str, int] = {}
+_samplers: Dict[str, "SampledLogger"] = {}
+_registry_lock = threading.Lock()
+
+
+class SampledLogger:
+    """Logger wrapper that emits only the first few messages per key each cycle.
+
+    Hot loops (one line per scanned file or parsed document) log through a
+    message key such as "file_matches_date". The first ``limit`` messages for
+    each key are logged at their requested level; the rest are only counted
+    and reported as a single summary line when ``emit_summary`` is called at
+    the end of the cycle. Suppressed messages go to the component's detail
+    logger ("sampled_detail.<component>") at DEBUG. That logger is off unless
+    LOG_SAMPLED_DETAIL is set, so sampled-out lines reach no log file by default.
+    """
+
+    def __init__(self, logger: logging.Logger, component: str, limit: int = DEFAULT_SAMPLE_LIMIT):
+        """Initialize the sampled logger.
+
+        Args:
+            logger: Underlying logger to write to
+            component: Component name used for configuration and summaries
+            limit: Messages per key logged in full each cycle (0 = no sampling)
+        """
+        self.logger = logger
+        self.component = component
+        self.limit = limit
+        self.detail_logger = logging.getLogger(f"sampled_detail.{component}")
+        self.detail_logger.setLevel(logging.DEBUG if _detail_enabled else _DETAIL_OFF)
+
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+
+    def log(self, key: str, level: int, msg: str, *args) -> None:
+        """Log a message subject to per-key sampling.
+
+        Arguments are interpolated lazily, so suppressed messages cost only a
+        counter increment unless the detail logger is enabled.
+
+        Args:
+            key: Message key that occurrences are counted under
+            level: Logging level for sampled-in messages
+            msg: Message format string (%-style)
+            args: Arguments for the format string
+        """
+        with self._lock:
+            count = self._counts.get(key, 0) + 1
+            self._counts[key] = count
+
+        if self.limit <= 0 or count <= self.limit:
+            if self.logger.isEnabledFor(level):
+                self.logger.log(level, msg, *args)
+        elif self.detail_logger.isEnabledFor(logging.DEBUG):
+            self.detail_logger.debug(msg, *args)
+
+    def info(self, key: str, msg: str, *args) -> None:
+        """Log a sampled INFO message."""
+        self.log(key, logging.INFO, msg, *args)
+
+    def debug(self, key: str, msg: str, *args) -> None:
+        """Log a sampled DEBUG message."""
+        self.log(key, logging.DEBUG, msg, *args)
+
+    def get_counts(self) -> Dict[str, int]:
+        """Get the occurrence counts for the current cycle."""
+        with self._lock:
+            return dict(self._counts)
+
+    def emit_summary(self) -> None:
+        """Log one summary line per key that had suppressed messages, then reset."""
+        with self._lock:
+            counts = self._counts
+            self._counts = {}
+
+        if self.limit <= 0:
+            return
+
+        for key, count in sorted(counts.items()):
+            if count > self.limit:
+                self.logger.info(
+                    f"[{self.component}] {key}: {count} occurrences this cycle "
+                    f"({count - self.limit} not logged individually; set LOG_SAMPLED_DETAIL=true for full detail)"
+                )
+
+
+def configure_log_sampling(sample_limit: int = DEFAULT_SAMPLE_LIMIT,
+                           component_limits: Optional[Dict[str, int]] = None,
+                           detail: bool = False) -> None:
+    """Set the sampling limits used by sampled loggers.
+
+    Existing sampled loggers are updated in place.
+
+    Args:
+        sample_limit: Default messages per key logged in full each cycle (0 = no sampling)
+        component_limits: Per-component overrides of the default limit
+        detail: Log suppressed messages at DEBUG through the per-component detail loggers
+    """
+    global _sample_limit, _component_limits, _detail_enabled
+
+    with _registry_lock:
+        _sample_limit = sample_limit
+        _component_limits = dict(component_limits or {})
+        _detail_enabled = detail
+        for component, sampler in _samplers.items():
+            sampler.limit = _component_limits.get(component, _sample_limit)
+            sampler.detail_logger.setLevel(logging.DEBUG if detail else _DETAIL_OFF)
+
+
+def get_sampled_logger(logger: logging.Logger, component: str) -> SampledLogger:
+    """Get the shared sampled logger for a component.
+
+    Args:
+        logger: Underlying logger to write to
+        component: Component name (e.g. 'controller', 'parser')
+
+    Returns:
+        SampledLogger: Sampled logger configured with the component's limit
+    """
+    with _registry_lock:
+        sampler = _samplers.get(component)
+        if sampler is None:
+            sampler = SampledLogger(logger, component, _component_limits.get(component, _sample_limit))
+            _samplers[component] = sampler
+        return sampler
+
+
+def flush_log_summaries() -> None:
+    """Emit and reset the per-cycle summaries of all sampled loggers."""
+    with _registry_lock:
+        samplers = list(_samplers.values())
+
+    for sampler in samplers:
+        sampler.emit_summary()
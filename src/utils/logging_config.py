@@ -4,13 +4,15 @@ import logging
 import logging.handlers
 import os
 import sys
+import copy
+import queue
+import atexit
 from pathlib import Path
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.models import RetentionConfig
+from config.models import RetentionConfig, LoggingConfig
+from utils.log_sampler import configure_log_sampling
 
 
 class ContextFilter(logging.Filter):
@@ -47,6 +49,9 @@ class ColoredFormatter(logging.Formatter):
     
     def format(self, record):
         """Format the log record with colors."""
+        # Work on a copy: the same record is shared with the file handlers
+        record = copy.copy(record)
+        
         # Add color to the level name
         if record.levelname in self.COLORS:
             record.levelname = (
@@ -57,6 +62,37 @@ class ColoredFormatter(logging.Formatter):
         return super().format(record)
 
 
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler with a bounded queue and an overflow policy.
+    
+    Logging calls on hot paths only prepare and enqueue the record; a
+    QueueListener thread does the formatting and disk writes. When the queue is
+    full, records below ERROR are dropped (and counted) under the 'drop' policy,
+    while ERROR and above always wait for space so failures are never lost.
+    """
+    
+    def __init__(self, log_queue: queue.Queue, overflow_policy: str = "drop"):
+        """Initialize the handler.
+        
+        Args:
+            log_queue: Bounded queue shared with the QueueListener
+            overflow_policy: 'drop' to discard low-level records when full, 'block' to wait
+        """
+        super().__init__(log_queue)
+        self.overflow_policy = overflow_policy
+        self.dropped_count = 0
+    
+    def enqueue(self, record):
+        """Enqueue a record, applying the overflow policy when the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow_policy == "block" or record.levelno >= logging.ERROR:
+                self.queue.put(record)
+            else:
+                self.dropped_count += 1
+
+
 class LoggingManager:
     """Advanced logging manager with comprehensive configuration."""
     
@@ -82,12 +118,17 @@ class LoggingManager:
         # Performance logger for timing and metrics
         self.performance_logger = None
         
+        # Asynchronous pipeline state (populated by setup_logging)
+        self._queue_handlers: List[BoundedQueueHandler] = []
+        self._listeners: List[logging.handlers.QueueListener] = []
+        
     def setup_logging(self, 
                      console_level: str = "INFO",
                      file_level: str = "DEBUG",
                      enable_colors: bool = True,
                      max_file_size: int = 10 * 1024 * 1024,  # 10MB
-                     backup_count: int = 5) -> None:
+                     backup_count: int = 5,
+                     logging_config: Optional[LoggingConfig] = None) -> None:
         """Set up comprehensive logging configuration.
         
         Args:
@@ -96,12 +137,19 @@ class LoggingManager:
             enable_colors: Whether to enable colored console output
             max_file_size: Maximum size of log files before rotation
             backup_count: Number of backup files to keep
+            logging_config: Asynchronous pipeline settings (defaults to async, 10000-record queue)
         """
-        # Clear any existing handlers
+        logging_config = logging_config or LoggingConfig()
+        
+        # Stop any previous pipeline and clear existing handlers
+        self.shutdown()
         root_logger = logging.getLogger()
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
         
+        # Handlers that do the actual formatting and I/O
+        output_handlers = []
+        
         # Set root logger level to DEBUG to capture everything
         root_logger.setLevel(logging.DEBUG)
         
@@ -136,7 +184,7 @@ class LoggingManager:
         
         console_handler.setFormatter(console_formatter)
         console_handler.addFilter(ContextFilter())
-        root_logger.addHandler(console_handler)
+        output_handlers.append(console_handler)
         
         # Main application log file (rotating by time)
         try:
@@ -150,7 +198,7 @@ class LoggingManager:
             main_file_handler.setLevel(getattr(logging, file_level.upper()))
             main_file_handler.setFormatter(detailed_formatter)
             main_file_handler.addFilter(ContextFilter())
-            root_logger.addHandler(main_file_handler)
+            output_handlers.append(main_file_handler)
         except Exception as e:
             print(f"Warning: Could not set up main log file: {e}")
         
@@ -165,7 +213,7 @@ class LoggingManager:
             error_file_handler.setLevel(logging.ERROR)
             error_file_handler.setFormatter(detailed_formatter)
             error_file_handler.addFilter(ContextFilter())
-            root_logger.addHandler(error_file_handler)
+            output_handlers.append(error_file_handler)
         except Exception as e:
             print(f"Warning: Could not set up error log file: {e}")
         
@@ -180,7 +228,7 @@ class LoggingManager:
             debug_file_handler.setLevel(logging.DEBUG)
             debug_file_handler.setFormatter(detailed_formatter)
             debug_file_handler.addFilter(ContextFilter())
-            root_logger.addHandler(debug_file_handler)
+            output_handlers.append(debug_file_handler)
         except Exception as e:
             print(f"Warning: Could not set up debug log file: {e}")
         
@@ -198,12 +246,21 @@ class LoggingManager:
             # Create dedicated performance logger
             self.performance_logger = logging.getLogger('performance')
             self.performance_logger.setLevel(logging.INFO)
-            self.performance_logger.addHandler(performance_file_handler)
+            for handler in self.performance_logger.handlers[:]:
+                self.performance_logger.removeHandler(handler)
+            self._attach_handlers(self.performance_logger, [performance_file_handler], logging_config)
             self.performance_logger.propagate = False  # Don't propagate to root logger
             
         except Exception as e:
             print(f"Warning: Could not set up performance log file: {e}")
         
+        # Route the root logger through the (optionally asynchronous) pipeline
+        self._attach_handlers(root_logger, output_handlers, logging_config)
+        
+        # Per-file hot loops log through sampled loggers
+        configure_log_sampling(logging_config.sample_limit, logging_config.component_sample_limits,
+                               logging_config.sampled_detail)
+        
         # Reduce noise from third-party libraries
         self._configure_third_party_loggers()
         
@@ -211,6 +268,78 @@ class LoggingManager:
         logger = logging.getLogger(__name__)
         logger.info(f"Logging system initialized - Console: {console_level}, File: {file_level}")
         logger.info(f"Log directory: {self.log_dir}")
+        if logging_config.async_enabled:
+            logger.info(f"Asynchronous logging enabled (queue size: {logging_config.queue_size}, "
+                        f"overflow policy: {logging_config.overflow_policy})")
+    
+    def _attach_handlers(self, target_logger: logging.Logger, handlers: List[logging.Handler],
+                         logging_config: LoggingConfig) -> None:
+        """Attach output handlers to a logger, behind a queue when async logging is enabled.
+        
+        Args:
+            target_logger: Logger to attach to
+            handlers: Handlers that format and write records
+            logging_config: Asynchronous pipeline settings
+        """
+        if not logging_config.async_enabled:
+            for handler in handlers:
+                target_logger.addHandler(handler)
+            return
+        
+        log_queue = queue.Queue(maxsize=logging_config.queue_size)
+        queue_handler = BoundedQueueHandler(log_queue, logging_config.overflow_policy)
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        
+        target_logger.addHandler(queue_handler)
+        self._queue_handlers.append(queue_handler)
+        self._listeners.append(listener)
+        
+        if len(self._listeners) == 1:
+            atexit.register(self.shutdown)
+    
+    def get_queue_depth(self) -> int:
+        """Get the number of log records waiting to be written.
+        
+        Returns:
+            int: Total records pending across all logging queues
+        """
+        return sum(handler.queue.qsize() for handler in self._queue_handlers)
+    
+    def get_dropped_count(self) -> int:
+        """Get the number of log records dropped because a queue was full.
+        
+        Returns:
+            int: Total dropped records across all logging queues
+        """
+        return sum(handler.dropped_count for handler in self._queue_handlers)
+    
+    def shutdown(self) -> None:
+        """Flush queued log records and stop the background listener threads."""
+        if not self._listeners:
+            return
+        
+        dropped = self.get_dropped_count()
+        
+        for handler in self._queue_handlers:
+            for target_logger in (logging.getLogger(), logging.getLogger('performance')):
+                target_logger.removeHandler(handler)
+        
+        # QueueListener.stop() processes everything already queued before returning
+        for listener in self._listeners:
+            listener.stop()
+            for handler in listener.handlers:
+                try:
+                    handler.flush()
+                    handler.close()
+                except Exception:
+                    pass
+        
+        self._listeners = []
+        self._queue_handlers = []
+        
+        if dropped:
+            print(f"Warning: {dropped} log records were dropped because the logging queue was full")
         
     def _configure_third_party_loggers(self):
         """Configure third-party library loggers to reduce noise."""
@@ -315,7 +444,8 @@ def setup_logging(log_dir: str,
                  console_level: str = "INFO",
                  file_level: str = "DEBUG",
                  enable_colors: bool = True,
-                 retention_config: Optional[RetentionConfig] = None) -> LoggingManager:
+                 retention_config: Optional[RetentionConfig] = None,
+                 logging_config: Optional[LoggingConfig] = None) -> LoggingManager:
     """Convenience function to set up logging.
     
     Args:
@@ -324,6 +454,7 @@ def setup_logging(log_dir: str,
         file_level: Logging level for file output
         enable_colors: Whether to enable colored console output
         retention_config: Configuration for log file retention
+        logging_config: Asynchronous logging pipeline settings
         
     Returns:
         Configured LoggingManager instance
@@ -332,6 +463,7 @@ def setup_logging(log_dir: str,
     manager.setup_logging(
         console_level=console_level,
         file_level=file_level,
-        enable_colors=enable_colors
+        enable_colors=enable_colors,
+        logging_config=logging_config
     )
     return manager
\ No newline at end of file
@@ -0,0 +1,399 @@
+"""In-process metrics collectors and an opt-in Prometheus text endpoint."""
+
+import bisect
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+# Default latency buckets in seconds (file transfers and parsing through full cycles)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class _ThreadCells:
+    """Per-thread accumulator arrays summed on read.
+
+    Each thread updates only its own cell, so the hot path is a thread-local
+    lookup and a list increment with no lock. The lock is taken only when a
+    thread touches the metric for the first time and when a scrape sums the
+    cells. Both fold the cells of threads that have exited into a base array,
+    so short-lived worker threads (one per scheduled run, one pool per action
+    batch) do not accumulate even if the metrics are never scraped.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._cells: List[Tuple[threading.Thread, List[float]]] = []
+        self._retired = [0.0] * size
+
+    def cell(self) -> List[float]:
+        """Get the calling thread's cell, creating it on first use."""
+        cell = getattr(self._local, 'cell', None)
+        if cell is None:
+            cell = [0.0] * self._size
+            with self._lock:
+                self._retire_exited()
+                self._cells.append((threading.current_thread(), cell))
+            self._local.cell = cell
+        return cell
+
+    def _retire_exited(self) -> None:
+        """Fold the cells of exited threads into the base array (caller holds the lock)."""
+        live = []
+        for thread, cell in self._cells:
+            if thread.is_alive():
+                live.append((thread, cell))
+            else:
+                for i, value in enumerate(cell):
+                    self._retired[i] += value
+        self._cells = live
+
+    def snapshot(self) -> List[float]:
+        """Sum all cells into a single array."""
+        with self._lock:
+            self._retire_exited()
+            totals = list(self._retired)
+            for _, cell in self._cells:
+                for i, value in enumerate(cell):
+                    totals[i] += value
+        return totals
+
+
+def _escape_label_value(value) -> str:
+    """Escape a label value for the text exposition format."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labelnames: Sequence[str], labelvalues: Sequence[str],
+                   extra: Optional[Tuple[str, str]] = None) -> str:
+    """Format a Prometheus label set ('' when there are no labels)."""
+    pairs = list(zip(labelnames, labelvalues))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value, dropping the fraction for whole numbers."""
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    """Base class for metrics with optional labels."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], "_Metric"] = {}
+        self._children_lock = threading.Lock()
+
+    def labels(self, **labelvalues) -> "_Metric":
+        """Get the child metric for a set of label values.
+
+        Returns:
+            The labelled child, which supports the same update methods
+        """
+        key = tuple(str(labelvalues[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._children_lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    def _new_child(self) -> "_Metric":
+        raise NotImplementedError
+
+    def _samples(self) -> List[Tuple[str, str, float]]:
+        """Get (name suffix, extra label pair or None, value) samples for this unlabelled metric."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """Render the metric in Prometheus text exposition format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}"
+        ]
+
+        if self.labelnames:
+            with self._children_lock:
+                children = sorted(self._children.items())
+            for labelvalues, child in children:
+                for suffix, extra, value in child._samples():
+                    labels = _format_labels(self.labelnames, labelvalues, extra)
+                    lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        else:
+            for suffix, extra, value in self._samples():
+                labels = _format_labels((), (), extra)
+                lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._cells = _ThreadCells(1)
+
+    def _new_child(self) -> "Counter":
+        return Counter(self.name, self.documentation)
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment the counter."""
+        self._cells.cell()[0] += amount
+
+    def get(self) -> float:
+        """Get the current total."""
+        return self._cells.snapshot()[0]
+
+    def _samples(self):
+        return [("", None, self.get())]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or be computed at scrape time."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+
+    def _new_child(self) -> "Gauge":
+        return Gauge(self.name, self.documentation)
+
+    def set(self, value: float) -> None:
+        """Set the gauge to a value."""
+        self._value = float(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the gauge value by calling a function at scrape time."""
+        self._function = function
+
+    def get(self) -> float:
+        """Get the current value."""
+        if self._function is not None:
+            try:
+                return float(self._function())
+            except Exception as e:
+                logger.debug(f"Gauge {self.name} callback failed: {e}")
+                return 0.0
+        return self._value
+
+    def _samples(self):
+        return [("", None, self.get())]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Cell layout: one count per bucket, +Inf count, sum, count
+        self._cells = _ThreadCells(len(self.buckets) + 3)
+
+    def _new_child(self) -> "Histogram":
+        return Histogram(self.name, self.documentation, buckets=self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        cell = self._cells.cell()
+        cell[bisect.bisect_left(self.buckets, value)] += 1
+        cell[-2] += value
+        cell[-1] += 1
+
+    def _samples(self):
+        totals = self._cells.snapshot()
+        samples = []
+        cumulative = 0.0
+        for i, bound in enumerate(self.buckets):
+            cumulative += totals[i]
+            samples.append(("_bucket", ("le", _format_value(bound)), cumulative))
+        cumulative += totals[len(self.buckets)]
+        samples.append(("_bucket", ("le", "+Inf"), cumulative))
+        samples.append(("_sum", None, totals[-2]))
+        samples.append(("_count", None, totals[-1]))
+        return samples
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together for a scrape."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Register a metric, returning the existing one if the name is taken."""
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create and register a counter."""
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Create and register a gauge."""
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Create and register a histogram."""
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Global registry and the application's metrics
+REGISTRY = MetricsRegistry()
+
+CYCLES = REGISTRY.counter(
+    "webscribe_cycles_total", "Processing cycles run, by outcome", ["outcome"])
+LAST_SUCCESSFUL_CYCLE = REGISTRY.gauge(
+    "webscribe_last_successful_cycle_timestamp_seconds", "Unix time of the last successful processing cycle")
+FILES_SCANNED = REGISTRY.counter(
+    "webscribe_files_scanned_total", "Document files found while scanning type folders")
+FILES_TRANSFERRED = REGISTRY.counter(
+    "webscribe_files_transferred_total", "Files transferred, by protocol, direction and outcome",
+    ["protocol", "direction", "outcome"])
+BYTES_TRANSFERRED = REGISTRY.counter(
+    "webscribe_bytes_transferred_total", "Bytes transferred, by protocol and direction",
+    ["protocol", "direction"])
+TRANSFER_RETRIES = REGISTRY.counter(
+    "webscribe_transfer_retries_total", "Retried transfer and connection attempts",
+    ["protocol", "operation"])
+DOCUMENTS_PARSED = REGISTRY.counter(
+    "webscribe_documents_parsed_total", "Documents parsed, by outcome", ["outcome"])
+EXTRACTOR_RESULTS = REGISTRY.counter(
+    "webscribe_extractor_results_total",
+    "Text extraction attempts, by file extension, method and outcome "
+    "(success, empty, error; with scoring also usable, low_quality, skipped)",
+    ["extension", "method", "outcome"])
+FIELD_REGION_RESULTS = REGISTRY.counter(
+    "webscribe_field_region_results_total",
+    "Region-mode field extractions on long documents, by field and outcome "
+    "(window, fallback, missing, no_window)",
+    ["field", "outcome"])
+STAGE_DURATION = REGISTRY.histogram(
+    "webscribe_stage_duration_seconds", "Duration of traced processing stages", ["stage"])
+ERRORS = REGISTRY.counter(
+    "webscribe_errors_total", "Errors handled by the error handler, by category and severity",
+    ["category", "severity"])
+ERROR_RETRIES = REGISTRY.counter(
+    "webscribe_error_retries_total", "Errors reported with a retry still to come, by component",
+    ["component"])
+SCHEDULER_DECISIONS = REGISTRY.counter(
+    "webscribe_scheduler_decisions_total",
+    "Scheduler decisions per job (run, skipped, coalesced, coalesced_run, backoff, reset)",
+    ["job", "decision"])
+SCHEDULER_INTERVAL = REGISTRY.gauge(
+    "webscribe_scheduler_interval_seconds", "Current polling interval per interval-scheduled job", ["job"])
+QUEUE_DEPTH = REGISTRY.gauge(
+    "webscribe_queue_depth", "Items waiting in internal background queues", ["queue"])
+
+
+def observe_span(span) -> None:
+    """Tracer listener that records finished span durations per stage."""
+    if span.duration is not None:
+        STAGE_DURATION.labels(stage=span.name).observe(span.duration)
+
+
+def _create_http_server(host: str, port: int, registry: MetricsRegistry):
+    """Create the threaded HTTP server serving a registry on /metrics.
+
+    http.server is imported here because the endpoint is opt-in and the
+    module is comparatively slow to import.
+    """
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+
+    class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+        daemon_threads = True
+
+    class _MetricsRequestHandler(BaseHTTPRequestHandler):
+        """Serves the registry on /metrics."""
+
+        def do_GET(self):
+            if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+                self.send_error(404)
+                return
+
+            body = registry.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug("Metrics request: " + format % args)
+
+    return _ThreadingHTTPServer((host, port), _MetricsRequestHandler)
+
+
+class MetricsServer:
+    """Background HTTP server exposing metrics for Prometheus scraping."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 9108, registry: MetricsRegistry = REGISTRY):
+        """Initialize the metrics server.
+
+        Args:
+            host: Interface to bind (defaults to localhost only)
+            port: TCP port to listen on
+            registry: Registry to expose
+        """
+        self.host = host
+        self.port = port
+        self.registry = registry
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start serving on a daemon thread."""
+        self._server = _create_http_server(self.host, self.port, self.registry)
+        self.port = self._server.server_address[1]
+
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+        logger.info(f"Metrics endpoint listening on http://{self.host}:{self.port}/metrics")
+
+    def stop(self) -> None:
+        """Stop the server and wait for its thread to exit."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=5)
+        self._server = None
+        self._thread = None
@@ -4,12 +4,10 @@ import os
 import logging
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Callable, Dict, Any
+from contextlib import contextmanager
+from typing import List, Callable, Dict, Any, Optional
 from datetime import datetime
 
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from config.models import ActionResult
 from utils.error_handler import handle_error, ErrorCategory, ErrorSeverity
 
@@ -20,14 +18,30 @@ logger = logging.getLogger(__name__)
 class ParallelActionExecutor:
     """Executes multiple actions in parallel using thread pool."""
     
-    def __init__(self, max_workers: int = 3):
+    def __init__(self, max_workers: int = 3, executor: Optional[ThreadPoolExecutor] = None):
         """Initialize the parallel action executor.
         
         Args:
             max_workers: Maximum number of parallel workers (default: 3 for CSV upload, log, email)
+            executor: Optional shared thread pool to run actions on instead of a
+                      pool created per call (used when several jobs share workers)
         """
         self.max_workers = max_workers
-        logger.info(f"ParallelActionExecutor initialized with {max_workers} workers")
+        self.executor = executor
+        if executor is not None:
+            logger.info("ParallelActionExecutor initialized with a shared worker pool")
+        else:
+            logger.info(f"ParallelActionExecutor initialized with {max_workers} workers")
+    
+    @contextmanager
+    def _worker_pool(self):
+        """Yield the shared pool, or a pool that lives for one batch of actions."""
+        if self.executor is not None:
+            yield self.executor
+            return
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield executor
     
     def execute_parallel(self, actions: List[Dict[str, Any]]) -> List[ActionResult]:
         """Execute multiple actions in parallel.
@@ -46,7 +60,7 @@ class ParallelActionExecutor:
         logger.info(f"Starting parallel execution of {len(actions)} actions")
         results = []
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with self._worker_pool() as executor:
             # Submit all actions
             future_to_action = {}
             for action in actions:
@@ -6,9 +6,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from config.models import ProcessingStats, DownloadResult
 from utils.error_handler import handle_error, ErrorCategory, ErrorSeverity
 
@@ -130,11 +127,11 @@ class ProcessingLogCreator:
         lines.append("FILE DOWNLOAD RESULTS")
         lines.append("-" * 80)
         
-        successful_downloads = sum(1 for d in stats.files_downloaded if d.success)
-        failed_downloads = len(stats.files_downloaded) - successful_downloads
-        total_size = sum(d.size for d in stats.files_downloaded if d.success)
+        successful_downloads = stats.downloads_succeeded
+        failed_downloads = stats.downloads_failed
+        total_size = stats.bytes_downloaded
         
-        lines.append(f"Total Downloads:    {len(stats.files_downloaded)}")
+        lines.append(f"Total Downloads:    {stats.downloads_total}")
         lines.append(f"Successful:         {successful_downloads}")
         lines.append(f"Failed:             {failed_downloads}")
         lines.append(f"Total Size:         {total_size:,} bytes ({total_size/(1024*1024):.2f} MB)")
@@ -154,8 +151,12 @@ class ProcessingLogCreator:
                 downloads = downloads_by_type[type_folder]
                 lines.append(f"\n  {type_folder}:")
                 for download in downloads:
-                    size_mb = download.size / (1024 * 1024)
-                    lines.append(f"    • {download.filename:40} ({size_mb:.2f} MB)")
+                    if download.size:
+                        size_mb = download.size / (1024 * 1024)
+                        lines.append(f"    • {download.filename:40} ({size_mb:.2f} MB)")
+                    else:
+                        # Files merged from other nodes' shards carry no size
+                        lines.append(f"    • {download.filename}")
         
         # Failed downloads
         if failed_downloads > 0:
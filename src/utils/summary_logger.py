@@ -6,10 +6,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from config.models import ProcessingResult, StorageConfig
 
 
@@ -0,0 +1,399 @@
+"""Lightweight span-based tracing for processing cycle stages."""
+
+import json
+import logging
+import math
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional
+
+from config.models import TracingConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+class Span:
+    """A timed unit of work within a trace.
+
+    Spans nest: a span opened while another is active on the same thread
+    becomes its child. Attributes carry stage-specific data such as byte
+    counts, file counts or the extraction method used.
+    """
+
+    def __init__(self, name: str, trace_id: str, parent: Optional["Span"] = None,
+                 attributes: Optional[Dict[str, Any]] = None):
+        """Initialize and start the span.
+
+        Args:
+            name: Stage name (e.g. 'cycle', 'download', 'extract')
+            trace_id: Identifier shared by all spans of one trace
+            parent: Enclosing span, or None for a root span
+            attributes: Initial attributes
+        """
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent = parent
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.outcome = "ok"
+        self.error: Optional[str] = None
+        self.children: List["Span"] = []
+
+        self.start_time = datetime.now()
+        self._start = time.perf_counter()
+        self.duration: Optional[float] = None
+
+    def set(self, **attributes) -> None:
+        """Set attributes on the span."""
+        self.attributes.update(attributes)
+
+    def add(self, key: str, amount: float = 1) -> None:
+        """Increment a numeric attribute (e.g. bytes or file counts)."""
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def fail(self, error: Any) -> None:
+        """Mark the span as failed."""
+        self.outcome = "error"
+        self.error = str(error)
+
+    def finish(self) -> None:
+        """Stop the span's clock."""
+        if self.duration is None:
+            self.duration = time.perf_counter() - self._start
+
+    def walk(self) -> Iterator["Span"]:
+        """Iterate over this span and all of its descendants, depth first."""
+        yield self
+        for child in list(self.children):
+            yield from child.walk()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the span (without children) for export."""
+        data = {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent.span_id if self.parent else None,
+            "name": self.name,
+            "start": self.start_time.isoformat(),
+            "duration_ms": round((self.duration or 0.0) * 1000, 3),
+            "outcome": self.outcome,
+            "attributes": self.attributes
+        }
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+class _NoopSpan:
+    """Stand-in span used when tracing is disabled."""
+
+    name = None
+    attributes: Dict[str, Any] = {}
+
+    def set(self, **attributes) -> None:
+        pass
+
+    def add(self, key: str, amount: float = 1) -> None:
+        pass
+
+    def fail(self, error: Any) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list.
+
+    Args:
+        sorted_values: Values in ascending order
+        pct: Percentile between 0 and 100
+
+    Returns:
+        float: Percentile value (0.0 for an empty list)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = min(max(1, math.ceil(pct / 100.0 * len(sorted_values))), len(sorted_values))
+    return sorted_values[rank - 1]
+
+
+def summarize_durations(durations: Dict[str, Iterable[float]]) -> Dict[str, Dict[str, float]]:
+    """Compute count and p50/p95/p99 (in milliseconds) per stage.
+
+    Args:
+        durations: Stage name -> durations in seconds
+
+    Returns:
+        Dict: Stage name -> {'count', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'}
+    """
+    summary = {}
+    for stage, values in durations.items():
+        ordered = sorted(values)
+        if not ordered:
+            continue
+        summary[stage] = {
+            "count": len(ordered),
+            "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+            "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+            "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+            "max_ms": round(ordered[-1] * 1000, 3)
+        }
+    return summary
+
+
+def aggregate_trace_files(paths: Iterable[Path]) -> Dict[str, Dict[str, float]]:
+    """Aggregate exported JSONL trace files into per-stage percentiles.
+
+    Args:
+        paths: Trace files written by the Tracer
+
+    Returns:
+        Dict: Stage name -> percentile summary (see summarize_durations)
+    """
+    durations: Dict[str, List[float]] = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    span = json.loads(line)
+                    durations.setdefault(span["name"], []).append(span["duration_ms"] / 1000.0)
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+    return summarize_durations(durations)
+
+
+class Tracer:
+    """Creates nested spans and exports completed traces to daily JSONL files.
+
+    The active span is tracked per thread, so spans opened inside a stage nest
+    under it automatically. Work handed to another thread passes its parent
+    explicitly. When a root span finishes, every span in its tree is written
+    as one JSON line and its duration is added to a bounded in-memory sample
+    per stage for percentile reporting.
+    """
+
+    def __init__(self, trace_dir: Optional[str] = None, enabled: bool = True,
+                 max_samples_per_stage: int = 2048):
+        """Initialize the tracer.
+
+        Args:
+            trace_dir: Directory for trace_YYYYMMDD.jsonl files (None disables export)
+            enabled: Whether spans are recorded at all
+            max_samples_per_stage: Recent durations kept per stage for percentiles
+        """
+        self.trace_dir = Path(trace_dir) if trace_dir else None
+        self.enabled = enabled
+        self.max_samples_per_stage = max_samples_per_stage
+
+        if self.trace_dir and self.enabled:
+            self.trace_dir.mkdir(parents=True, exist_ok=True)
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[float]] = {}
+        self._listeners: List[Any] = []
+
+    def _stack(self) -> List[Span]:
+        """Get the active span stack for the current thread."""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    def current_span(self) -> Optional[Span]:
+        """Get the innermost active span on the current thread."""
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def add_listener(self, listener) -> None:
+        """Register a callable invoked with every finished span."""
+        self._listeners.append(listener)
+
+    def start_span(self, name: str, parent: Optional[Span] = None, **attributes):
+        """Start a span and make it the active span on this thread.
+
+        Prefer the span() context manager; use this pair when a stage does not
+        map onto a single block.
+
+        Args:
+            name: Stage name
+            parent: Explicit parent (defaults to the thread's active span)
+            attributes: Initial attributes
+
+        Returns:
+            Span: The started span
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+
+        if parent is None:
+            parent = self.current_span()
+        trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        span = Span(name, trace_id, parent, attributes)
+        if parent is not None:
+            parent.children.append(span)
+
+        self._stack().append(span)
+        return span
+
+    def end_span(self, span, error: Optional[BaseException] = None) -> None:
+        """Finish a span started with start_span().
+
+        Args:
+            span: Span to finish
+            error: Exception that ended the span, if any
+        """
+        if span is _NOOP_SPAN:
+            return
+
+        if error is not None:
+            span.fail(error)
+        span.finish()
+
+        # Drop the span and anything left open inside it from the active stack
+        stack = self._stack()
+        if span in stack:
+            index = stack.index(span)
+            for abandoned in stack[index + 1:]:
+                abandoned.fail("span was not closed")
+                abandoned.finish()
+            del stack[index:]
+
+        self._record(span)
+
+        for listener in self._listeners:
+            try:
+                listener(span)
+            except Exception as e:
+                logger.debug(f"Span listener failed: {e}")
+
+        if span.parent is None:
+            self._export(span)
+
+    @contextmanager
+    def span(self, name: str, parent: Optional[Span] = None, **attributes):
+        """Context manager that times a block as a span.
+
+        Exceptions mark the span as failed and are re-raised.
+
+        Args:
+            name: Stage name
+            parent: Explicit parent (defaults to the thread's active span)
+            attributes: Initial attributes
+
+        Yields:
+            Span: The active span
+        """
+        span = self.start_span(name, parent, **attributes)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, e)
+            raise
+        else:
+            self.end_span(span)
+
+    def _record(self, span: Span) -> None:
+        """Add a finished span's duration to its stage sample."""
+        with self._lock:
+            samples = self._samples.get(span.name)
+            if samples is None:
+                samples = deque(maxlen=self.max_samples_per_stage)
+                self._samples[span.name] = samples
+            samples.append(span.duration)
+
+    def _export(self, root: Span) -> None:
+        """Append every span of a finished trace to the day's trace file."""
+        if not self.trace_dir:
+            return
+
+        lines = [json.dumps(span.to_dict(), default=str) + '\n' for span in root.walk()]
+        trace_file = self.trace_dir / f"trace_{root.start_time.strftime('%Y%m%d')}.jsonl"
+
+        try:
+            with self._lock:
+                with open(trace_file, 'a', encoding='utf-8') as f:
+                    f.writelines(lines)
+        except OSError as e:
+            logger.warning(f"Failed to write trace file {trace_file}: {e}")
+
+    def get_stage_percentiles(self) -> Dict[str, Dict[str, float]]:
+        """Get p50/p95/p99 durations per stage from recent spans.
+
+        Returns:
+            Dict: Stage name -> percentile summary in milliseconds
+        """
+        with self._lock:
+            samples = {stage: list(values) for stage, values in self._samples.items()}
+        return summarize_durations(samples)
+
+    def format_stage_report(self) -> str:
+        """Format recent per-stage percentiles as a text table."""
+        summary = self.get_stage_percentiles()
+        if not summary:
+            return "No spans recorded"
+
+        width = max(12, max(len(stage) for stage in summary))
+        lines = [f"{'Stage':<{width}} {'Count':>7} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}"]
+        for stage, stats in sorted(summary.items(), key=lambda item: -item[1]["p95_ms"]):
+            lines.append(f"{stage:<{width}} {stats['count']:>7} {stats['p50_ms']:>10.1f} "
+                         f"{stats['p95_ms']:>10.1f} {stats['p99_ms']:>10.1f}")
+        return "\n".join(lines)
+
+    def cleanup_old_traces(self, retention_days: int) -> int:
+        """Delete trace files older than the retention period.
+
+        Args:
+            retention_days: Days of traces to keep (0 disables cleanup)
+
+        Returns:
+            int: Number of files deleted
+        """
+        if not self.trace_dir or retention_days <= 0:
+            return 0
+
+        cutoff_time = time.time() - retention_days * 24 * 3600
+        deleted = 0
+        for trace_file in self.trace_dir.glob("trace_*.jsonl"):
+            try:
+                if trace_file.stat().st_mtime < cutoff_time:
+                    trace_file.unlink()
+                    deleted += 1
+            except OSError as e:
+                logger.warning(f"Failed to clean up {trace_file}: {e}")
+        return deleted
+
+
+# Global tracer instance
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer(trace_dir: Optional[str] = None, tracing_config: Optional[TracingConfig] = None) -> Tracer:
+    """Get the global tracer instance.
+
+    Args:
+        trace_dir: Directory for trace files (only used on first call)
+        tracing_config: Tracing settings (only used on first call)
+
+    Returns:
+        Tracer: Global tracer instance
+    """
+    global _tracer
+
+    if _tracer is None:
+        tracing_config = tracing_config or TracingConfig()
+        _tracer = Tracer(trace_dir, tracing_config.enabled, tracing_config.max_samples_per_stage)
+
+    return _tracer
@@ -2,12 +2,10 @@
 
 import os
 import logging
-from typing import List, Dict, Tuple
-
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from typing import List, Dict, Optional, Tuple
 
 from utils.error_handler import handle_error, ErrorCategory, ErrorSeverity
+from utils.tracing import get_tracer
 
 
 logger = logging.getLogger(__name__)
@@ -25,23 +23,28 @@ class TypeFolderScanner:
         self.type_folders = type_folders
         logger.info(f"TypeFolderScanner initialized with {len(type_folders)} folders: {', '.join(type_folders)}")
     
-    def scan_folders(self, ftps_client, base_path: str = "/") -> Dict[str, List]:
+    def scan_folders(self, ftps_client, base_path: str = "/",
+                     type_folders: Optional[List[str]] = None) -> Dict[str, List]:
         """Scan all configured type folders and return files found in each.
         
         Args:
             ftps_client: Connected FTPS client (FTP_TLS instance)
             base_path: Base path where type folders are located
+            type_folders: Subset of type folders to scan (defaults to all configured folders)
             
         Returns:
             Dict[str, List]: Dictionary mapping folder name to list of FileInfo objects
         """
         scan_results = {}
         total_files = 0
+        tracer = get_tracer()
         
-        logger.info(f"Starting scan of {len(self.type_folders)} type folders in {base_path}")
+        type_folders = self.type_folders if type_folders is None else type_folders
+        logger.info(f"Starting scan of {len(type_folders)} type folders in {base_path}")
         
-        for type_folder in self.type_folders:
+        for type_folder in type_folders:
             folder_path = f"{base_path}/{type_folder}".replace('//', '/')
+            folder_span = tracer.start_span("scan_folder", folder=type_folder)
             
             try:
                 # Import here to avoid circular dependency
@@ -54,9 +57,11 @@ class TypeFolderScanner:
                 scan_results[type_folder] = files
                 total_files += len(files)
                 
+                folder_span.set(files=len(files))
                 logger.info(f"✓ Scanned {type_folder}: found {len(files)} files")
                 
             except Exception as e:
+                folder_span.fail(e)
                 logger.warning(f"✗ Failed to scan {type_folder}: {e}")
                 scan_results[type_folder] = []
                 
@@ -72,8 +77,11 @@ class TypeFolderScanner:
                         "base_path": base_path
                     }
                 )
+            
+            finally:
+                tracer.end_span(folder_span)
         
-        logger.info(f"Scan complete: {len(self.type_folders)} folders scanned, {total_files} total files found")
+        logger.info(f"Scan complete: {len(type_folders)} folders scanned, {total_files} total files found")
         return scan_results
     
     def get_all_files(self, scan_results: Dict[str, List]) -> List[Tuple[str, any]]: